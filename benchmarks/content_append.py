@@ -0,0 +1,68 @@
+"""
+Measure streaming a long listing into the content region in chunks.
+
+For each content mode, shows a listing as it would arrive from a paginated API,
+one chunk at a time, either by appending each chunk or by setting the whole
+listing received so far. Reports the total milliseconds for each approach.
+
+Usage:
+    python benchmarks/content_append.py [--lines N] [--chunk N]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import signalslot
+
+from soundcurses.curses import headless, screen, windows
+
+import content_paging
+
+def measure(content_mode, lines_list, chunk_lines, append):
+    """
+    Stream the listing into a new content region, rendering after each chunk.
+
+    Returns:
+        float: Total milliseconds.
+
+    """
+    curses = headless.HeadlessCurses(lines=60, cols=160)
+    curses_screen = screen.CursesScreen(
+        curses, screen.RenderQueue(), signalslot.Signal())
+    region = content_paging.create_region(
+        content_mode, curses, curses_screen,
+        windows.CursesStringFactory(curses))
+
+    time_start = time.perf_counter()
+    for start in range(0, len(lines_list), chunk_lines):
+        if append:
+            region.append_lines(lines_list[start:start + chunk_lines])
+        else:
+            region.content_lines = lines_list[0:start + chunk_lines]
+        curses_screen.render()
+    elapsed = time.perf_counter() - time_start
+    curses.close()
+
+    return elapsed * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--lines', type=int, default=10000)
+    parser.add_argument('--chunk', type=int, default=200)
+    args = parser.parse_args()
+
+    lines_list = ['{:05}. track {}'.format(i, i) for i in range(args.lines)]
+    print('{:<8} {:>12} {:>12}'.format('mode', 'append ms', 'set ms'))
+    for content_mode in content_paging.CONTENT_MODES:
+        print('{:<8} {:>12.1f} {:>12.1f}'.format(
+            content_mode,
+            measure(content_mode, lines_list, args.chunk, True),
+            measure(content_mode, lines_list, args.chunk, False)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Measure content region page lookups as the target line moves down the content.
+
+Composes a virtualized content region on the headless curses backend and sets a
+long listing. For the last lines of pages further and further down, times the
+lookup of the first page containing the line in the region's page index, which
+should stay flat, and the same lookup by scanning the pages one by one, as was
+done before the page index. Only page numbers below the page count are
+measured.
+
+Usage:
+    python benchmarks/content_navigation.py [--lines N]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import signalslot
+
+from soundcurses.curses import headless, regions, screen, windows
+
+def time_per_call(operation, repeat=50):
+    """
+    Time an operation.
+
+    Returns:
+        float: The mean time, in microseconds.
+
+    """
+    time_start = time.perf_counter()
+    for i in range(repeat):
+        operation()
+
+    return (time.perf_counter() - time_start) * 1e6 / repeat
+
+def scan_for_page(pages, line_number):
+    """
+    Find the first page that contains a line by scanning.
+
+    """
+    for page_number in range(len(pages)):
+        if line_number in pages[page_number]:
+            return page_number
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--lines', type=int, default=300000)
+    args = parser.parse_args()
+
+    curses = headless.HeadlessCurses(lines=60, cols=160)
+    curses_screen = screen.CursesScreen(
+        curses, screen.RenderQueue(), signalslot.Signal())
+    window_factory = windows.CursesWindowFactory(
+        curses, curses_screen, signalslot)
+    window = window_factory.create_window(53, 160, 7, 0)
+    curses_screen.add_window(window)
+    region = regions.ContentRegionVirtual(
+        window, curses, windows.CursesStringFactory(curses))
+    region.content_lines = [
+        '{:06}. track {}'.format(i, i) for i in range(args.lines)]
+    page_index = region._page_index
+    page_numbers = [
+        10 ** exponent
+        for exponent in range(len(str(region.page_count)))
+        if 10 ** exponent < region.page_count]
+
+    print('{} lines, {} pages'.format(args.lines, region.page_count))
+    print('{:>8} {:>8} {:>12} {:>12}'.format(
+        'line', 'page', 'index us', 'scan us'))
+    for page_number in page_numbers:
+        line_number = region._pages[page_number][-1]
+        found_page_number = page_index.first_page_with_line(line_number)
+        assert found_page_number == scan_for_page(region._pages, line_number)
+        def look_up():
+            page_index.first_page_with_line(line_number)
+        def scan():
+            scan_for_page(region._pages, line_number)
+        print('{:>8} {:>8} {:>12.2f} {:>12.1f}'.format(
+            line_number, found_page_number, time_per_call(look_up), time_per_call(scan)))
+    curses.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Measure content region page changes for long listings.
+
+Composes a content region on the headless curses backend for each content
+mode and listing size, sets the listing, and pages through it to the end and
+back, rendering after each page change. Reports the time to set the content,
+the memory the region retains for it, and, per page change, the milliseconds,
+the lines written to windows, and the cells copied to the virtual screen.
+
+Usage:
+    python benchmarks/content_paging.py [--lines N [N ...]] [--screen-lines N]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import signalslot
+
+from soundcurses.curses import headless, regions, screen, windows
+
+CONTENT_MODES = ('paged', 'pad', 'virtual')
+
+class CountingStringFactory(windows.CursesStringFactory):
+    """
+    A string factory whose strings count the lines they write.
+
+    """
+
+    def __init__(self, curses):
+        super().__init__(curses)
+        self.write_count = 0
+
+    def create_string(self, window, string, y, x, attr=None):
+        curses_string = super().create_string(window, string, y, x, attr=attr)
+        write = curses_string.write
+        def counting_write():
+            self.write_count += len(curses_string.lines)
+            write()
+        curses_string.write = counting_write
+
+        return curses_string
+
+
+def create_region(content_mode, curses, curses_screen, string_factory):
+    """
+    Create a content region covering the screen below a few chrome lines.
+
+    Returns:
+        ContentRegion
+
+    """
+    window_factory = windows.CursesWindowFactory(
+        curses, curses_screen, signalslot)
+    window = window_factory.create_window(
+        curses.LINES - 7, curses.COLS, 7, 0,
+        render_layer=curses_screen.RENDER_LAYER_REGIONS)
+    curses_screen.add_window(window)
+    if content_mode == 'pad':
+        return regions.ContentRegionPad(
+            window, curses, string_factory, curses_screen, window_factory)
+    elif content_mode == 'virtual':
+        return regions.ContentRegionVirtual(window, curses, string_factory)
+
+    return regions.ContentRegion(window, curses, string_factory)
+
+def measure_memory(content_mode, lines_list, screen_lines):
+    """
+    Measure the memory allocated, and still held, by setting the content.
+
+    Returns:
+        float: Kibibytes.
+
+    """
+    curses = headless.HeadlessCurses(lines=screen_lines, cols=160)
+    curses_screen = screen.CursesScreen(
+        curses, screen.RenderQueue(), signalslot.Signal())
+    region = create_region(
+        content_mode, curses, curses_screen, CountingStringFactory(curses))
+    tracemalloc.start()
+    region.content_lines = lines_list
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    curses.close()
+
+    return retained / 1024
+
+def measure(content_mode, lines_list, screen_lines):
+    """
+    Set the content and page to the end and back.
+
+    Returns:
+        tuple: Set-content milliseconds, then milliseconds, lines written, and
+            cells copied per page change.
+
+    """
+    curses = headless.HeadlessCurses(lines=screen_lines, cols=160)
+    curses_screen = screen.CursesScreen(
+        curses, screen.RenderQueue(), signalslot.Signal())
+    string_factory = CountingStringFactory(curses)
+    region = create_region(content_mode, curses, curses_screen, string_factory)
+
+    time_start = time.perf_counter()
+    region.content_lines = lines_list
+    curses_screen.render()
+    set_content_ms = (time.perf_counter() - time_start) * 1000
+
+    write_count = string_factory.write_count
+    cells_copied = curses.cells_copied
+    time_start = time.perf_counter()
+    flips = 2 * (region.page_count - 1)
+    for flip in range(flips):
+        if flip < region.page_count - 1:
+            region.page_next()
+        else:
+            region.page_previous()
+        curses_screen.render()
+    elapsed = time.perf_counter() - time_start
+    curses.close()
+
+    flips = max(flips, 1)
+    return (set_content_ms,
+        elapsed * 1000 / flips,
+        (string_factory.write_count - write_count) / flips,
+        (curses.cells_copied - cells_copied) / flips)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument(
+        '--lines', type=int, nargs='+', default=[1000, 10000, 30000])
+    parser.add_argument('--screen-lines', type=int, default=60)
+    args = parser.parse_args()
+
+    print('{:<8} {:>8} {:>10} {:>10} {:>10} {:>11} {:>11}'.format(
+        'mode', 'lines', 'set ms', 'set KiB', 'ms/page', 'lines/page',
+        'cells/page'))
+    for content_mode in CONTENT_MODES:
+        for line_count in args.lines:
+            lines_list = [
+                '{:05}. track {}  0:03:{:02}'.format(i, i, i % 60)
+                for i in range(line_count)]
+            set_content_ms, *page_costs = measure(
+                content_mode, lines_list, args.screen_lines)
+            print('{:<8} {:>8} {:>10.1f} {:>10.0f} {:>10.3f} {:>11.0f} '
+                '{:>11.0f}'.format(
+                    content_mode, line_count, set_content_ms,
+                    measure_memory(content_mode, lines_list, args.screen_lines),
+                    *page_costs))
+
+if __name__ == '__main__':
+    main()
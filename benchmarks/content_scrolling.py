@@ -0,0 +1,179 @@
+"""
+Measure the terminal output of moving the selection through a long listing.
+
+For each content mode, runs a content region on the real curses library in a
+pseudo-terminal, sets a long listing, selects the bottom line of the display,
+and moves the selection down one line at a time, updating the screen after each
+step as if an arrow key were held. A step crosses the edge of the display if it
+changes the lines displayed: in scroll mode every step does, in the page modes
+only the steps that flip the page. Reports the number of edge-crossing steps
+and, separately for those and for the steps within the display, the bytes
+written to the terminal and the milliseconds per step. The child process writes
+the terminal output to a pipe and counts the bytes after each step.
+
+Usage:
+    python benchmarks/content_scrolling.py [--steps N]
+
+"""
+
+import argparse
+import curses
+import json
+import locale
+import os
+import pty
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import signalslot
+
+from soundcurses.curses import regions, screen, windows
+
+CONTENT_MODES = ('paged', 'virtual', 'scroll')
+SCREEN_LINES = 50
+SCREEN_COLS = 160
+
+def count_output(output_fd):
+    """
+    Read and count the terminal output written since the last call.
+
+    Returns:
+        int: The number of bytes.
+
+    """
+    output_bytes = 0
+    while True:
+        try:
+            output_bytes += len(os.read(output_fd, 65536))
+        except BlockingIOError:
+            return output_bytes
+
+def displayed_lines(region):
+    """
+    Identify the lines the region displays.
+
+    Returns:
+        tuple: The current page number and, in scroll mode, the top line.
+
+    """
+    return (
+        region._current_page_number,
+        getattr(region, '_top_line_number', None))
+
+def run_steps(stdscr, content_mode, steps, output_fd):
+    """
+    Compose a content region, select the bottom line of the display, and move
+    the selection down by steps lines.
+
+    Returns:
+        dict: Maps 'edge' and 'within' to lists of [bytes, milliseconds], one
+            per step.
+
+    """
+    curses_wrapper = screen.CursesWrapper(curses, locale)
+    curses_screen = screen.CursesScreen(
+        curses_wrapper, screen.RenderQueue(), signalslot.Signal())
+    window_factory = windows.CursesWindowFactory(
+        curses_wrapper, curses_screen, signalslot)
+    curses_screen.add_window(window_factory.wrap_window(stdscr))
+    window = window_factory.create_window(
+        curses_wrapper.LINES - 7, curses_wrapper.COLS, 7, 0,
+        render_layer=curses_screen.RENDER_LAYER_REGIONS)
+    curses_screen.add_window(window)
+    region_class = {
+        'paged': regions.ContentRegion,
+        'scroll': regions.ContentRegionScroll,
+        'virtual': regions.ContentRegionVirtual}[content_mode]
+    region = region_class(
+        window, curses_wrapper, windows.CursesStringFactory(curses_wrapper))
+    region.content_lines = [
+        '{:05}. track {}  0:03:{:02}'.format(i, i, i % 60)
+        for i in range(steps + 2 * SCREEN_LINES)]
+    curses_screen.render()
+    for step in range(region._avail_lines - 1):
+        region.line_next()
+        curses_screen.render()
+        count_output(output_fd)
+
+    results = {'edge': [], 'within': []}
+    for step in range(steps):
+        lines_before = displayed_lines(region)
+        time_start = time.perf_counter()
+        region.line_next()
+        curses_screen.render()
+        elapsed = time.perf_counter() - time_start
+        results[
+            'within' if displayed_lines(region) == lines_before else 'edge'
+        ].append([count_output(output_fd), elapsed * 1000])
+
+    return results
+
+def measure(content_mode, steps):
+    """
+    Run the steps in a child process on a pseudo-terminal.
+
+    Returns:
+        dict: As returned by run_steps().
+
+    """
+    with tempfile.NamedTemporaryFile('r') as result_file:
+        pid, master_fd = pty.fork()
+        if pid == 0:
+            os.environ['TERM'] = 'xterm'
+            output_fd, pipe_write_fd = os.pipe()
+            os.set_blocking(output_fd, False)
+            os.dup2(pipe_write_fd, sys.stdout.fileno())
+            results = curses.wrapper(
+                run_steps, content_mode, steps, output_fd)
+            with open(result_file.name, 'w') as child_result_file:
+                json.dump(results, child_result_file)
+            os._exit(0)
+
+        while True:
+            try:
+                os.read(master_fd, 65536)
+            except OSError:
+                break
+        os.waitpid(pid, 0)
+        os.close(master_fd)
+
+        return json.load(result_file)
+
+def format_steps(samples):
+    """
+    Format the step count and the mean bytes and milliseconds per step.
+
+    """
+    if not samples:
+        return '{:>6} {:>12} {:>10}'.format(0, '-', '-')
+
+    return '{:>6} {:>12.1f} {:>10.3f}'.format(
+        len(samples),
+        sum(sample[0] for sample in samples) / len(samples),
+        sum(sample[1] for sample in samples) / len(samples))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--steps', type=int, default=500)
+    args = parser.parse_args()
+
+    # Children inherit the terminal size from these variables.
+    os.environ['LINES'] = str(SCREEN_LINES)
+    os.environ['COLUMNS'] = str(SCREEN_COLS)
+
+    print('{:<8} {:<7}{:>12} {:>10}   {:<7}{:>12} {:>10}'.format(
+        'mode', 'edge', 'bytes/step', 'ms/step',
+        'within', 'bytes/step', 'ms/step'))
+    for content_mode in CONTENT_MODES:
+        results = measure(content_mode, args.steps)
+        print('{:<8} {}   {}'.format(
+            content_mode,
+            format_steps(results['edge']),
+            format_steps(results['within'])))
+
+if __name__ == '__main__':
+    main()
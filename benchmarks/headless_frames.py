@@ -0,0 +1,82 @@
+"""
+Measure frame times of a scripted session on the headless curses backend.
+
+Runs soundcurses.py with --headless against a local stand-in API. The session
+enters a username, waits for the tracks to load, scrolls through them line by
+line and page by page, and quits. Prints the frame count, wall time per frame,
+and the per-phase main loop latencies.
+
+Usage:
+    python benchmarks/headless_frames.py [--items N] [--lines N]
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import stub_api
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def build_script(line_steps, page_steps):
+    """
+    Build the input script for the session.
+
+    Navigation keys are separated by empty lines, which are idle polls, so
+    that each key is handled in its own main loop iteration rather than folded
+    into a single action.
+
+    Returns:
+        list: Script file lines.
+
+    """
+    keys = (['KEY_DOWN'] * line_steps
+        + ['KEY_NPAGE'] * page_steps
+        + ['KEY_PPAGE'] * page_steps
+        + ['KEY_UP'] * line_steps)
+    script = ['someone', '@wait 1.5']
+    for key in keys:
+        script.extend([key, ''])
+    script.append('q')
+
+    return script
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--lines', type=int, default=500)
+    args = parser.parse_args()
+
+    server = stub_api.StubApiServer(item_count=args.items)
+    api_url = server.start()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script_path = os.path.join(temp_dir, 'script')
+        profile_path = os.path.join(temp_dir, 'profile.json')
+        with open(script_path, 'w') as script_file:
+            script_file.write(
+                '\n'.join(build_script(args.lines, args.lines // 10)) + '\n')
+        result = subprocess.run(
+            [sys.executable, 'soundcurses.py',
+                '--headless', script_path,
+                '--api-url', api_url,
+                '--profile-file', profile_path],
+            cwd=REPO_DIR, stdout=subprocess.PIPE, universal_newlines=True,
+            check=True)
+        with open(profile_path) as profile_file:
+            profile = json.load(profile_file)
+
+    print(result.stdout, end='')
+    print('{:<22} {:>8} {:>10} {:>10} {:>10}'.format(
+        'phase', 'count', 'p50 ms', 'p95 ms', 'p99 ms'))
+    for phase, summary in profile.items():
+        print('{:<22} {:>8} {:>10.3f} {:>10.3f} {:>10.3f}'.format(
+            phase, summary['count'], summary['p50_ms'], summary['p95_ms'],
+            summary['p99_ms']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Measure repeated API requests with and without the pooled HTTP session.
+
+Runs the SoundcloudWrapper against the local stand-in API and requests the
+tracks of a series of distinct users, so that no request is served from the
+cache. The requests are made once through the wrapper's pooled session and once
+through the functions of the requests module, as the soundcloud library does by
+default. Reports the connections opened and the milliseconds per request.
+
+Usage:
+    python benchmarks/http_session.py [--requests N] [--latency SECONDS]
+
+"""
+
+import argparse
+import concurrent.futures
+import functools
+import os
+import sys
+import time
+import urllib.parse
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import soundcloud
+
+from soundcurses import clients, events, models
+
+import stub_api
+
+def create_pooled_client(api_url, http_session):
+    """
+    Create a client as the application does.
+
+    Returns:
+        soundcloud.Client
+
+    """
+    return clients.create_soundcloud_client(api_url, http_session)
+
+def create_unpooled_client(api_url, http_session):
+    """
+    Create a client of the soundcloud library, which makes its requests
+    through the functions of the requests module.
+
+    Returns:
+        soundcloud.Client
+
+    """
+    api_url = urllib.parse.urlsplit(api_url)
+
+    return soundcloud.Client(
+        client_id=clients.CLIENT_ID,
+        host=api_url.netloc,
+        use_ssl=api_url.scheme == 'https')
+
+def measure(client_factory, request_count, latency):
+    """
+    Request the tracks of request_count distinct users.
+
+    Returns:
+        tuple: Connections opened and milliseconds per request.
+
+    """
+    server = stub_api.StubApiServer(item_count=50, latency=latency)
+    api_url = server.start()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    wrapper = models.SoundcloudWrapper(
+        functools.partial(client_factory, api_url),
+        executor,
+        events.CompletionDispatcher(lambda: None))
+    wrapper.start().result()
+
+    time_start = time.perf_counter()
+    for user_id in range(request_count):
+        wrapper.get_user_subresource(str(user_id), 'tracks').result()
+    elapsed = time.perf_counter() - time_start
+
+    executor.shutdown()
+    server.shutdown()
+    server.server_close()
+
+    return server.connection_count, elapsed * 1000 / request_count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.0)
+    args = parser.parse_args()
+
+    print('{:<10} {:>12} {:>12}'.format('session', 'connections', 'ms/request'))
+    for label, client_factory in (
+        ('pooled', create_pooled_client),
+        ('unpooled', create_unpooled_client)):
+        print('{:<10} {:>12} {:>12.3f}'.format(
+            label, *measure(client_factory, args.requests, args.latency)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Measure the cost of showing and hiding a small modal on a large screen.
+
+Composes full-width header, navigation, and content windows on the headless
+curses backend, then repeatedly shows and hides a spinner-sized modal over the
+content, rendering after each change. Reports the cells copied to the virtual
+screen per frame and milliseconds per frame, both for damage touching and for
+touching every window on each change, as was done before.
+
+Usage:
+    python benchmarks/layer_change.py [--lines N] [--cols N] [--frames N]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import signalslot
+
+from soundcurses.curses import headless, screen, windows
+
+def measure(lines, cols, frames, touch_all):
+    """
+    Show and hide the modal, rendering after each change.
+
+    Returns:
+        tuple: Cells copied per frame and milliseconds per frame.
+
+    """
+    curses = headless.HeadlessCurses(lines=lines, cols=cols)
+    curses_screen = screen.CursesScreen(
+        curses, screen.RenderQueue(), signalslot.Signal())
+    window_factory = windows.CursesWindowFactory(
+        curses, curses_screen, signalslot)
+    regions = [
+        window_factory.create_window(3, cols, 0, 0),
+        window_factory.create_window(3, cols, 3, 0),
+        window_factory.create_window(lines - 6, cols, 6, 0)]
+    modal = window_factory.create_window(
+        3, 9, lines // 2, (cols - 9) // 2,
+        render_layer=curses_screen.RENDER_LAYER_MODALS)
+    for window in regions + [modal]:
+        curses_screen.add_window(window)
+    for window in regions:
+        for y in range(window.lines):
+            window.addstr(y, 0, chr(ord('a') + y % 26) * (cols - 1))
+    modal.border()
+    curses_screen.render()
+
+    cells_copied = curses.cells_copied
+    time_start = time.perf_counter()
+    for frame in range(frames):
+        if frame % 2:
+            modal.show()
+        else:
+            modal.hide()
+        if touch_all:
+            for window in regions + [modal]:
+                window.touchwin()
+        curses_screen.render()
+    elapsed = time.perf_counter() - time_start
+    cells_copied = curses.cells_copied - cells_copied
+    curses.close()
+
+    return cells_copied / frames, elapsed * 1000 / frames
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--lines', type=int, default=60)
+    parser.add_argument('--cols', type=int, default=200)
+    parser.add_argument('--frames', type=int, default=200)
+    args = parser.parse_args()
+
+    print('{:<12} {:>14} {:>10}'.format('touching', 'cells/frame', 'ms/frame'))
+    for label, touch_all in (('damage', False), ('all', True)):
+        print('{:<12} {:>14.0f} {:>10.3f}'.format(
+            label, *measure(args.lines, args.cols, args.frames, touch_all)))
+
+if __name__ == '__main__':
+    main()
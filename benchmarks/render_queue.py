@@ -0,0 +1,86 @@
+"""
+Measure RenderQueue operations as the number of queued windows grows.
+
+For each queue size, times adding every window, membership tests, len(),
+iteration, and removing every window. Reports nanoseconds per window, which
+should stay roughly flat as the number of windows grows.
+
+Usage:
+    python benchmarks/render_queue.py
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from soundcurses.curses import screen
+
+LAYER_COUNT = 4
+
+class Window:
+    """
+    A minimal stand-in for CursesWindow.
+
+    """
+
+    def __init__(self, render_layer):
+        self.render_layer = render_layer
+
+
+def time_per_window(operation, windows, repeat=20):
+    """
+    Time an operation on all windows.
+
+    Returns:
+        float: The best time, in nanoseconds per window.
+
+    """
+    best = float('inf')
+    for i in range(repeat):
+        time_start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - time_start)
+
+    return best * 1e9 / len(windows)
+
+def main():
+    print('{:>8} {:>10} {:>10} {:>10} {:>10} {:>10}'.format(
+        'windows', 'add', 'contains', 'len', 'iter', 'remove'))
+    for window_count in (10, 100, 1000, 10000):
+        windows = [Window(i % LAYER_COUNT) for i in range(window_count)]
+        render_queue = screen.RenderQueue()
+
+        def add():
+            render_queue.clear()
+            for window in windows:
+                render_queue.add(window)
+
+        def contains():
+            for window in windows:
+                window in render_queue
+
+        def length():
+            for window in windows:
+                len(render_queue)
+
+        def iterate():
+            for window in render_queue:
+                pass
+
+        def remove():
+            add()
+            for window in windows:
+                render_queue.remove(window)
+
+        add()
+        timings = [time_per_window(operation, windows)
+            for operation in (add, contains, length, iterate)]
+        timings.append(time_per_window(remove, windows) - timings[0])
+        print('{:>8} {:>10.0f} {:>10.0f} {:>10.0f} {:>10.0f} {:>10.0f}'.format(
+            window_count, *timings))
+
+if __name__ == '__main__':
+    main()
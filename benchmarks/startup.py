@@ -0,0 +1,119 @@
+"""
+Measure application startup on the headless curses backend.
+
+Each sample runs in a fresh interpreter, which imports soundcurses.py, composes
+the application and stops at the first doupdate(). Reports the median time
+spent importing the entry script's modules, the median time from interpreter
+start of the measurement to the first doupdate(), and whether the network
+stack had been imported by then. For comparison, the time to import the
+network stack alone is also reported.
+
+Usage:
+    python benchmarks/startup.py [--samples N]
+
+"""
+
+import argparse
+import importlib
+import json
+import os
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+import types
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class FirstPaint(Exception):
+    """
+    Raised by the instrumented doupdate() to stop the application.
+
+    """
+    pass
+
+
+def measure_startup():
+    """
+    Measure a single startup in this interpreter.
+
+    Returns:
+        dict: Times in milliseconds.
+
+    """
+    time_start = time.perf_counter()
+    sys.path.insert(0, REPO_DIR)
+    entry_globals = runpy.run_path(
+        os.path.join(REPO_DIR, 'soundcurses.py'), run_name='startup')
+    time_imported = time.perf_counter()
+
+    from soundcurses.curses import headless
+    headless_curses = headless.HeadlessCurses()
+    def doupdate():
+        raise FirstPaint(time.perf_counter(), 'requests' in sys.modules)
+    headless_curses.doupdate = doupdate
+    args = types.SimpleNamespace(
+        api_url='http://127.0.0.1:9', asyncio=False, content_mode='paged',
+        background_workers=2, headless=None, interactive_workers=2,
+        pool_hosts=4, pool_size=4, prefetch=False, profile_file=None)
+    try:
+        entry_globals['main'](
+            headless_curses.initscr(), args, headless_curses,
+            headless_curses.input_fd)
+    except FirstPaint as first_paint:
+        time_painted, network_imported = first_paint.args
+
+    return {
+        'import_ms': (time_imported - time_start) * 1000,
+        'first_paint_ms': (time_painted - time_start) * 1000,
+        'network_imported': network_imported}
+
+def measure_network_import():
+    """
+    Measure the import of the network stack alone in this interpreter.
+
+    Returns:
+        dict: Times in milliseconds.
+
+    """
+    time_start = time.perf_counter()
+    importlib.import_module('requests')
+    importlib.import_module('soundcloud')
+
+    return {'network_import_ms': (time.perf_counter() - time_start) * 1000}
+
+def run_sample(mode):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', mode],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True)
+
+    return json.loads(result.stdout.splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--samples', type=int, default=10)
+    parser.add_argument('--child', choices=('startup', 'network'))
+    args = parser.parse_args()
+
+    if args.child == 'startup':
+        print(json.dumps(measure_startup()), flush=True)
+        os._exit(0)
+    elif args.child == 'network':
+        print(json.dumps(measure_network_import()))
+        return
+
+    startups = [run_sample('startup') for i in range(args.samples)]
+    network_imports = [run_sample('network') for i in range(args.samples)]
+    print('import: {:.1f} ms'.format(
+        statistics.median(sample['import_ms'] for sample in startups)))
+    print('first doupdate: {:.1f} ms'.format(
+        statistics.median(sample['first_paint_ms'] for sample in startups)))
+    print('network stack imported before first doupdate: {}'.format(
+        any(sample['network_imported'] for sample in startups)))
+    print('network stack import alone: {:.1f} ms'.format(
+        statistics.median(
+            sample['network_import_ms'] for sample in network_imports)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+A local stand-in for the SoundCloud API, for use by the benchmarks.
+
+Serves the endpoints requested by the model over plain HTTP on the loopback
+interface. Every user exists except "missing" and has the same number of
+generated items in every subresource.
+
+"""
+
+import http.server
+import json
+import threading
+import urllib.parse
+
+class StubApiHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Handles requests to the stand-in API.
+
+    """
+
+    # Headers and body are written separately. Without TCP_NODELAY, the body of
+    # each response on a kept-alive connection waits for the client's delayed
+    # acknowledgement of the headers.
+    disable_nagle_algorithm = True
+    protocol_version = 'HTTP/1.1'
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path.strip('/').split('/')
+        query = urllib.parse.parse_qs(url.query)
+        if self.server.latency:
+            threading.Event().wait(self.server.latency)
+
+        if path == ['resolve']:
+            username = query['url'][0].rsplit('/', 1)[-1]
+            if username == 'missing':
+                self._send_json(404, {'errors': []})
+            else:
+                self._send_json(200, {'id': 1, 'username': username})
+        elif len(path) == 2 and path[0] == 'users':
+            self._send_json(200, {'id': int(path[1]), 'username': 'user'})
+        elif len(path) == 3 and path[0] == 'users':
+            self._send_json(200, [
+                {'id': i, 'title': '{} {}'.format(path[2], i),
+                    'duration': 1000 * (i % 600)}
+                for i in range(self.server.item_count)])
+        else:
+            self._send_json(404, {'errors': []})
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubApiServer(http.server.ThreadingHTTPServer):
+    """
+    A threaded stand-in API server.
+
+    Attributes:
+        connection_count (int): The number of TCP connections accepted.
+        item_count (int): The number of items in every subresource.
+        latency (float): Seconds by which every response is delayed.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, item_count=1000, latency=0.0):
+        super().__init__(('127.0.0.1', 0), StubApiHandler)
+        self.connection_count = 0
+        self.item_count = item_count
+        self.latency = latency
+
+    def get_request(self):
+        self.connection_count += 1
+        return super().get_request()
+
+    def start(self):
+        """
+        Serve on a daemon thread.
+
+        Returns:
+            str: The base URL of the server.
+
+        """
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+
+        return 'http://{}:{}'.format(*self.server_address)
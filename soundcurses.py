@@ -3,21 +3,25 @@
 """
 
 # Standard library imports.
-import concurrent.futures
+import argparse
 import curses
 import locale
+import selectors
+import signal
+import sys
+import time
 
-# Third-party imports.
-import requests
+# Third-party imports. The network stack, requests and soundcloud, is imported
+# with the local clients module, on the network I/O thread.
 import signalslot
-import soundcloud
 
 # Local imports.
-from soundcurses import (config, controllers, models, states)
-from soundcurses.curses import (effects, regions, screen, user_input, views,
-    windows)
+from soundcurses import (config, controllers, events, executors, models,
+    profiling, states)
+from soundcurses.curses import (effects, headless, regions, screen,
+    user_input, views, windows)
 
-def main(stdscr):
+def main(stdscr, args, curses_module, input_fd):
     """
     Compose all objects.
 
@@ -25,10 +29,26 @@ def main(stdscr):
 
     Note that stdscr is passed into the main function by curses.wrapper().
 
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+        curses_module: The curses library or a HeadlessCurses instance.
+        input_fd (int): The file descriptor that becomes readable when input
+            is available.
+
     """
 
+    # Compose the main loop's event waiter. It watches the terminal input.
+    # asyncio is imported only if needed since the import is slow.
+    if args.asyncio:
+        import asyncio
+        event_loop = asyncio.new_event_loop()
+        event_waiter = events.AsyncEventWaiter(event_loop, input_fd)
+    else:
+        event_waiter = events.EventWaiter(
+            selectors.DefaultSelector(), input_fd)
+
     # Wrap curses
-    curses_wrapper = screen.CursesWrapper(curses, locale)
+    curses_wrapper = screen.CursesWrapper(curses_module, locale)
 
     # Compose screen.
     curses_screen = screen.CursesScreen(
@@ -41,24 +61,32 @@ def main(stdscr):
     # Compose string factory.
     string_factory = windows.CursesStringFactory(curses_wrapper)
 
-    # IMPORTANT: This soundcloud.Client instance is not to be touched.
-    # It is accessed exclusively by a separate thread. Its existence in the main
-    # thread is solely to allow the composition of function partials which are
-    # passed to the thread and executed.
-    #
-    # The "constant" HTTP_ERROR attribute is added to fix leaky abstraction
-    # in the soundcloud interface. Calling code (other than this) no longer
-    # has to be aware of soundcloud's internal method of making HTTP requests.
-    soundcloud_client = soundcloud.Client(
-        client_id='e9cd65934510bf631372af005c2f37b5',
-        use_ssl=True)
-    soundcloud_client.HTTP_ERROR = requests.exceptions.HTTPError
-
-    # Compose model.
-    thread_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    # Compose model. The SoundCloud client is created later, on the network
+    # I/O threads. The clients module imports the network stack, so it is only
+    # imported there too.
+    def create_soundcloud_client(http_session):
+        from soundcurses import clients
+        return clients.create_soundcloud_client(args.api_url, http_session)
+
+    thread_executor = executors.LaneExecutor(
+        [args.interactive_workers, args.background_workers],
+        thread_name_prefix='network')
+    completion_dispatcher = events.CompletionDispatcher(event_waiter.wake)
     soundcloud_wrapper = models.SoundcloudWrapper(
-        soundcloud_client, thread_executor)
-    model = models.Model(soundcloud_wrapper, signalslot.Signal())
+        create_soundcloud_client,
+        thread_executor.lane(thread_executor.LANE_INTERACTIVE),
+        completion_dispatcher,
+        pool_connections=args.pool_hosts,
+        pool_maxsize=args.pool_size,
+        background_executor=thread_executor.lane(
+            thread_executor.LANE_BACKGROUND))
+    if args.asyncio:
+        model = models.AsyncModel(
+            soundcloud_wrapper, signalslot.Signal(), event_loop,
+            prefetch=args.prefetch)
+    else:
+        model = models.Model(
+            soundcloud_wrapper, signalslot.Signal(), prefetch=args.prefetch)
 
     # Begin composing view regions.
     y_coord_offset = 0
@@ -100,10 +128,36 @@ def main(stdscr):
         y_coord_offset, 0,
         render_layer=curses_screen.RENDER_LAYER_REGIONS)
     curses_screen.add_window(content_window)
-    content_region = regions.ContentRegion(
-        content_window,
-        curses_wrapper,
-        string_factory)
+    if args.content_mode == 'pad':
+        content_region = regions.ContentRegionPad(
+            content_window,
+            curses_wrapper,
+            string_factory,
+            curses_screen,
+            window_factory)
+    elif args.content_mode == 'scroll':
+        content_region = regions.ContentRegionScroll(
+            content_window,
+            curses_wrapper,
+            string_factory)
+    elif args.content_mode == 'virtual':
+        content_region = regions.ContentRegionVirtual(
+            content_window,
+            curses_wrapper,
+            string_factory)
+    else:
+        content_region = regions.ContentRegion(
+            content_window,
+            curses_wrapper,
+            string_factory)
+
+    # Compose timer scheduler.
+    scheduler = events.TimerScheduler()
+
+    # Paint the region chrome, then import and initialize the network stack in
+    # the background while the rest of the application is composed.
+    curses_screen.render()
+    soundcloud_wrapper.start()
 
     # Compose input source.
     input_source = user_input.InputSource(curses_wrapper, stdscr_window)
@@ -115,7 +169,7 @@ def main(stdscr):
         curses_screen,
         window_factory,
         string_factory,
-        effects.SimpleSpinner(curses_screen),
+        effects.SimpleSpinner(curses_screen, scheduler),
         input_mapper)
     view = views.MainView(
         input_source,
@@ -124,19 +178,149 @@ def main(stdscr):
         status_region,
         nav_region,
         content_region,
-        modal_factory)
+        modal_factory,
+        views.ToastQueue(modal_factory, scheduler))
+
+    # Compose main loop profiler. If enabled, SIGUSR1 requests an export
+    # without waiting for the application to exit.
+    profiler = None
+    if args.profile_file:
+        profiler = profiling.LoopProfiler(args.profile_file)
+        def handle_export_signal(signum, frame):
+            profiler.request_export()
+            event_waiter.wake()
+        signal.signal(signal.SIGUSR1, handle_export_signal)
 
     # Compose controllers.
     state_factory = states.StateFactory(
         input_mapper,
         view,
-        model)
-    controller = controllers.MainController(
-        input_mapper,
-        state_factory,
-        view,
-        model)
+        model,
+        scheduler)
+    if args.asyncio:
+        controller = controllers.AsyncMainController(
+            input_mapper,
+            state_factory,
+            view,
+            model,
+            event_waiter,
+            scheduler,
+            event_loop,
+            profiler)
+    else:
+        controller = controllers.MainController(
+            input_mapper,
+            state_factory,
+            view,
+            model,
+            event_waiter,
+            scheduler,
+            profiler)
 
     controller.start_application()
 
-curses.wrapper(main)
+def run_headless(args):
+    """
+    Run the application on the in-memory curses backend.
+
+    Input is read from the script file named by args.headless. When the
+    application exits, the number of frames and the mean wall time per frame
+    are printed.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    """
+    headless_curses = headless.HeadlessCurses(
+        headless.load_script(args.headless))
+    time_start = time.perf_counter()
+    try:
+        main(headless_curses.initscr(), args, headless_curses,
+            headless_curses.input_fd)
+    finally:
+        headless_curses.close()
+    time_elapsed = time.perf_counter() - time_start
+
+    print('frames: {}'.format(headless_curses.update_count))
+    print('cells updated: {}'.format(headless_curses.cells_updated))
+    print('ms per frame: {:.3f}'.format(
+        time_elapsed * 1000 / max(1, headless_curses.update_count)))
+
+def parse_args():
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace
+
+    """
+    parser = argparse.ArgumentParser(
+        description='A curses-based terminal UI for SoundCloud.')
+    parser.add_argument(
+        '--asyncio',
+        action='store_true',
+        help='run the main loop as an asyncio coroutine')
+    parser.add_argument(
+        '--api-url',
+        default='https://api.soundcloud.com',
+        metavar='URL',
+        help='base URL of the SoundCloud API (default: %(default)s)')
+    parser.add_argument(
+        '--background-workers',
+        type=int,
+        default=2,
+        metavar='N',
+        help='number of network threads for requests made ahead of need '
+            '(default: %(default)s)')
+    parser.add_argument(
+        '--content-mode',
+        choices=('paged', 'pad', 'virtual', 'scroll'),
+        default='paged',
+        help='rewrite the content lines on each page change, write all '
+            'lines to a pad once and scroll it, create lines only for the '
+            'displayed page, or scroll line by line (default: %(default)s)')
+    parser.add_argument(
+        '--headless',
+        metavar='SCRIPT',
+        help='run without a terminal, reading keys from SCRIPT, and report '
+            'frame times')
+    parser.add_argument(
+        '--interactive-workers',
+        type=int,
+        default=2,
+        metavar='N',
+        help='number of network threads reserved for requests the user is '
+            'waiting on (default: %(default)s)')
+    parser.add_argument(
+        '--pool-hosts',
+        type=int,
+        default=models.SoundcloudWrapper.POOL_CONNECTIONS,
+        metavar='N',
+        help='number of hosts whose HTTP connections are kept alive '
+            '(default: %(default)s)')
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=models.SoundcloudWrapper.POOL_MAXSIZE,
+        metavar='N',
+        help='maximum number of HTTP connections per host, kept alive '
+            'between requests (default: %(default)s)')
+    parser.add_argument(
+        '--prefetch',
+        action='store_true',
+        help='once a username is resolved, fetch all of the user\'s '
+            'subresources in the background')
+    parser.add_argument(
+        '--profile-file',
+        metavar='PATH',
+        help='time each main loop phase and write latency percentiles to PATH '
+            'on exit or on SIGUSR1')
+
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.headless:
+        run_headless(args)
+    else:
+        curses.wrapper(main, args, curses, sys.stdin.fileno())
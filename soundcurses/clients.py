@@ -0,0 +1,134 @@
+"""
+Defines the SoundCloud client used by the SoundcloudWrapper.
+
+This module imports the network stack, requests and soundcloud, so it is
+imported on the network I/O thread rather than at startup.
+
+"""
+
+import urllib.parse
+
+import requests
+import soundcloud
+import soundcloud.request
+import soundcloud.resource
+
+CLIENT_ID = 'e9cd65934510bf631372af005c2f37b5'
+HTTP_ERROR = requests.exceptions.HTTPError
+
+def create_soundcloud_client(api_url, http_session):
+    """
+    Create the SoundCloud client.
+
+    Called by the SoundcloudWrapper on its network I/O thread.
+
+    IMPORTANT: The returned client is not to be touched by the main thread. It
+    is accessed exclusively by the network I/O thread.
+
+    Args:
+        api_url (str): The base URL of the SoundCloud API.
+        http_session (requests.Session): The session through which to make
+            requests.
+
+    Returns:
+        SessionClient
+
+    """
+    api_url = urllib.parse.urlsplit(api_url)
+
+    return SessionClient(
+        http_session,
+        client_id=CLIENT_ID,
+        host=api_url.netloc,
+        use_ssl=api_url.scheme == 'https')
+
+class SessionClient(soundcloud.Client):
+    """
+    A SoundCloud client that makes its requests through its own HTTP session.
+
+    soundcloud.Client makes its requests through functions of the requests
+    module, so every request would open a new connection. This client makes
+    them through a requests.Session instead, which keeps connections alive
+    between requests. Each client uses only its own session.
+
+    The library offers no way to pass a session in, so _request() prepares
+    requests as soundcloud.Client._request() and
+    soundcloud.request.make_request() do. It follows the library's internals,
+    which is why requirements.txt pins the soundcloud version. Check _request()
+    against the library before changing the pin.
+
+    The "constant" HTTP_ERROR attribute is added to fix leaky abstraction in
+    the soundcloud interface. Calling code no longer has to be aware of
+    soundcloud's internal method of making HTTP requests.
+
+    Attributes:
+        HTTP_ERROR (Exception): The exception raised for HTTP error responses.
+        _http_session (requests.Session): The session through which requests
+            are made.
+
+    """
+
+    HTTP_ERROR = HTTP_ERROR
+
+    def __init__(self, http_session, **kwargs):
+        """
+        Constructor.
+
+        Args:
+            http_session (requests.Session): The session through which to make
+                requests.
+            kwargs: Passed to the parent constructor.
+
+        """
+        self._http_session = http_session
+
+        super().__init__(**kwargs)
+
+    def _request(self, method, resource, **kwargs):
+        """
+        Override parent.
+
+        Prepares the request as soundcloud.request.make_request() does, but
+        makes it through the client's session.
+
+        Raises:
+            requests.exceptions.HTTPError: If the response is an HTTP error.
+
+        """
+        url = self._resolve_resource_name(resource)
+        if hasattr(self, 'access_token'):
+            kwargs['oauth_token'] = self.access_token
+        if hasattr(self, 'client_id'):
+            kwargs['client_id'] = self.client_id
+        params = {
+            key: value for key, value in kwargs.items() if value is not None}
+
+        allow_redirects = params.pop('allow_redirects', True)
+        request_kwargs = {
+            'allow_redirects': allow_redirects,
+            'headers': {'User-Agent': soundcloud.USER_AGENT}}
+        if self.options.get('verify_ssl', True) is False:
+            request_kwargs['verify'] = False
+        if self.options.get('proxies') is not None:
+            request_kwargs['proxies'] = self.options['proxies']
+
+        params = soundcloud.request.hashconversions.to_params(params)
+        data = soundcloud.request.namespaced_query_string(
+            soundcloud.request.remove_files_from_dict(params))
+        if method == 'get':
+            request_kwargs['headers']['Accept'] = 'application/json'
+            request_kwargs['params'] = data
+        else:
+            request_kwargs['data'] = data
+            files = soundcloud.request.namespaced_query_string(
+                soundcloud.request.extract_files_from_dict(params))
+            if files:
+                request_kwargs['files'] = files
+
+        response = self._http_session.request(method, url, **request_kwargs)
+        # As with the soundcloud library, redirects are not errors if they are
+        # not followed.
+        if allow_redirects or response.status_code not in (301, 302):
+            response.raise_for_status()
+
+        return soundcloud.resource.wrapped_resource(response)
@@ -17,6 +17,17 @@ class UserInputMapper:
 
     Currently key mapping is constrained to one-to-one relationships.
 
+    Runs of identical repeatable actions, such as holding the down arrow key,
+    can be folded into a single action with a repetition count. This allows
+    the handling code to apply many steps with a single repaint.
+
+    Digits typed before an action that takes a count form a count prefix, as
+    in the vi editor. The prefix becomes the count of the action, so "5" then
+    the down arrow key moves five lines and "120G" goes to line 120. Actions
+    in PREFIX_ACTIONS are only meaningful with a prefix; without one, they
+    resolve to their entry in UNPREFIXED_ACTIONS, or are dropped if it is
+    None. A prefix typed before any other action is discarded.
+
     Note that in ncurses, there is a built-in delay with the escpe key.
 
     See: http://en.chys.info/2009/09/esdelay-ncurses/
@@ -24,7 +35,11 @@ class UserInputMapper:
     """
 
     ACTION_CLOSE = 'Close window'
+    ACTION_CONTENT_LINE_FIRST = 'First content line'
+    ACTION_CONTENT_LINE_GO_TO = 'Go to line number typed before key'
+    ACTION_CONTENT_LINE_LAST = 'Last content line'
     ACTION_CONTENT_LINE_NEXT = 'Next content line'
+    ACTION_CONTENT_LINE_PERCENT = 'Go to percent typed before key'
     ACTION_CONTENT_LINE_PREV = 'Previous content line'
     ACTION_CONTENT_PAGE_NEXT = 'Next content page'
     ACTION_CONTENT_PAGE_PREV = 'Previous content page'
@@ -33,11 +48,24 @@ class UserInputMapper:
     ACTION_HELP = 'Help'
     ACTION_QUIT = 'Quit'
 
+    REPEATABLE_ACTIONS = frozenset([
+        ACTION_CONTENT_LINE_NEXT,
+        ACTION_CONTENT_LINE_PREV,
+        ACTION_CONTENT_PAGE_NEXT,
+        ACTION_CONTENT_PAGE_PREV])
+
+    UNPREFIXED_ACTIONS = {
+        ACTION_CONTENT_LINE_GO_TO: ACTION_CONTENT_LINE_LAST,
+        ACTION_CONTENT_LINE_PERCENT: None}
+
+    PREFIX_ACTIONS = frozenset(UNPREFIXED_ACTIONS)
+
     def __init__(self):
         """
         Establish instance input-to-action mapping.
 
         """
+        self._count_prefix = ''
         self._keymap = {}
 
         self._populate_keymap()
@@ -49,11 +77,15 @@ class UserInputMapper:
         Listed in ascending alphanumerical order by key.
 
         """
+        self._keymap['%'] = self.ACTION_CONTENT_LINE_PERCENT
+        self._keymap['G'] = self.ACTION_CONTENT_LINE_GO_TO
         self._keymap['c'] = self.ACTION_CLOSE
         self._keymap['q'] = self.ACTION_QUIT
         self._keymap['u'] = self.ACTION_ENTER_USERNAME
         self._keymap['KEY_F(1)'] = self.ACTION_HELP
         self._keymap['KEY_DOWN'] = self.ACTION_CONTENT_LINE_NEXT
+        self._keymap['KEY_END'] = self.ACTION_CONTENT_LINE_LAST
+        self._keymap['KEY_HOME'] = self.ACTION_CONTENT_LINE_FIRST
         self._keymap['KEY_NPAGE'] = self.ACTION_CONTENT_PAGE_NEXT
         self._keymap['KEY_PPAGE'] = self.ACTION_CONTENT_PAGE_PREV
         self._keymap['KEY_UP'] = self.ACTION_CONTENT_LINE_PREV
@@ -86,3 +118,59 @@ class UserInputMapper:
 
         """
         return self._keymap.get(input_string, input_string)
+
+    def is_repeatable_input(self, input_string):
+        """
+        Determine whether a raw input string maps to a repeatable action.
+
+        Returns:
+            bool: True if the resolved action is in REPEATABLE_ACTIONS.
+
+        """
+        return self.resolve_input(input_string) in self.REPEATABLE_ACTIONS
+
+    def resolve_input_sequence(self, input_strings):
+        """
+        Translate a sequence of raw input strings into counted actions.
+
+        Consecutive identical actions found in REPEATABLE_ACTIONS are folded
+        into a single tuple whose count is the length of the run. All other
+        actions are returned individually with a count of one.
+
+        Unmapped digits accumulate into a count prefix, which is consumed by
+        the next repeatable or prefix action, or discarded by any other. A
+        prefix left pending at the end of the sequence is kept for the next
+        call, since keys may be drained over several main loop iterations.
+
+        Args:
+            input_strings (list): Raw input strings in the order received.
+
+        Returns:
+            list: A list of tuples (action, count).
+
+        """
+        actions = []
+        for input_string in input_strings:
+            action = self.resolve_input(input_string)
+            if input_string.isdecimal() and action == input_string:
+                self._count_prefix += input_string
+                continue
+
+            count_prefix = self._count_prefix
+            self._count_prefix = ''
+            if action in self.PREFIX_ACTIONS and not count_prefix:
+                action = self.UNPREFIXED_ACTIONS[action]
+                if action is None:
+                    continue
+            count = 1
+            if count_prefix and (action in self.REPEATABLE_ACTIONS
+                or action in self.PREFIX_ACTIONS):
+                count = int(count_prefix)
+
+            if actions and action in self.REPEATABLE_ACTIONS \
+                and actions[-1][0] == action:
+                actions[-1] = (action, actions[-1][1] + count)
+            else:
+                actions.append((action, count))
+
+        return actions
@@ -3,8 +3,7 @@ Defines classes that act as application or GUI component controllers.
 
 """
 
-import math
-import time
+from soundcurses import profiling
 
 class MainController:
     """
@@ -12,36 +11,95 @@ class MainController:
 
     Implements a basic state pattern context to provide dynamic behavior change.
 
+    The main loop is event-driven. When a loop iteration receives no input, the
+    controller blocks on the event waiter until terminal input arrives, a
+    network result wakes it, or the scheduler's nearest timer is due.
+
+    Each phase of a loop iteration is reported to a profiler. Unless profiling
+    is enabled, the profiler does nothing.
+
     """
 
-    def __init__(self, input_mapper, state_factory, view, model):
+    def __init__(self, input_mapper, state_factory, view, model, event_waiter,
+        scheduler, profiler=None):
         """
         Constructor.
 
+        Args:
+            event_waiter (EventWaiter): From local events module. Used to sleep
+                between main loop iterations.
+            scheduler (TimerScheduler): From local events module. Runs the timed
+                tasks of states, effects, and the view.
+            profiler (LoopProfiler): From local profiling module. Times the
+                phases of each loop iteration. Defaults to a NullLoopProfiler.
+
         """
         self._application_is_running = False
         self._current_state = None
+        self._event_waiter = event_waiter
         self._input_mapper = input_mapper
         self._model = model
+        self._profiler = profiler or profiling.NullLoopProfiler()
+        self._scheduler = scheduler
         self._state_factory = state_factory
         self._view = view
 
+    def _get_wait_timeout(self):
+        """
+        Determine how long the main loop may sleep before the next timed task.
+
+        Returns:
+            float: Number of seconds, or None if no timers are scheduled.
+
+        """
+        return self._scheduler.time_until_next()
+
+    def _run_loop_iteration(self):
+        """
+        Run a single pass of the main loop.
+
+        Returns:
+            bool: True if input was received during this pass.
+
+        """
+        self._profiler.begin_iteration()
+
+        input_strings = self._view.drain_input(
+            self._input_mapper.is_repeatable_input)
+        self._profiler.mark('sample_input')
+
+        actions = self._input_mapper.resolve_input_sequence(input_strings)
+        for action, count in actions:
+            self._current_state.handle_action(action, count)
+        self._profiler.mark('handle_action')
+
+        self._model.run_interval_tasks()
+        self._profiler.mark('model_interval_tasks')
+        self._current_state.run_interval_tasks()
+        self._profiler.mark('state_interval_tasks')
+        self._scheduler.run_due()
+        self._profiler.mark('timers')
+
+        self._view.render()
+        self._profiler.mark('render')
+
+        self._profiler.end_iteration()
+
+        return bool(input_strings)
+
     def _run_main_loop(self):
         """
         Begin running the main application loop.
 
         Performs such functions as rendering the screen and polling for input.
+        As long as input keeps arriving, no sleep occurs since curses may have
+        buffered more keys than the terminal descriptor reports.
 
         """
         while self._application_is_running:
-            input_string = self._view.sample_input()
-            action = self._input_mapper.resolve_input(input_string)
-
-            self._current_state.handle_action(action)
-            self._current_state.run_interval_tasks()
-
-            self._view.render()
-            self._model.run_interval_tasks()
+            input_received = self._run_loop_iteration()
+            if self._application_is_running and not input_received:
+                self._event_waiter.wait(self._get_wait_timeout())
 
     def set_state(self, state):
         """
@@ -76,4 +134,61 @@ class MainController:
         """
         self._application_is_running = False
         self._view.destroy()
+        self._profiler.export()
 
+
+class AsyncMainController(MainController):
+    """
+    A main controller that runs its main loop as an asyncio coroutine.
+
+    Loop iterations are identical to those of the parent class. Between
+    iterations, the coroutine awaits an AsyncEventWaiter instead of blocking the
+    thread, allowing other coroutines scheduled on the same event loop to run.
+
+    """
+
+    def __init__(self, input_mapper, state_factory, view, model, event_waiter,
+        scheduler, event_loop, profiler=None):
+        """
+        Constructor.
+
+        Args:
+            event_waiter (AsyncEventWaiter): From local events module.
+            event_loop (asyncio.AbstractEventLoop): The loop on which the main
+                loop coroutine is run.
+
+        """
+        super().__init__(input_mapper, state_factory, view, model, event_waiter,
+            scheduler, profiler)
+
+        self._event_loop = event_loop
+
+    async def _run_main_loop_async(self):
+        """
+        Run the main application loop as a coroutine.
+
+        """
+        while self._application_is_running:
+            input_received = self._run_loop_iteration()
+            if self._application_is_running and not input_received:
+                await self._event_waiter.wait(self._get_wait_timeout())
+
+    async def start_application_async(self):
+        """
+        Start the application within an already-running event loop.
+
+        """
+        self._application_is_running = True
+        self._view.render()
+        self.set_state(
+            self._state_factory.create_no_username(self))
+        await self._run_main_loop_async()
+
+    def start_application(self):
+        """
+        Override parent.
+
+        Run the event loop until the application stops.
+
+        """
+        self._event_loop.run_until_complete(self.start_application_async())
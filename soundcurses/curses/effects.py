@@ -6,7 +6,6 @@ TUI effects such as loading indicators.
 import abc
 import functools
 import itertools
-import time
 
 class AbstractAnimation(metaclass=abc.ABCMeta):
     """
@@ -73,43 +72,37 @@ class SimpleSpinner(AbstractAnimation):
     sequential alternation of characters in the set of forward slash, em dash,
     backslash, and pipe.
 
+    Frames are advanced by a repeating timer on the scheduler, so the spinner
+    causes the main loop to wake only once per frame interval.
+
     Attributes:
         _render_targets (list): A list of bound callables (partials). When
             called, will render to bound window at bound coords.
+        _scheduler (TimerScheduler): Runs the frame timer.
+        _timer (Timer): The repeating frame timer while active, None otherwise.
 
     """
-    def __init__(self, screen):
+    def __init__(self, screen, scheduler):
         super().__init__(screen)
 
         self._cols = 1
         self._lines = 1
         self._render_targets = []
+        self._scheduler = scheduler
         self._spinner_chars = ('/', '―', '\\', '|')
         self._spinner_chars_iterator = itertools.cycle(self._spinner_chars)
-        self._timestamp_last_update = 0.0
+        self._timer = None
         self._update_interval = 0.1
 
         self.active = False
 
-    def _handle_screen_render(self, **kwargs):
-        """
-        Handle a screen rendering event.
-
-        Designed to serve as the slot for the screen's signal that the
-        physical curses screen has completed a rendering pass.
-
-        """
-        last_update = self._timestamp_last_update
-        last_render = self._screen.last_render_timestamp
-        if last_render - last_update >= self._update_interval:
-            self._update_all_targets()
-
     def _update_all_targets(self):
         """
         Render next spinner frame to all targets.
 
+        Designed to be called by the frame timer.
+
         """
-        self._timestamp_last_update = time.time()
         character = next(self._spinner_chars_iterator)
         for render in self._render_targets:
             render(character)
@@ -141,10 +134,13 @@ class SimpleSpinner(AbstractAnimation):
     def start(self):
         if not self.active:
             self.active = True
-            self._screen.signal_rendered.connect(self._handle_screen_render)
+            self._update_all_targets()
+            self._timer = self._scheduler.call_repeating(
+                self._update_interval, self._update_all_targets)
 
     def stop(self):
         if self.active:
-            self._screen.signal_rendered.disconnect(self._handle_screen_render)
+            self._timer.cancel()
+            self._timer = None
             self.active = False
 
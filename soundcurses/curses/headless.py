@@ -0,0 +1,655 @@
+"""
+This module defines an in-memory stand-in for the curses library.
+
+The headless backend implements the subset of the curses module and window
+interfaces used by this application. Windows write to cell buffers instead of
+a terminal, and input is read from a script of key strings. It allows the whole
+application to be composed and driven without a TTY, for instance to measure
+frame times in continuous integration.
+
+The semantics of curses are followed where they matter to the application:
+windows are copied to a virtual screen by noutrefresh(), only lines that have
+been touched since the last copy are copied, and the virtual screen is copied
+to the physical screen by doupdate().
+
+"""
+
+import codecs
+import collections
+import os
+import threading
+import time
+
+class HeadlessCursesError(Exception):
+    """
+    Raised where the curses library would raise curses.error.
+
+    """
+    pass
+
+
+class HeadlessCurses:
+    """
+    An in-memory stand-in for the curses module namespace.
+
+    Maintains a virtual and a physical screen, each a grid of (char, attr)
+    cells, and a script of input entries shared by all windows.
+
+    Input scripts are sequences of entries. A string entry is returned by the
+    next call to getkey() or, encoded, by the next call to getstr(). A None entry
+    causes a single call to getkey() to find no key. A float entry is a pause:
+    no key is found for that many seconds, which allows network results to
+    arrive before subsequent keys are read.
+
+    While entries remain and no pause is in progress, the read end of a pipe,
+    input_fd, is kept readable so that the main loop's event waiter does not
+    sleep. Once the script is exhausted, input_fd is no longer readable, so
+    scripts that drive the whole application should end with the quit key.
+
+    Attributes:
+        DEFAULT_COLS (int): Default screen width.
+        DEFAULT_LINES (int): Default screen height.
+        MAX_DIMENSION (int): The largest number of lines or columns of a window
+            or pad. Curses stores dimensions as short integers.
+        cells_copied (int): Total number of cells copied to the virtual screen
+            by noutrefresh().
+        cells_updated (int): Total number of physical screen cells changed by
+            doupdate().
+        update_count (int): Total number of calls to doupdate().
+
+    """
+
+    A_NORMAL = 0
+    A_REVERSE = 1 << 18
+    A_DIM = 1 << 20
+    A_BOLD = 1 << 21
+    ACS_HLINE = ord('-')
+    COLOR_BLACK = 0
+    COLOR_WHITE = 7
+    DEFAULT_COLS = 120
+    DEFAULT_LINES = 40
+    MAX_DIMENSION = 32767
+    error = HeadlessCursesError
+
+    def __init__(self, script=(), lines=DEFAULT_LINES, cols=DEFAULT_COLS):
+        """
+        Constructor.
+
+        Args:
+            script (iterable): Input entries. See class docstring.
+            lines (int): Screen height.
+            cols (int): Screen width.
+
+        """
+        self._echo = False
+        self._input_fd_lock = threading.Lock()
+        self._input_fd_readable = False
+        self._input_fd_read, self._input_fd_write = os.pipe()
+        self._pause_end = None
+        self._physical = self._create_grid(lines, cols)
+        self._script = collections.deque(script)
+        self._virtual = self._create_grid(lines, cols)
+        self.cells_copied = 0
+        self.cells_updated = 0
+        self.COLS = cols
+        self.LINES = lines
+        self.update_count = 0
+
+        self._sync_input_fd()
+
+    @staticmethod
+    def _create_grid(lines, cols, cell=(' ', A_NORMAL)):
+        """
+        Create a grid of cells.
+
+        Returns:
+            list: A list of lines, each a list of (char, attr) tuples.
+
+        """
+        return [[cell] * cols for line in range(lines)]
+
+    def _next_entry(self):
+        """
+        Pop the next input script entry, honouring pauses.
+
+        Raises:
+            HeadlessCursesError: If the script is exhausted or a pause is in
+                progress.
+
+        """
+        try:
+            while isinstance(self._script[0], float):
+                if self._pause_end is None:
+                    self._start_pause(self._script[0])
+                if time.monotonic() < self._pause_end:
+                    raise self.error('No input.')
+                self._script.popleft()
+                self._pause_end = None
+            entry = self._script.popleft()
+        except IndexError:
+            raise self.error('No input.')
+        finally:
+            self._sync_input_fd()
+
+        return entry
+
+    def _start_pause(self, duration):
+        """
+        Begin a pause. A timer thread ends it by making input_fd readable.
+
+        """
+        self._pause_end = time.monotonic() + duration
+        # Timers may fire marginally early. Wait a little longer so that the
+        # pause has surely ended when the timer thread checks.
+        timer = threading.Timer(duration + 0.01, self._sync_input_fd)
+        timer.daemon = True
+        timer.start()
+
+    def _sync_input_fd(self):
+        """
+        Make input_fd readable if and only if an entry can be read.
+
+        May be called from the pause timer thread.
+
+        """
+        with self._input_fd_lock:
+            pausing = self._pause_end is not None \
+                and time.monotonic() < self._pause_end
+            readable = bool(self._script) and not pausing
+            if readable and not self._input_fd_readable:
+                os.write(self._input_fd_write, b'\0')
+                self._input_fd_readable = True
+            elif not readable and self._input_fd_readable:
+                os.read(self._input_fd_read, 1)
+                self._input_fd_readable = False
+
+    def _write_virtual(self, cells, y, x):
+        """
+        Copy a row of cells to the virtual screen, clipped to its bounds.
+
+        """
+        if 0 <= y < self.LINES:
+            row = self._virtual[y]
+            for offset, cell in enumerate(cells):
+                if 0 <= x + offset < self.COLS:
+                    row[x + offset] = cell
+                    self.cells_copied += 1
+
+    def close(self):
+        """
+        Release the input pipe.
+
+        """
+        os.close(self._input_fd_read)
+        os.close(self._input_fd_write)
+
+    def curs_set(self, visibility):
+        pass
+
+    def doupdate(self):
+        """
+        Copy the virtual screen to the physical screen.
+
+        """
+        self.update_count += 1
+        for virtual_row, physical_row in zip(self._virtual, self._physical):
+            for x, cell in enumerate(virtual_row):
+                if physical_row[x] != cell:
+                    physical_row[x] = cell
+                    self.cells_updated += 1
+
+    def echo(self):
+        self._echo = True
+
+    def endwin(self):
+        pass
+
+    def init_pair(self, pair_number, fg, bg):
+        pass
+
+    def initscr(self):
+        """
+        Create a window covering the whole screen.
+
+        Returns:
+            HeadlessWindow: The standard screen window.
+
+        """
+        return self.newwin(self.LINES, self.COLS, 0, 0)
+
+    @property
+    def input_fd(self):
+        """
+        Get the descriptor that is readable while script entries remain.
+
+        Returns:
+            int: A file descriptor.
+
+        """
+        return self._input_fd_read
+
+    def _validate_dimensions(self, lines, cols):
+        """
+        Validate the dimensions of a new or resized window or pad.
+
+        Raises:
+            HeadlessCursesError: If a dimension is not positive or exceeds
+                MAX_DIMENSION.
+
+        """
+        if not 0 < lines <= self.MAX_DIMENSION \
+            or not 0 < cols <= self.MAX_DIMENSION:
+            raise self.error('Invalid window dimensions.')
+
+    def newpad(self, lines, cols):
+        """
+        Create a pad.
+
+        Raises:
+            HeadlessCursesError: If the dimensions are invalid.
+
+        """
+        self._validate_dimensions(lines, cols)
+
+        return HeadlessPad(self, lines, cols)
+
+    def newwin(self, lines, cols, y, x):
+        """
+        Create a window.
+
+        Raises:
+            HeadlessCursesError: If the window does not fit on the screen.
+
+        """
+        if y < 0 or x < 0 or y + lines > self.LINES or x + cols > self.COLS:
+            raise self.error('Window exceeds screen bounds.')
+
+        return HeadlessWindow(self, lines, cols, y, x)
+
+    def noecho(self):
+        self._echo = False
+
+    def resetty(self):
+        pass
+
+    def savetty(self):
+        pass
+
+    def screen_lines(self):
+        """
+        Get the text of the physical screen.
+
+        Returns:
+            list: A string for each screen line.
+
+        """
+        return [''.join(char for char, attr in row) for row in self._physical]
+
+
+class HeadlessWindow:
+    """
+    An in-memory stand-in for a curses window.
+
+    Attributes:
+        _background (tuple): The (char, attr) cell used to fill blank space.
+        _cells (list): A list of lines, each a list of (char, attr) tuples.
+        _curses (HeadlessCurses): The owning screen.
+        _cursor (list): The cursor coords [y, x].
+        _origin (tuple): Screen coords (y, x) of the upper-left corner.
+        _scroll_region (tuple): The first and last lines of the scrolling
+            region, inclusive.
+        _scrolling (bool): True if scrolling is enabled by scrollok().
+        _touched (list): A boolean per line. True if the line has changed since
+            the window was last copied to the virtual screen.
+
+    """
+
+    def __init__(self, curses, lines, cols, y=0, x=0):
+        """
+        Constructor.
+
+        """
+        self._background = (' ', curses.A_NORMAL)
+        self._cells = curses._create_grid(lines, cols)
+        self._curses = curses
+        self._cursor = [0, 0]
+        self._origin = (y, x)
+        self._scroll_region = (0, lines - 1)
+        self._scrolling = False
+        self._touched = [True] * lines
+
+    def _put(self, y, x, char, attr):
+        """
+        Write a single cell and mark its line touched.
+
+        """
+        self._cells[y][x] = (char, attr | self._background[1])
+        self._touched[y] = True
+
+    def _validate_coords(self, y, x):
+        """
+        Raises:
+            HeadlessCursesError: If coords lie outside the window.
+
+        """
+        lines, cols = self.getmaxyx()
+        if not (0 <= y < lines and 0 <= x < cols):
+            raise self._curses.error('Coords exceed window bounds.')
+
+    def addstr(self, *args):
+        """
+        Write a string at the given coords or at the cursor.
+
+        Accepts the same argument forms as curses: (str), (str, attr),
+        (y, x, str), and (y, x, str, attr). Strings wrap at the right edge.
+
+        Raises:
+            HeadlessCursesError: If the string runs past the end of the window.
+                As with curses, the characters that fit are still written.
+
+        """
+        if isinstance(args[0], str):
+            (y, x), args = self._cursor, args
+        else:
+            y, x, args = args[0], args[1], args[2:]
+        string = args[0]
+        attr = args[1] if len(args) > 1 else self._curses.A_NORMAL
+        self._validate_coords(y, x)
+
+        lines, cols = self.getmaxyx()
+        for char in string:
+            if y >= lines:
+                raise self._curses.error('String exceeds window bounds.')
+            if char == '\n':
+                for clear_x in range(x, cols):
+                    self._put(y, clear_x, self._background[0], 0)
+                y, x = y + 1, 0
+                continue
+            self._put(y, x, char, attr)
+            x += 1
+            if x == cols:
+                y, x = y + 1, 0
+        self._cursor = [y, x]
+
+    def bkgd(self, char, attr=0):
+        """
+        Set the background and apply it to every cell.
+
+        """
+        old_char = self._background[0]
+        self._background = (char, attr)
+        for y, row in enumerate(self._cells):
+            for x, (cell_char, cell_attr) in enumerate(row):
+                if cell_char == old_char:
+                    cell_char = char
+                self._put(y, x, cell_char, cell_attr)
+
+    def border(self, ls=0, rs=0, ts=0, bs=0, tl=0, tr=0, bl=0, br=0):
+        """
+        Draw a border. Characters may be strings or ints. Zero selects the
+        default character.
+
+        """
+        def resolve(char, default):
+            if char == 0:
+                return default
+            return char if isinstance(char, str) else chr(char)
+
+        lines, cols = self.getmaxyx()
+        normal = self._curses.A_NORMAL
+        for y in range(1, lines - 1):
+            self._put(y, 0, resolve(ls, '|'), normal)
+            self._put(y, cols - 1, resolve(rs, '|'), normal)
+        for x in range(1, cols - 1):
+            self._put(0, x, resolve(ts, '-'), normal)
+            self._put(lines - 1, x, resolve(bs, '-'), normal)
+        self._put(0, 0, resolve(tl, '+'), normal)
+        self._put(0, cols - 1, resolve(tr, '+'), normal)
+        self._put(lines - 1, 0, resolve(bl, '+'), normal)
+        self._put(lines - 1, cols - 1, resolve(br, '+'), normal)
+
+    def chgat(self, *args):
+        """
+        Change the attributes of characters without changing the characters.
+
+        Accepts the same argument forms as curses: (attr), (num, attr),
+        (y, x, attr), and (y, x, num, attr). A num of -1 extends to the end of
+        the line.
+
+        """
+        num = -1
+        if len(args) == 1:
+            (y, x), attr = self._cursor, args[0]
+        elif len(args) == 2:
+            (y, x), (num, attr) = self._cursor, args
+        elif len(args) == 3:
+            y, x, attr = args
+        else:
+            y, x, num, attr = args
+        self._validate_coords(y, x)
+
+        cols = self.getmaxyx()[1]
+        end_x = cols if num < 0 else min(cols, x + num)
+        for cell_x in range(x, end_x):
+            self._put(y, cell_x, self._cells[y][cell_x][0], attr)
+
+    def clear(self):
+        self.erase()
+
+    def erase(self):
+        """
+        Fill the window with the background.
+
+        """
+        for y, row in enumerate(self._cells):
+            for x in range(len(row)):
+                self._put(y, x, self._background[0], 0)
+        self._cursor = [0, 0]
+
+    def getbegyx(self):
+        return self._origin
+
+    def idlok(self, flag):
+        pass
+
+    def getkey(self, *args):
+        """
+        Get the next key from the input script.
+
+        Raises:
+            HeadlessCursesError: If the script is exhausted or its next entry is
+                None, as curses does when no key is pending in no-delay mode.
+
+        """
+        key = self._curses._next_entry()
+        if key is None:
+            raise self._curses.error('No input.')
+
+        return key
+
+    def getmaxyx(self):
+        return (len(self._cells), len(self._cells[0]))
+
+    def getstr(self, *args):
+        """
+        Get the next string from the input script.
+
+        Returns:
+            bytes: The string encoded as UTF-8.
+
+        Raises:
+            HeadlessCursesError: If the script is exhausted.
+
+        """
+        if len(args) >= 2:
+            self._cursor = [args[0], args[1]]
+        string = self._curses._next_entry() or ''
+        if self._curses._echo:
+            self.addstr(string)
+
+        return string.encode('utf-8')
+
+    def getyx(self):
+        return tuple(self._cursor)
+
+    def is_linetouched(self, line):
+        return self._touched[line]
+
+    def is_wintouched(self):
+        return any(self._touched)
+
+    def keypad(self, flag):
+        pass
+
+    def mvwin(self, y, x):
+        """
+        Move the window on the screen.
+
+        Raises:
+            HeadlessCursesError: If the window would not fit on the screen.
+
+        """
+        lines, cols = self.getmaxyx()
+        if (y < 0 or x < 0
+            or y + lines > self._curses.LINES
+            or x + cols > self._curses.COLS):
+            raise self._curses.error('Window exceeds screen bounds.')
+        self._origin = (y, x)
+
+    def nodelay(self, flag):
+        pass
+
+    def noutrefresh(self):
+        """
+        Copy touched lines to the virtual screen.
+
+        """
+        origin_y, origin_x = self._origin
+        for y, row in enumerate(self._cells):
+            if self._touched[y]:
+                self._curses._write_virtual(row, origin_y + y, origin_x)
+        self.untouchwin()
+
+    def refresh(self, *args):
+        self.noutrefresh(*args)
+        self._curses.doupdate()
+
+    def resize(self, lines, cols):
+        """
+        Change the window dimensions, keeping the content that still fits.
+
+        Raises:
+            HeadlessCursesError: If the dimensions are invalid.
+
+        """
+        self._curses._validate_dimensions(lines, cols)
+        old_cells = self._cells
+        self._cells = self._curses._create_grid(lines, cols, self._background)
+        for y, row in enumerate(old_cells[:lines]):
+            self._cells[y][:len(row[:cols])] = row[:cols]
+        self._scroll_region = (0, lines - 1)
+        self._touched = [True] * lines
+
+    def scroll(self, lines=1):
+        """
+        Scroll the lines of the scrolling region up, or down if negative.
+
+        Lines scrolled into view are filled with the background and every line
+        of the region is touched.
+
+        Raises:
+            HeadlessCursesError: If scrolling is not enabled.
+
+        """
+        if not self._scrolling:
+            raise self._curses.error('Scrolling is not enabled.')
+
+        top, bottom = self._scroll_region
+        region = self._cells[top:bottom + 1]
+        cols = self.getmaxyx()[1]
+        blank_lines = self._curses._create_grid(
+            min(abs(lines), len(region)), cols, (self._background[0], 0))
+        if lines >= 0:
+            region = region[lines:] + blank_lines
+        else:
+            region = blank_lines + region[:lines]
+        self._cells[top:bottom + 1] = region
+        self.touchline(top, bottom - top + 1)
+
+    def scrollok(self, flag):
+        self._scrolling = flag
+
+    def setscrreg(self, top, bottom):
+        """
+        Set the scrolling region to the lines from top to bottom, inclusive.
+
+        Raises:
+            HeadlessCursesError: If the lines lie outside the window.
+
+        """
+        if not 0 <= top < bottom < self.getmaxyx()[0]:
+            raise self._curses.error('Invalid scrolling region.')
+        self._scroll_region = (top, bottom)
+
+    def touchline(self, start, count, changed=True):
+        for y in range(start, min(start + count, len(self._touched))):
+            self._touched[y] = changed
+
+    def touchwin(self):
+        self._touched = [True] * len(self._touched)
+
+    def untouchwin(self):
+        self._touched = [False] * len(self._touched)
+
+
+class HeadlessPad(HeadlessWindow):
+    """
+    An in-memory stand-in for a curses pad.
+
+    """
+
+    def noutrefresh(self, pminrow, pmincol, sminrow, smincol, smaxrow,
+        smaxcol):
+        """
+        Copy a rectangle of the pad to a rectangle of the virtual screen.
+
+        As with curses, the screen rectangle is inclusive of its maximum coords.
+        Lines are copied whether touched or not, and only the copied lines are
+        untouched.
+
+        """
+        for offset_y in range(smaxrow - sminrow + 1):
+            pad_y = pminrow + offset_y
+            if pad_y >= len(self._cells):
+                break
+            row = self._cells[pad_y][pmincol:pmincol + smaxcol - smincol + 1]
+            self._curses._write_virtual(row, sminrow + offset_y, smincol)
+            self._touched[pad_y] = False
+
+
+def load_script(path):
+    """
+    Load an input script from a file.
+
+    Each line of the file is one entry. Backslash escapes such as \\t are
+    decoded. Empty lines are None entries. Lines of the form "@wait SECONDS"
+    are pauses.
+
+    Args:
+        path (str): The script file path.
+
+    Returns:
+        list: The input entries.
+
+    """
+    script = []
+    with open(path) as script_file:
+        for line in script_file.read().splitlines():
+            if not line:
+                script.append(None)
+            elif line.startswith('@wait '):
+                script.append(float(line.split()[1]))
+            else:
+                script.append(codecs.decode(line, 'unicode_escape'))
+
+    return script
@@ -28,6 +28,8 @@ class ContentRegion:
     Attributes:
         _lines (dict): A dictionary of line strings, keyed by line identifiers
             that are passed by and later needed by the controller.
+        _page_index (PageIndex): The line numbers of each page, used to find
+            the pages containing a line in constant time.
 
     """
 
@@ -51,6 +53,7 @@ class ContentRegion:
         self._curses = curses
         self._window = window
         self._lines_list = []
+        self._page_index = None
         self._pages = None
         self._string_factory = string_factory
 
@@ -123,45 +126,36 @@ class ContentRegion:
         """
         pages = []
         if lines_list:
-            overlap_lines = math.floor(self._avail_lines * 0.08)
-            origin_coords = self._avail_origin
-            start_index = 0
-            end_index = self._avail_lines
-
-            while True:
-                current_page_dict = collections.OrderedDict()
-                current_page_lines = lines_list[start_index:end_index]
-                current_line_number = start_index
-
-                i = 0
-                for line in current_page_lines:
-                    current_page_dict[current_line_number] = \
-                        self._string_factory.create_string(
-                            self._window,
-                            line[0:self._avail_cols],
-                            origin_coords[0] + i,
-                            origin_coords[1])
-                    current_line_number += 1
-                    i += 1
-                pages.append(current_page_dict)
-
-                lines_count = len(lines_list)
-                if end_index < lines_count:
-                    if lines_count - end_index - overlap_lines < \
-                        self._avail_lines:
-                        start_index = lines_count - self._avail_lines
-                        end_index = lines_count
-                    else:
-                        start_index = end_index - overlap_lines
-                        end_index += self._avail_lines - overlap_lines
-                else:
-                    break
+            for page_range in self._page_index:
+                pages.append(self._create_page(page_range))
         else:
             pages.append({0: self._string_factory.create_string(
                 self._window, '', *self._avail_origin)})
 
         return pages
 
+    def _create_page(self, page_range):
+        """
+        Create the line strings of a page of the current list of lines.
+
+        Args:
+            page_range (range): The line numbers of the page.
+
+        Returns:
+            collections.OrderedDict: Line strings keyed by line number.
+
+        """
+        origin_coords = self._avail_origin
+        page = collections.OrderedDict()
+        for i, line_number in enumerate(page_range):
+            page[line_number] = self._string_factory.create_string(
+                self._window,
+                self._lines_list[line_number][0:self._avail_cols],
+                origin_coords[0] + i,
+                origin_coords[1])
+
+        return page
+
     @property
     def _current_line(self):
         """
@@ -184,6 +178,23 @@ class ContentRegion:
         """
         return self._pages[self._current_page_number]
 
+    def _create_page_index(self, lines_count):
+        """
+        Divide a number of lines into pages.
+
+        Args:
+            lines_count (int): The number of lines of content. If zero, the
+                index contains a single page for the single, empty line.
+
+        Returns:
+            PageIndex
+
+        """
+        return PageIndex(
+            max(lines_count, 1),
+            self._avail_lines,
+            math.floor(self._avail_lines * 0.08))
+
     def _init_pages(self):
         """
         Initialize an empty page and valid "empty" default instance state.
@@ -191,6 +202,7 @@ class ContentRegion:
         Called in constructor.
 
         """
+        self._page_index = self._create_page_index(0)
         self._pages = self._create_pages([])
         self._current_page_number = 0
         self._current_line_number = 0
@@ -216,7 +228,7 @@ class ContentRegion:
         if page_number not in range(0, self.page_count):
             raise ValueError(
                 'Page number "' + str(page_number) + '" does not exist.')
-        if line_number not in self._pages[page_number].keys():
+        if line_number not in self._pages[page_number]:
             raise ValueError(
                 'Line number "' + str(line_number) + '" '
                 + 'not found in page number "' + str(page_number) + '".')
@@ -265,6 +277,63 @@ class ContentRegion:
         for line in self._current_page.values():
             line.write()
 
+    def _extend_pages(self, kept_page_count, old_lines_count):
+        """
+        Update the pages after lines have been appended.
+
+        The page index has already been updated. Pages from kept_page_count
+        onward are recreated.
+
+        Args:
+            kept_page_count (int): The number of leading pages left unchanged.
+            old_lines_count (int): The number of lines before the append.
+
+        Returns:
+            list: The pages.
+
+        """
+        del self._pages[kept_page_count:]
+        for page_number in range(kept_page_count, len(self._page_index)):
+            self._pages.append(self._create_page(self._page_index[page_number]))
+
+        return self._pages
+
+    def append_lines(self, lines_list):
+        """
+        Append lines to the content without repaginating existing lines.
+
+        Appended lines only affect the last page, which is aligned with the last
+        line, and the pages that follow it. If any other page is displayed, the
+        region is not repainted and the selection is left unchanged. Otherwise,
+        the page containing the selected line that is furthest into the content
+        is displayed so that appended lines become visible.
+
+        Args:
+            lines_list (list): A list of line strings.
+
+        """
+        if not lines_list:
+            return
+        if not self._lines_list:
+            self.content_lines = lines_list
+            return
+
+        kept_page_count = self.page_count - 1
+        repaint = self._current_page_number >= kept_page_count
+        if repaint:
+            self.erase()
+
+        old_lines_count = len(self._lines_list)
+        self._lines_list.extend(lines_list)
+        self._page_index = self._create_page_index(len(self._lines_list))
+        self._pages = self._extend_pages(kept_page_count, old_lines_count)
+
+        if repaint:
+            self._current_page_number = \
+                self._page_index.last_page_with_line(self._current_line_number)
+            self._write_page_lines()
+            self._current_line.style_reverse()
+
     @property
     def content_lines(self):
         """
@@ -290,9 +359,11 @@ class ContentRegion:
 
         """
         self.erase()
-        self._lines_list = lines_list
+        self._lines_list = list(lines_list)
+        self._page_index = self._create_page_index(len(self._lines_list))
         self._pages = self._create_pages(self._lines_list)
         self._current_page_number = 0
+        self._current_line_number = 0
         self._write_page_lines()
         self._select_line(self._current_page_number, 0)
 
@@ -329,45 +400,116 @@ class ContentRegion:
         for line in self._current_page.values():
             line.erase()
 
-    def line_next(self):
+    @property
+    def _last_line_number(self):
+        """
+        Get the line number of the last line of content.
+
+        Returns:
+            int: The index of the last line. Zero if there is no content.
+
+        """
+        return max(len(self._lines_list) - 1, 0)
+
+    def line_first(self):
         """
-        Select the next line of content.
+        Select the first line of content.
 
-        If the currently-selected line is the last in the page, then this method
-        will automatically display the first page that contains the desired
-        line. NOOP if no further pages or line number is not present in any
-        following pages.
+        The first page is displayed if it is not already.
 
         """
-        next_line_number = self._current_line_number + 1
-        next_page_number = self._current_page_number + 1
-        if next_line_number in self._current_page.keys():
+        self.line_go_to(0)
+
+    def line_go_to(self, line_number):
+        """
+        Select a line of content by number.
+
+        The target page is computed from the page index, so the region is
+        repainted at most once regardless of the distance moved. A line number
+        past either end of the content selects the nearest line.
+
+        Args:
+            line_number (int): The index of the line to select.
+
+        """
+        line_number = min(max(line_number, 0), self._last_line_number)
+        if line_number > self._current_line_number:
+            self.line_next(line_number - self._current_line_number)
+        else:
+            self.line_previous(self._current_line_number - line_number)
+
+    def line_last(self):
+        """
+        Select the last line of content.
+
+        The last page is displayed if it is not already.
+
+        """
+        self.line_go_to(self._last_line_number)
+
+    def line_next(self, count=1):
+        """
+        Select a following line of content.
+
+        If the desired line is not in the current page, then this method will
+        automatically display the first following page that contains the
+        desired line. The region is repainted at most once, regardless of
+        count. If fewer than count lines follow, the last line is selected.
+        NOOP if the last line is already selected.
+
+        Args:
+            count (int): The number of lines by which to move.
+
+        """
+        next_line_number = min(
+            self._current_line_number + count, self._last_line_number)
+        if next_line_number == self._current_line_number:
+            return
+
+        if next_line_number in self._current_page:
             self._select_line(self._current_page_number, next_line_number)
-        elif next_page_number < self.page_count:
-            for page_number in range(next_page_number, self.page_count):
-                if next_line_number in self._pages[page_number].keys():
-                    self._select_line(page_number, next_line_number)
-                    break
+        else:
+            self._select_line(
+                self._page_index.first_page_with_line(next_line_number),
+                next_line_number)
 
-    def line_previous(self):
+    def line_percent(self, percent):
         """
-        Select the previous line of content.
+        Select the line a percentage of the way through the content.
+
+        Zero percent selects the first line and 100 percent the last.
 
-        If the currently-selected line is first in the page, then this method
-        will automatically display the first page that contains the desired
-        line. NOOP if no other pages or line number is not present in any
-        previous pages.
+        Args:
+            percent (int): The percentage, clamped to the range 0 to 100.
 
         """
-        prev_line_number = self._current_line_number - 1
-        prev_page_number = self._current_page_number - 1
-        if prev_line_number in self._current_page.keys():
+        percent = min(max(percent, 0), 100)
+        self.line_go_to(self._last_line_number * percent // 100)
+
+    def line_previous(self, count=1):
+        """
+        Select a preceding line of content.
+
+        If the desired line is not in the current page, then this method will
+        automatically display the nearest preceding page that contains the
+        desired line. The region is repainted at most once, regardless of
+        count. If fewer than count lines precede, the first line is selected.
+        NOOP if the first line is already selected.
+
+        Args:
+            count (int): The number of lines by which to move.
+
+        """
+        prev_line_number = max(self._current_line_number - count, 0)
+        if prev_line_number == self._current_line_number:
+            return
+
+        if prev_line_number in self._current_page:
             self._select_line(self._current_page_number, prev_line_number)
-        elif prev_page_number >= 0:
-            for page_number in reversed(range(0, self.current_page_number)):
-                if prev_line_number in self._pages[page_number].keys():
-                    self._select_line(page_number, prev_line_number)
-                    break
+        else:
+            self._select_line(
+                self._page_index.last_page_with_line(prev_line_number),
+                prev_line_number)
 
     @property
     def page_count(self):
@@ -380,37 +522,579 @@ class ContentRegion:
         """
         return len(self._pages)
 
-    def page_next(self):
+    def page_next(self, count=1):
+        """
+        Replace region content with that of a following page, if it exists.
+
+        The first line of the new page is selected. If fewer than count pages
+        follow, the last page is displayed. NOOP if the last page is already
+        displayed.
+
+        Args:
+            count (int): The number of pages by which to move.
+
+        """
+        page_number = min(
+            self._current_page_number + count, self.page_count - 1)
+        if page_number != self._current_page_number:
+            self._select_line(
+                page_number, self._page_index.page_start(page_number))
+
+    def page_previous(self, count=1):
         """
-        Replace region content with that of next page, if it exists.
+        Replace region content with that of a preceding page, if it exists.
 
-        NOOP if next page oes not exist.
+        The first line of the new page is selected. If fewer than count pages
+        precede, the first page is displayed. NOOP if the first page is already
+        displayed.
+
+        Args:
+            count (int): The number of pages by which to move.
 
         """
-        try:
-            self._current_line.style_normal()
-            self._set_current_page_number(self._current_page_number + 1)
-        except ValueError:
-            self._current_line.style_reverse()
+        page_number = max(self._current_page_number - count, 0)
+        if page_number != self._current_page_number:
+            self._select_line(
+                page_number, self._page_index.page_start(page_number))
+
+
+class ContentRegionPad(ContentRegion):
+    """
+    A content region that scrolls a pad instead of rewriting lines.
+
+    Lines of content are written to a curses pad once, when the content is
+    set. The pad is displayed within the writable area of the region's window,
+    on a render layer above it. Changing pages only moves the pad's visible
+    origin, so the next render copies the visible lines of the pad without any
+    line being erased or rewritten.
+
+    Curses limits the dimensions of a pad to PAD_MAX_LINES lines. Longer
+    content is written to the pad a window of PAD_MAX_LINES lines at a time.
+    When a page outside of the window is displayed, the pad is rewritten with
+    a window centered on that page.
+
+    Attributes:
+        PAD_MAX_LINES (int): The largest number of lines curses allows in a pad.
+        _line_strings (list): The line string of every line in the pad, in
+            order.
+        _pad (CursesPad): The pad to which the lines are written.
+        _pad_first_line_number (int): The line number of the first line of the
+            pad.
+        _page_lines (collections.OrderedDict): The line strings of the current
+            page, keyed by line number.
+        _pages (PageIndex): A range of line numbers per page.
+
+    """
+
+    PAD_MAX_LINES = 32767
+
+    def __init__(self, window, curses, string_factory, screen, window_factory):
+        """
+        Constructor.
+
+        Args:
+            window (CursesWindow): An initial window that defines the screen
+                area in which the content region is free to write.
+            curses (curses): The curses library interface.
+            string_factory (CursesStringFactory): Used to create CursesStrings
+                at runtime.
+            screen (CursesScreen): The screen to which the pad is added.
+            window_factory (CursesWindowFactory): Used to create the pad.
+
+        """
+        self._line_strings = []
+        self._pad = None
+        self._pad_first_line_number = 0
+        self._page_lines = collections.OrderedDict()
+        self._screen = screen
+        self._window_factory = window_factory
+
+        super().__init__(window, curses, string_factory)
+
+    def _create_pad(self, lines):
+        """
+        Create the pad and add it to the screen.
+
+        The pad is one column wider than the writable area so that a line may
+        fill the area without curses raising an error for writing to the last
+        cell of the pad.
+
+        Args:
+            lines (int): The number of lines of the pad.
+
+        Returns:
+            CursesPad
+
+        """
+        window_origin = self._window.box.origin
+        clipping_box = self._window_factory.create_box_coords(
+            self._avail_lines,
+            self._avail_cols,
+            (window_origin[0] + self._avail_origin[0],
+                window_origin[1] + self._avail_origin[1]))
+        pad = self._window_factory.create_pad(
+            lines,
+            self._avail_cols + 1,
+            (0, 0),
+            clipping_box,
+            render_layer=self._screen.RENDER_LAYER_REGION_PADS)
+        self._screen.add_window(pad)
+
+        return pad
+
+    def _create_pages(self, lines_list):
+        """
+        Override parent.
+
+        Writes the first window of lines to the pad.
+
+        Returns:
+            PageIndex: The page index, which is a sequence of ranges of line
+                numbers.
+
+        """
+        if self._pad is None:
+            self._pad = self._create_pad(self._pad_lines_count)
+        self._write_pad(0)
+        if not lines_list:
+            self._line_strings.append(
+                self._string_factory.create_string(self._pad, '', 0, 0))
+            self._line_strings[0].write()
+
+        return self._page_index
+
+    @property
+    def _current_page(self):
+        """
+        Override parent.
+
+        Returns:
+            collections.OrderedDict: The line strings of the current page.
+
+        """
+        return self._page_lines
+
+    def _extend_pages(self, kept_page_count, old_lines_count):
+        """
+        Override parent.
+
+        If the pad holds the last lines, the appended lines are written to it.
+        The pad grows by at least double its lines, up to PAD_MAX_LINES, so
+        that resizing is infrequent. Appended lines that do not fit are written
+        when a page containing them is displayed.
+
+        Returns:
+            PageIndex: The updated page index.
+
+        """
+        pad_end = self._pad_first_line_number + len(self._line_strings)
+        if pad_end == old_lines_count:
+            needed_lines = len(self._lines_list) - self._pad_first_line_number
+            if needed_lines > self._pad.lines \
+                and self._pad.lines < self.PAD_MAX_LINES:
+                self._pad.resize(
+                    min(max(needed_lines, 2 * self._pad.lines),
+                        self.PAD_MAX_LINES),
+                    self._avail_cols + 1)
+            self._write_lines(old_lines_count)
+
+        return self._page_index
+
+    @property
+    def _pad_lines_count(self):
+        """
+        Get the number of pad lines needed for the current content.
+
+        Returns:
+            int: At least the available lines and at most PAD_MAX_LINES.
+
+        """
+        return min(
+            max(len(self._lines_list), self._avail_lines), self.PAD_MAX_LINES)
+
+    def _write_lines(self, start_line_number):
+        """
+        Create line strings for lines not yet written and write them to the pad.
+
+        Lines are written until the pad is full.
+
+        Args:
+            start_line_number (int): The first line to write.
+
+        """
+        end_line_number = min(
+            len(self._lines_list), self._pad_first_line_number + self._pad.lines)
+        for line_number in range(start_line_number, end_line_number):
+            line_string = self._string_factory.create_string(
+                self._pad,
+                self._lines_list[line_number][0:self._avail_cols],
+                line_number - self._pad_first_line_number,
+                0)
+            line_string.write()
+            self._line_strings.append(line_string)
+
+    def _write_page_lines(self):
+        """
+        Override parent.
+
+        The lines are normally already written to the pad, so the pad is
+        scrolled to the first line of the current page. If the page lies
+        outside of the pad, the pad is first rewritten with a window of lines
+        centered on the page.
+
+        """
+        page_range = self._pages[self._current_page_number]
+        if self._lines_list and (
+            page_range.start < self._pad_first_line_number
+            or page_range.stop > self._pad_first_line_number
+                + len(self._line_strings)):
+            pad_lines = self._pad_lines_count
+            self._write_pad(max(0, min(
+                page_range.start - (pad_lines - len(page_range)) // 2,
+                len(self._lines_list) - pad_lines)))
+
+        self._page_lines = collections.OrderedDict(
+            (line_number,
+                self._line_strings[line_number - self._pad_first_line_number])
+            for line_number in page_range)
+        self._pad.visible_origin = (
+            page_range.start - self._pad_first_line_number, 0)
+
+    def _write_pad(self, first_line_number):
+        """
+        Erase the pad and write a window of lines to it.
+
+        The pad is resized to the number of lines needed by the content.
+
+        Args:
+            first_line_number (int): The line number of the first line of the
+                window.
+
+        """
+        self._pad.erase()
+        if self._pad.lines != self._pad_lines_count:
+            self._pad.resize(self._pad_lines_count, self._avail_cols + 1)
+        self._pad_first_line_number = first_line_number
+        self._line_strings = []
+        self._write_lines(first_line_number)
+
+    def erase(self):
+        """
+        Override parent.
+
+        Pages share the lines written to the pad, so nothing is erased when the
+        page changes. The pad is erased when it is rewritten.
+
+        """
+        pass
+
+
+class ContentRegionVirtual(ContentRegion):
+    """
+    A content region that creates line strings only for the displayed page.
+
+    Only the list of line strings and the line number range of each page are
+    kept. Line strings for the lines of the current page are created when the
+    page is displayed and discarded when another page is displayed, so the
+    number of objects created when content is set does not grow with the
+    number of lines.
+
+    Attributes:
+        _page_lines (collections.OrderedDict): The line strings of the current
+            page, keyed by line number.
+        _pages (PageIndex): A range of line numbers per page.
+
+    """
+
+    def __init__(self, window, curses, string_factory):
+        """
+        Constructor.
+
+        See the parent class.
+
+        """
+        self._page_lines = collections.OrderedDict()
+
+        super().__init__(window, curses, string_factory)
+
+    def _create_pages(self, lines_list):
+        """
+        Override parent.
+
+        Returns:
+            PageIndex: The page index, which is a sequence of ranges of line
+                numbers.
+
+        """
+        return self._page_index
+
+    @property
+    def _current_page(self):
+        """
+        Override parent.
+
+        Returns:
+            collections.OrderedDict: The line strings of the current page.
+
+        """
+        return self._page_lines
+
+    @property
+    def _displayed_range(self):
+        """
+        Get the line numbers of the lines to display.
+
+        Returns:
+            range: The line numbers of the current page.
+
+        """
+        return self._pages[self._current_page_number]
+
+    def _write_page_lines(self):
+        """
+        Override parent.
+
+        Creates the line strings of the current page, then renders them.
+
+        """
+        if self._lines_list:
+            self._page_lines = self._create_page(self._displayed_range)
         else:
-            self._current_line_number = list(self._current_page.keys())[0]
-            self._current_line.style_reverse()
+            self._page_lines = collections.OrderedDict({
+                0: self._string_factory.create_string(
+                    self._window, '', *self._avail_origin)})
 
-    def page_previous(self):
+        super()._write_page_lines()
+
+    def _extend_pages(self, kept_page_count, old_lines_count):
         """
-        Replace region content with that of previous page, if it exists.
+        Override parent.
 
-        NOOP if previous page oes not exist.
+        Returns:
+            PageIndex: The updated page index.
 
         """
-        try:
-            self._current_line.style_normal()
-            self._set_current_page_number(self._current_page_number - 1)
-        except ValueError:
-            self._current_line.style_reverse()
+        return self._page_index
+
+
+class ContentRegionScroll(ContentRegionVirtual):
+    """
+    A content region that scrolls line by line.
+
+    Rather than flipping between pages, the region displays the lines from a
+    top line onward and scrolls the window whenever the selection moves past
+    its top or bottom edge. Scrolling uses the window's scrolling region so
+    that only the lines scrolled into view are written. With idlok() enabled,
+    curses may use the terminal's own line scrolling to update the screen, so
+    moving the selection through a long list sends little output.
+
+    Page movements scroll to the start of a page of the page index. The
+    current page is the last page containing the top line.
+
+    Attributes:
+        _top_line_number (int): The number of the first line displayed.
+
+    """
+
+    def __init__(self, window, curses, string_factory):
+        """
+        Constructor.
+
+        See the parent class.
+
+        """
+        self._top_line_number = 0
+
+        super().__init__(window, curses, string_factory)
+
+    def _configure(self):
+        """
+        Override parent.
+
+        Also restricts scrolling to the writable area.
+
+        """
+        super()._configure()
+        avail_top = self._avail_origin[0]
+        self._window.scrollok(True)
+        self._window.idlok(True)
+        self._window.setscrreg(avail_top, avail_top + self._avail_lines - 1)
+
+    def _create_pages(self, lines_list):
+        """
+        Override parent.
+
+        Also returns the display to the first line.
+
+        """
+        self._top_line_number = 0
+
+        return super()._create_pages(lines_list)
+
+    @property
+    def _displayed_range(self):
+        """
+        Override parent.
+
+        Returns:
+            range: The line numbers of the lines from the top line onward that
+                fit in the region.
+
+        """
+        return range(
+            self._top_line_number,
+            min(self._top_line_number + self._avail_lines,
+                len(self._lines_list)))
+
+    def _move_selection(self, line_number, top_line_number):
+        """
+        Scroll to a top line and select a line.
+
+        Args:
+            line_number (int): The line to select. Must be displayed once the
+                region has scrolled to top_line_number.
+            top_line_number (int): The new top line.
+
+        """
+        self._current_line.style_normal()
+        self._scroll_to(top_line_number)
+        self._current_line_number = line_number
+        self._current_line.style_reverse()
+
+    def _scroll_to(self, top_line_number):
+        """
+        Display the lines from a new top line onward.
+
+        If the new top line is less than a page away, the window is scrolled
+        and only the lines scrolled into view are written. Otherwise, the
+        region is repainted.
+
+        Args:
+            top_line_number (int)
+
+        """
+        scroll_lines = top_line_number - self._top_line_number
+        if scroll_lines == 0:
+            return
+
+        if abs(scroll_lines) >= self._avail_lines:
+            self.erase()
+            self._top_line_number = top_line_number
+            self._write_page_lines()
         else:
-            self._current_line_number = list(self._current_page.keys())[0]
-            self._current_line.style_reverse()
+            self._window.scroll(scroll_lines)
+            self._top_line_number = top_line_number
+            displayed_range = self._displayed_range
+            page_lines = collections.OrderedDict()
+            for line_number in displayed_range:
+                line = self._page_lines.get(line_number)
+                if line is None:
+                    line = self._string_factory.create_string(
+                        self._window,
+                        self._lines_list[line_number][0:self._avail_cols],
+                        self._avail_origin[0]
+                            + line_number - displayed_range.start,
+                        self._avail_origin[1])
+                    line.write()
+                else:
+                    line.scroll(scroll_lines)
+                page_lines[line_number] = line
+            self._page_lines = page_lines
+
+        self._current_page_number = \
+            self._page_index.last_page_with_line(self._top_line_number)
+
+    def append_lines(self, lines_list):
+        """
+        Override parent.
+
+        The display does not move. Appended lines that fit below the last
+        displayed line are written.
+
+        """
+        if not lines_list:
+            return
+        if not self._lines_list:
+            self.content_lines = lines_list
+            return
+
+        old_lines_count = len(self._lines_list)
+        self._lines_list.extend(lines_list)
+        self._page_index = self._create_page_index(len(self._lines_list))
+        self._pages = self._page_index
+        self._current_page_number = \
+            self._page_index.last_page_with_line(self._top_line_number)
+
+        displayed_range = self._displayed_range
+        for line_number in range(old_lines_count, displayed_range.stop):
+            line = self._string_factory.create_string(
+                self._window,
+                self._lines_list[line_number][0:self._avail_cols],
+                self._avail_origin[0] + line_number - displayed_range.start,
+                self._avail_origin[1])
+            line.write()
+            self._page_lines[line_number] = line
+
+    def line_next(self, count=1):
+        """
+        Override parent.
+
+        Scrolls just enough to display the newly selected line at the bottom
+        edge if it is below the display.
+
+        """
+        next_line_number = min(
+            self._current_line_number + count, self._last_line_number)
+        if next_line_number == self._current_line_number:
+            return
+
+        self._move_selection(
+            next_line_number,
+            max(self._top_line_number,
+                next_line_number - self._avail_lines + 1))
+
+    def line_previous(self, count=1):
+        """
+        Override parent.
+
+        Scrolls just enough to display the newly selected line at the top edge
+        if it is above the display.
+
+        """
+        prev_line_number = max(self._current_line_number - count, 0)
+        if prev_line_number == self._current_line_number:
+            return
+
+        self._move_selection(
+            prev_line_number, min(self._top_line_number, prev_line_number))
+
+    def page_next(self, count=1):
+        """
+        Override parent.
+
+        Scrolls to the start of a following page and selects its first line.
+
+        """
+        page_number = min(
+            self._current_page_number + count, self.page_count - 1)
+        page_start = self._page_index.page_start(page_number)
+        if page_start > self._top_line_number:
+            self._move_selection(page_start, page_start)
+
+    def page_previous(self, count=1):
+        """
+        Override parent.
+
+        Scrolls to the start of a preceding page, or of the current page if the
+        display is part way through it, and selects its first line.
+
+        """
+        page_number = self._current_page_number
+        if self._page_index.page_start(page_number) < self._top_line_number:
+            count -= 1
+        page_start = self._page_index.page_start(max(page_number - count, 0))
+        if page_start < self._top_line_number:
+            self._move_selection(page_start, page_start)
 
 
 class HeaderRegion:
@@ -916,11 +1600,28 @@ class ModalRegionHelp(ModalRegionBase):
         for key_str, action_str in ordered_keymap.items():
             lines_list.append(key_str + ': ' + action_str)
 
+        # If the mappings don't fit the current size, grow the window in the
+        # same steps as the message modal until they do.
+        target_lines = len(lines_list)
+        target_cols = len(max(lines_list, key=len))
+        multiplier_step = 0.1
+        multiplier = self._percent_lines + multiplier_step
+        while target_lines > self._avail_lines \
+            or target_cols > self._avail_cols:
+            if multiplier > self.WIN_MAX_PERCENT:
+                raise ValueError('Key mappings exceed window bounds.')
+            self._window.resize(
+                math.floor(self._curses.LINES * multiplier),
+                math.floor(self._curses.COLS * multiplier))
+            self._center_window()
+            multiplier += multiplier_step
+            self._window.erase()
+            self._config()
+
         # Write string.
         avail_origin_y, avail_origin_x = self._avail_origin
         coord_y, coord_x = self._get_centered_coords(
-            self._avail_lines, self._avail_cols,
-            len(ordered_keymap), len(max(ordered_keymap.values(), key=len)))
+            self._avail_lines, self._avail_cols, target_lines, target_cols)
         self._help_string = self._string_factory.create_string(
             self._window, '\n'.join(lines_list),
             avail_origin_y + coord_y, avail_origin_x + coord_x)
@@ -1274,6 +1975,134 @@ class NavRegion:
         self._set_highighted_style(self._currently_highlighted_item)
 
 
+class PageIndex:
+    """
+    The division of a number of lines of content into overlapping pages.
+
+    A sequence of pages, each a range of line numbers. Every page but the last
+    is full and begins overlap_lines before the end of the previous page. The
+    last page is aligned with the last line so that it is full if there are
+    enough lines. Since pages are evenly spaced, page boundaries and the pages
+    containing a line are computed rather than stored, so the index has a
+    constant size and all operations run in constant time.
+
+    Attributes:
+        _last_regular_page (int): The number of the last evenly-spaced page.
+        _lines_count (int): The number of lines of content.
+        _page_count (int): The number of pages.
+        _page_lines (int): The number of lines in a full page.
+        _stride (int): The number of lines between the starts of consecutive
+            evenly-spaced pages.
+
+    """
+
+    def __init__(self, lines_count, page_lines, overlap_lines):
+        """
+        Constructor.
+
+        Args:
+            lines_count (int): The number of lines of content. Must be positive.
+            page_lines (int): The number of lines in a full page.
+            overlap_lines (int): The number of lines shared by consecutive
+                pages. Must be less than page_lines.
+
+        """
+        self._lines_count = lines_count
+        self._page_lines = page_lines
+        self._stride = page_lines - overlap_lines
+
+        if lines_count <= page_lines:
+            self._last_regular_page = 0
+            self._page_count = 1
+        else:
+            # Page k + 1 follows page k evenly while the lines after page k,
+            # plus the overlap, do not fit into a single page.
+            lines_beyond = lines_count - 2 * page_lines + overlap_lines
+            self._last_regular_page = max(0, -(-lines_beyond // self._stride))
+            self._page_count = self._last_regular_page + 2
+
+    def __getitem__(self, page_number):
+        """
+        Implement the sequence interface.
+
+        Args:
+            page_number (int)
+
+        Returns:
+            range: The line numbers of the page.
+
+        Raises:
+            IndexError: If the page does not exist.
+
+        """
+        if not 0 <= page_number < self._page_count:
+            raise IndexError('Page number out of range.')
+
+        return range(
+            self.page_start(page_number),
+            min(self.page_start(page_number) + self._page_lines,
+                self._lines_count))
+
+    def __len__(self):
+        """
+        Implement the length interface.
+
+        Returns:
+            int: The number of pages.
+
+        """
+        return self._page_count
+
+    def first_page_with_line(self, line_number):
+        """
+        Get the lowest-numbered page that contains a line.
+
+        Args:
+            line_number (int): A line number less than the line count.
+
+        Returns:
+            int: A page number.
+
+        """
+        page_number = max(
+            0, (line_number - self._page_lines) // self._stride + 1)
+
+        return min(page_number, self._page_count - 1)
+
+    def last_page_with_line(self, line_number):
+        """
+        Get the highest-numbered page that contains a line.
+
+        Args:
+            line_number (int): A line number less than the line count.
+
+        Returns:
+            int: A page number.
+
+        """
+        last_page = self._page_count - 1
+        if line_number >= self.page_start(last_page):
+            return last_page
+
+        return min(self._last_regular_page, line_number // self._stride)
+
+    def page_start(self, page_number):
+        """
+        Get the first line number of a page.
+
+        Args:
+            page_number (int): An existing page number.
+
+        Returns:
+            int: A line number.
+
+        """
+        if page_number > self._last_regular_page:
+            return self._lines_count - self._page_lines
+
+        return page_number * self._stride
+
+
 class StatusRegion:
     """
     A class that represents the header region.
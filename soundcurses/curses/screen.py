@@ -2,6 +2,8 @@
 
 """
 
+import bisect
+import heapq
 import itertools
 import time
 
@@ -16,57 +18,170 @@ class CursesScreen:
         class upon construction. This is helpful for complete refreshes of the
         entire screen.
 
+    Windows mark themselves dirty when written to, which queues them for
+    rendering and marks the screen dirty. A frame in which nothing was marked
+    dirty is skipped without querying curses or updating the physical screen.
+
     Attributes:
+        _dirty (bool): True if a window has changed since the last frame.
         _last_rendered_timestamp (float): Timestamp of last rendering.
         _render_queue (RenderQueue): Queue of window objects indexed by render
             layer.
         _windows (List): Maintains an unordered list of references to all
             windows.
+        rendered_frame_count (int): The number of frames rendered.
+        skipped_frame_count (int): The number of frames skipped since nothing
+            had changed.
     """
 
     RENDER_LAYER_HIDDEN = 0
     RENDER_LAYER_BASE = 1
     RENDER_LAYER_REGIONS = 2
-    RENDER_LAYER_MODALS = 3
+    RENDER_LAYER_REGION_PADS = 3
+    RENDER_LAYER_MODALS = 4
 
     def __init__(self, curses, render_queue, signal_rendered, *args):
         self._curses = curses
+        self._dirty = False
         self._last_render_timestamp = 0
         self._render_queue = render_queue
         self._windows = []
+        self.rendered_frame_count = 0
         self.signal_rendered = signal_rendered
+        self.skipped_frame_count = 0
 
         if args:
             for window in args:
                 self.add_window(window)
 
-    def _detect_touched_windows(self):
-        """ Check all windows for touched status. If touched, add to update
-        queue.
+    def _clip_occluded_lines(self, window, window_box, occluders):
+        """
+        Clip a window's touched lines against the windows that occlude it.
+
+        Touched lines fully covered by occluders are marked unchanged so that
+        curses does not copy them. Where a touched line is only partly covered,
+        the occluders' lines are touched instead so that they are copied over
+        it again.
+
+        Args:
+            window (CursesWindow): The occluded window.
+            window_box (BoxCoords): The window's box.
+            occluders (list): Tuples (window, box) of visible windows on higher
+                render layers that intersect window_box.
+
+        Returns:
+            list: The occluders whose lines were touched.
 
         """
-        for window in self._windows:
-            if window.is_wintouched():
-                self._render_queue.add(window)
+        damaged_occluders = []
+        left = window_box.origin[1]
+        right = left + window_box.cols
+        top = window_box.origin[0]
+        for screen_y in range(top, top + window_box.lines):
+            if not window.is_screen_line_touched(screen_y):
+                continue
+            line_occluders = [
+                (occluder, box) for occluder, box in occluders
+                if box.origin[0] <= screen_y < box.origin[0] + box.lines]
+            if not line_occluders:
+                continue
+
+            # Merge the occluders' column spans and check for gaps.
+            covered_to = left
+            for span_left, span_right in sorted(
+                (box.origin[1], box.origin[1] + box.cols)
+                for occluder, box in line_occluders):
+                if span_left > covered_to:
+                    break
+                covered_to = max(covered_to, span_right)
+
+            if covered_to >= right:
+                window.touch_screen_lines(screen_y, 1, changed=False)
+            else:
+                for occluder, box in line_occluders:
+                    occluder.touch_screen_lines(screen_y, 1)
+                    if occluder not in damaged_occluders:
+                        damaged_occluders.append(occluder)
+
+        return damaged_occluders
+
+    def _touch_occluders(self, window_box, occluders):
+        """
+        Touch the occluders' lines that intersect a window's box.
 
-    def _flush_render_queue(self):
-        """ Iterate render queue and push window states to curses virtual
-        screen.
+        Used for windows whose refresh copies every line of their box, such
+        as pads, so that the occluders are copied over all of it again.
+
+        Args:
+            window_box (BoxCoords): The occluded window's box.
+            occluders (list): Tuples (window, box) of visible windows on higher
+                render layers that intersect window_box.
+
+        Returns:
+            list: The occluders whose lines were touched.
 
         """
-        if self._render_queue:
-            for window in self._render_queue:
-                window.noutrefresh()
-            self._render_queue.clear()
+        for occluder, box in occluders:
+            occluder.touch_screen_lines(window_box.origin[0], window_box.lines)
 
-    def _force_touch_all(self):
-        """ Touch all windows to force curses to render all.
+        return [occluder for occluder, box in occluders]
 
-        Useful for forcing re-renders after window(s) change render layers.
+    def _flush_render_queue(self):
+        """
+        Push the states of queued windows to the curses virtual screen.
+
+        Windows are copied from the bottom render layer to the top. Hidden
+        windows are never copied. Each window is clipped against the visible
+        windows on higher layers that intersect it, so a fully occluded window
+        is not copied at all. A window that copies untouched lines, such as a
+        pad, cannot be clipped by line once it is copied, so all of its
+        occluders' intersecting lines are touched instead. Occluders touched
+        by the clipping are queued and copied in turn.
+
+        A heap ordered by render layer is used since occluders may be queued
+        during the flush, always on layers above the window being flushed.
 
         """
-        for window in self._windows:
-            window.touchwin()
+        if not self._render_queue:
+            return
+
+        visible_windows = [
+            (window, window.box) for window in self._windows
+            if not window.hidden]
+        heap = [
+            (window.render_layer, sequence, window)
+            for sequence, window in enumerate(self._render_queue)]
+        sequence_numbers = itertools.count(len(heap))
+        queued_windows = set(self._render_queue)
+        while heap:
+            render_layer, sequence, window = heapq.heappop(heap)
+            if window.hidden:
+                window.untouchwin()
+                continue
+
+            window_box = window.box
+            occluders = [
+                (occluder, box) for occluder, box in visible_windows
+                if occluder.render_layer > render_layer
+                and box.intersects(window_box)]
+            if occluders:
+                damaged_occluders = self._clip_occluded_lines(
+                    window, window_box, occluders)
+                if window.COPIES_UNTOUCHED_LINES and window.is_box_touched():
+                    damaged_occluders = self._touch_occluders(
+                        window_box, occluders)
+                for occluder in damaged_occluders:
+                    if occluder not in queued_windows:
+                        queued_windows.add(occluder)
+                        heapq.heappush(heap, (
+                            occluder.render_layer,
+                            next(sequence_numbers),
+                            occluder))
+
+            if window.is_box_touched():
+                window.noutrefresh()
+
+        self._render_queue.clear()
 
     def _handle_window_layer_change(self, window, delta, **kwargs):
         """
@@ -75,21 +190,43 @@ class CursesScreen:
         Designed as a slot to the windows' signals indiciating a render layer
         change.
 
+        Only the area covered by the window can change in appearance, so only
+        that area is damaged.
+
+        """
+        # Touching the damaged area queues the window again on its new layer.
+        self._render_queue.remove(window)
+        self._touch_damaged_area(window.box)
+
+    def _touch_damaged_area(self, damaged_box):
+        """
+        Touch the lines of all windows that display within a damaged area.
+
+        Touched lines are copied to the virtual screen by the next render,
+        subject to occlusion clipping, and so repaint the area. Touching marks
+        the windows dirty.
+
+        Args:
+            damaged_box (BoxCoords): The area of the screen to repaint.
+
         """
-        # If window is in render queue, it must have been touched.
-        # No need to add to queue since _detect_touched_windows call in render()
-        # will perform that function.
-        if window in self._render_queue:
-            self._render_queue.remove(window)
-        self._force_touch_all()
+        for window in self._windows:
+            if window.box.intersects(damaged_box):
+                window.touch_screen_lines(
+                    damaged_box.origin[0], damaged_box.lines)
 
     def add_window(self, window):
         """
         Add a new window to the screen.
 
+        New curses windows are touched, so the window is rendered on the next
+        frame.
+
         """
         window.signal_layer_change.connect(self._handle_window_layer_change)
         self._windows.append(window)
+        if window.is_wintouched():
+            self.mark_dirty(window)
 
     @property
     def cols(self):
@@ -110,6 +247,24 @@ class CursesScreen:
     def lines(self):
         return self._curses.LINES
 
+    def mark_dirty(self, window, damaged_box=None):
+        """
+        Queue a changed window for rendering on the next frame.
+
+        Called by windows whenever they are written to.
+
+        Args:
+            window (CursesWindow): The changed window.
+            damaged_box (BoxCoords): An area of the screen that the window no
+                longer covers, if any, such as after a move. The windows
+                displayed within it are touched.
+
+        """
+        self._render_queue.add(window)
+        self._dirty = True
+        if damaged_box is not None:
+            self._touch_damaged_area(damaged_box)
+
     def remove_window(self, window):
         """
         Remove a window from the screen.
@@ -135,10 +290,19 @@ class CursesScreen:
         physical screen refresh rather than rely upon constant physical
         refreshes.
 
+        If no window has been marked dirty since the last frame, the frame is
+        skipped.
+
         """
-        self._detect_touched_windows()
+        if not self._dirty:
+            self.skipped_frame_count += 1
+            return
+
         self._flush_render_queue()
+        # Windows touched while clipping were flushed in the same pass.
+        self._dirty = False
         self._curses.doupdate()
+        self.rendered_frame_count += 1
         self._last_render_timestamp = time.time()
         self.signal_rendered.emit()
 
@@ -215,10 +379,22 @@ class RenderQueue:
     uses that to insert the window into the appropriate order on the queue while
     accounting for collisions.
 
-    The conscious choice was made to use an iterable type as the value for every
-    render layer "key" in the queue. While this does use more memory, it
-    simplifies code by avoiding constant iterable checks. For this scale, the
-    increased memory is deemed negligible.
+    Windows are kept in a bucket per render layer. Buckets are dictionaries used
+    as insertion-ordered sets, so windows on the same layer are iterated in the
+    order in which they were added. The layers that have buckets are kept in a
+    sorted list, maintained with bisect, so iteration proceeds from the bottom
+    layer to the top regardless of the order in which layers were added.
+
+    An index maps each queued window to the layer under which it was queued.
+    Membership, length, and removal therefore never search the buckets. Adding
+    or removing a window is constant-time unless it creates or empties a layer,
+    in which case the sorted layer list, which holds only a handful of values,
+    is updated in logarithmic time plus a short shift.
+
+    Attributes:
+        _buckets (dict): Maps render layers to dicts whose keys are windows.
+        _layers (list): The render layers that have buckets, in ascending order.
+        _window_layers (dict): Maps each queued window to its bucket's layer.
 
     """
 
@@ -227,15 +403,14 @@ class RenderQueue:
         Constructor.
 
         """
-        self._queue = {}
+        self._buckets = {}
+        self._layers = []
+        self._window_layers = {}
 
     def __contains__(self, window):
         """
         Implement the membership test interface.
 
-        Note that the list "in" operator first uses identity comparison before
-        resorting to value equality comparison.
-
         Args:
             window (CursesWindow): A curses window object.
 
@@ -243,91 +418,76 @@ class RenderQueue:
             bool: True if window is present in queue.
 
         """
-        return window in self._flatten_queue()
+        return window in self._window_layers
 
     def __iter__(self):
         """
         Implement the iterable interface method.
 
-        A key (render layer value) will only exist in the queue if there are
-        windows present on that render layer. It is therefore safe to begin
-        iteration of a key's associated list value without checking its
-        existence.
-
-        Caution: I'm not sure if the dictionary view produced by dict.values()
-        has consistent, deterministic order. In this queue, order is important
-        so this needs to be watched.
+        Windows are yielded from the bottom render layer to the top and, within
+        a layer, in the order in which they were added. The queue must not be
+        modified during iteration.
 
         See:
             https://docs.python.org/3/reference/datamodel.html#object.__iter__
-            https://docs.python.org/3/library/stdtypes.html#dictionary-view-
-                objects
 
         Returns:
-            list: A list of window objects in render order.
+            iterator: The window objects in render order.
 
         """
-        return self._flatten_queue()
+        for render_layer in self._layers:
+            yield from self._buckets[render_layer]
 
     def __len__(self):
         """
         Implement iterable length interface.
 
-        The object returned by itertools.chain has no len() interface, thus it
-        must be converted to an iterable that does.
-
-        I question the efficiency of calculating something as simple as length
-        this way. Consider implemting a loop and using an accumulator.
-
         See:
             https://docs.python.org/3/reference/datamodel.html#object.__len__
-            https://docs.python.org/3/library/itertools.html#itertools.chain
 
         Returns:
             int: The count of window objects in the queue.
 
         """
-        return len(list(self._flatten_queue()))
-
-    def _flatten_queue(self):
-        """
-        Convert the queue data structure into a flat list.
-
-        The window objects are placed into the list in proper render order.
-
-        See:
-            http://docs.python.org/3/library/stdtypes.html#dictionary-view-
-                objects
-
-        Returns:
-            list: A list of window objects ordered by render layer.
-
-        """
-        return itertools.chain(*self._queue.values())
+        return len(self._window_layers)
 
     def add(self, window):
         """
         Add a window object to the queue.
 
-        Render layer collisions are handled by storing items in a bucket,
-        implemented with a set iterable to prevent duplicates since once a
-        window has been touched, it only needs to be present in the queue once.
+        Once a window has been touched, it only needs to be present in the queue
+        once, so adding a queued window again has no effect. If the window's
+        render layer has changed since it was queued, it is moved to its new
+        layer.
 
         Args:
             window (CursesWindow): A curses window object.
 
         """
-        if window.render_layer in self._queue:
-            self._queue[window.render_layer].add(window)
-        else:
-            self._queue[window.render_layer] = {window}
+        render_layer = window.render_layer
+        queued_layer = self._window_layers.get(window)
+        if queued_layer == render_layer:
+            return
+        if queued_layer is not None:
+            self.remove(window)
+
+        try:
+            bucket = self._buckets[render_layer]
+        except KeyError:
+            bucket = {}
+            self._buckets[render_layer] = bucket
+            bisect.insort(self._layers, render_layer)
+        bucket[window] = None
+        self._window_layers[window] = render_layer
 
     def clear(self):
         """
         Empty the queue.
 
         """
-        self._queue.clear()
+        self._buckets.clear()
+        self._layers.clear()
+        self._window_layers.clear()
 
     def remove(self, window):
         """
@@ -335,21 +495,16 @@ class RenderQueue:
 
         Will not throw an exception if the window was not present in the queue.
 
-        Warning: do not modify an iterable during iteration with an iterator. To
-        avoid modifying data structure during iteration, keys marked for
-        deletion are saved and applied after iteration is complete. There's
-        probably a more elegant way to do this.
-
         Args:
             window (CursesWindow): A curses window object.
 
         """
-        empty_render_layers = []
-        for render_layer, bucket in self._queue.items():
-            if window in bucket:
-                bucket.remove(window)
-                if not bucket:
-                    empty_render_layers.append(render_layer)
-
-        for empty_render_layer in empty_render_layers:
-            del self._queue[empty_render_layer]
+        render_layer = self._window_layers.pop(window, None)
+        if render_layer is None:
+            return
+
+        bucket = self._buckets[render_layer]
+        del bucket[window]
+        if not bucket:
+            del self._buckets[render_layer]
+            del self._layers[bisect.bisect_left(self._layers, render_layer)]
@@ -11,8 +11,15 @@ class InputSource:
     """
     Class that manages the polling for user input.
 
+    Attributes:
+        MAX_DRAIN_COUNT (int): The maximum number of keys consumed by a single
+            call to drain_input(). Bounds the work done in one main loop
+            iteration if the terminal floods the input buffer.
+
     """
 
+    MAX_DRAIN_COUNT = 256
+
     def __init__(self, curses, window):
         """
         Constructor.
@@ -30,6 +37,38 @@ class InputSource:
         """
         self._window.nodelay(True)
 
+    def drain_input(self, is_foldable=None):
+        """
+        Return string representations of keys pressed since last polled.
+
+        Consumes pending keys, up to MAX_DRAIN_COUNT, so that a backlog of key
+        events can be handled in a single main loop iteration.
+
+        Draining stops after the first key for which is_foldable returns false.
+        Keys typed after such a key, which may for instance open a text prompt,
+        are thereby left in the input buffer for whatever consumes input next.
+
+        Args:
+            is_foldable (callable): Passed a key string, returns true if
+                draining may continue past that key. If None, all pending keys
+                are drained.
+
+        Returns:
+            list: Key strings in the order in which they were pressed. Empty if
+                no keys were pending.
+
+        """
+        keys_pressed = []
+        while len(keys_pressed) < self.MAX_DRAIN_COUNT:
+            key_pressed = self.sample_input()
+            if key_pressed is None:
+                break
+            keys_pressed.append(key_pressed)
+            if is_foldable and not is_foldable(key_pressed):
+                break
+
+        return keys_pressed
+
     def sample_input(self):
         """
         Return a string representation of the key(s) pressed.
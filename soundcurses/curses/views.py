@@ -4,7 +4,7 @@ interfaces to controller classes for the manipulation of the curses TUI.
 
 """
 
-import time
+import collections
 
 class MainView:
     """ Highest-level view designed to control broad functions often associated
@@ -13,13 +13,14 @@ class MainView:
     """
 
     def __init__(self, input_source, screen, model,
-        region_status, region_nav, region_content, modal_factory):
+        region_status, region_nav, region_content, modal_factory, toast_queue):
         """ Constructor.
 
         input_source - Provides an interface for receiving input events from
             the curses library.
         screen - An abstracted interface for the display of the various curses
             components in a "composited" TUI view.
+        toast_queue - Displays temporary, self-dismissing messages.
 
         """
         self._input_source = input_source
@@ -32,6 +33,7 @@ class MainView:
         self._region_status = region_status
         self._region_nav = region_nav
         self._screen = screen
+        self._toast_queue = toast_queue
 
         self._connect_to_model()
 
@@ -72,33 +74,89 @@ class MainView:
         """
         self._region_content.content_lines = lines_list
 
-    def content_line_next(self):
+    def content_append_lines(self, lines_list):
+        """
+        Append lines to those displayed in the content region.
+
+        Args:
+            lines_list (list): A list of strings.
+
+        """
+        self._region_content.append_lines(lines_list)
+
+    def content_line_first(self):
+        """
+        Select the first line of content.
+
+        """
+        self._region_content.line_first()
+
+    def content_line_go_to(self, line_number):
+        """
+        Select a line of content by number.
+
+        Args:
+            line_number (int): The index of the line to select.
+
+        """
+        self._region_content.line_go_to(line_number)
+
+    def content_line_last(self):
+        """
+        Select the last line of content.
+
+        """
+        self._region_content.line_last()
+
+    def content_line_next(self, count=1):
         """
         Select the next line of content.
 
+        Args:
+            count (int): The number of lines by which to move.
+
+        """
+        self._region_content.line_next(count)
+
+    def content_line_percent(self, percent):
+        """
+        Select the line a percentage of the way through the content.
+
+        Args:
+            percent (int): The percentage of the content.
+
         """
-        self._region_content.line_next()
+        self._region_content.line_percent(percent)
 
-    def content_line_previous(self):
+    def content_line_previous(self, count=1):
         """
         Select the previous line of content.
 
+        Args:
+            count (int): The number of lines by which to move.
+
         """
-        self._region_content.line_previous()
+        self._region_content.line_previous(count)
 
-    def content_page_next(self):
+    def content_page_next(self, count=1):
         """
         Select the next line of content.
 
+        Args:
+            count (int): The number of pages by which to move.
+
         """
-        self._region_content.page_next()
+        self._region_content.page_next(count)
 
-    def content_page_previous(self):
+    def content_page_previous(self, count=1):
         """
         Select the next line of content.
 
+        Args:
+            count (int): The number of pages by which to move.
+
         """
-        self._region_content.page_previous()
+        self._region_content.page_previous(count)
 
     def destroy(self):
         """
@@ -107,6 +165,20 @@ class MainView:
         """
         self._screen.destroy()
 
+    def drain_input(self, is_foldable=None):
+        """
+        Sample pending input from the designated polling window.
+
+        Args:
+            is_foldable (callable): Passed a key string, returns true if
+                sampling may continue past that key.
+
+        Returns:
+            list: A list of key strings. Empty if no input was pending.
+
+        """
+        return self._input_source.drain_input(is_foldable)
+
     def hide_help(self):
         """
         Hide the help modal window.
@@ -232,3 +304,120 @@ class MainView:
         if self._modal_message:
             self._modal_message.destroy()
         self._modal_message = self._modal_factory.create_message(message)
+
+    def show_toast(self, message):
+        """
+        Display a message that dismisses itself after a short time.
+
+        If a toast is already displayed, the message is queued and displayed
+        once the preceding toasts have expired.
+
+        Args:
+            message (str): The message to display.
+
+        """
+        self._toast_queue.push(message)
+
+
+class ToastQueue:
+    """
+    Displays a queue of temporary messages ("toasts") one after another.
+
+    Each toast is displayed in a modal message window for a fixed duration and
+    then dismissed by a one-shot timer on the scheduler, so displaying a toast
+    never blocks.
+
+    Attributes:
+        DEFAULT_DURATION (float): Number of seconds a toast is displayed.
+        _current_modal (ModalRegionMessage): The currently-displayed toast.
+        _current_timer (Timer): Dismisses the currently-displayed toast.
+        _pending (collections.deque): Tuples (message, duration) not yet
+            displayed.
+        _scheduler (TimerScheduler): Runs the expiry timers.
+
+    """
+
+    DEFAULT_DURATION = 2.0
+
+    def __init__(self, modal_factory, scheduler):
+        """
+        Constructor.
+
+        Args:
+            modal_factory (ModalRegionFactory): Creates the message modals.
+            scheduler (TimerScheduler): Runs the expiry timers.
+
+        """
+        self._current_modal = None
+        self._current_timer = None
+        self._modal_factory = modal_factory
+        self._pending = collections.deque()
+        self._scheduler = scheduler
+
+    def __len__(self):
+        """
+        Implement the length interface.
+
+        Returns:
+            int: The number of toasts displayed or pending.
+
+        """
+        return len(self._pending) + (1 if self._current_modal else 0)
+
+    def _dismiss_current(self):
+        """
+        Destroy the currently-displayed toast.
+
+        """
+        self._current_timer.cancel()
+        self._current_timer = None
+        self._current_modal.destroy()
+        self._current_modal = None
+
+    def _handle_expiry(self):
+        """
+        Dismiss the current toast and display the next, if any.
+
+        Designed to be called by the expiry timer.
+
+        """
+        self._dismiss_current()
+        if self._pending:
+            self._show_next()
+
+    def _show_next(self):
+        """
+        Display the next pending toast.
+
+        """
+        message, duration = self._pending.popleft()
+        self._current_modal = self._modal_factory.create_message(message)
+        self._current_timer = self._scheduler.call_later(
+            duration, self._handle_expiry)
+
+    def clear(self):
+        """
+        Dismiss the current toast and discard all pending toasts.
+
+        """
+        self._pending.clear()
+        if self._current_modal:
+            self._dismiss_current()
+
+    def push(self, message, duration=None):
+        """
+        Queue a message for display.
+
+        The message is displayed immediately if no other toast is displayed.
+
+        Args:
+            message (str): The message to display.
+            duration (float): Number of seconds for which to display message.
+                Defaults to DEFAULT_DURATION.
+
+        """
+        if duration is None:
+            duration = self.DEFAULT_DURATION
+        self._pending.append((message, duration))
+        if not self._current_modal:
+            self._show_next()
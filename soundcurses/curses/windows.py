@@ -66,6 +66,22 @@ class BoxCoords:
         """
         return (self.origin[0] + self.lines, self.origin[1] + self.cols)
 
+    def intersects(self, other):
+        """
+        Determine whether this box and another box share any cells.
+
+        Args:
+            other (BoxCoords): The other box.
+
+        Returns:
+            bool: True if the boxes overlap.
+
+        """
+        return (self.origin[0] < other.origin[0] + other.lines
+            and other.origin[0] < self.origin[0] + self.lines
+            and self.origin[1] < other.origin[1] + other.cols
+            and other.origin[1] < self.origin[1] + self.cols)
+
     @property
     def top_left(self):
         """
@@ -99,8 +115,19 @@ class CursesWindow:
     the underlying curses window methods as well. This class also defines the
     additional methods.
 
+    Methods that change what the window displays are wrapped so that the
+    window is marked dirty with the screen, which then renders it on the next
+    frame. Writes made directly to the underlying curses window are not seen
+    by the screen.
+
+    Attributes:
+        COPIES_UNTOUCHED_LINES (bool): True if a refresh copies every line of
+            the window's box to the virtual screen, touched or not.
+
     """
 
+    COPIES_UNTOUCHED_LINES = False
+
     def __init__(self, window, screen, signal_layer_change, render_layer=None):
         """
         Constructor.
@@ -135,6 +162,17 @@ class CursesWindow:
         """
         return getattr(self._window, name)
 
+    def _mark_dirty(self, damaged_box=None):
+        """
+        Notify the screen that the window has changed and must be rendered.
+
+        Args:
+            damaged_box (BoxCoords): An area of the screen that the window no
+                longer covers, if any.
+
+        """
+        self._screen.mark_dirty(self, damaged_box=damaged_box)
+
     def _change_render_layer(self, new_render_layer):
         """
         Change render layer and emit appropriate signal.
@@ -145,6 +183,50 @@ class CursesWindow:
         self.signal_layer_change.emit(
             window=self, delta=render_layer_delta)
 
+    def _get_window_line(self, screen_y):
+        """
+        Convert a screen line coordinate into a window line coordinate.
+
+        """
+        return screen_y - self._window.getbegyx()[0]
+
+    def addstr(self, *args):
+        """
+        Write a string to the window and mark the window dirty.
+
+        Accepts the same arguments as the curses window method.
+
+        """
+        self._window.addstr(*args)
+        self._mark_dirty()
+
+    def bkgd(self, *args):
+        """
+        Set the window background and mark the window dirty.
+
+        """
+        self._window.bkgd(*args)
+        self._mark_dirty()
+
+    def border(self, *args):
+        """
+        Draw a border around the window and mark the window dirty.
+
+        """
+        self._window.border(*args)
+        self._mark_dirty()
+
+    @property
+    def box(self):
+        """
+        Get the area of the screen that the window covers.
+
+        Returns:
+            BoxCoords: The window's screen area.
+
+        """
+        return BoxCoords(self._window.getbegyx(), self.lines, self.cols)
+
     @property
     def cols(self):
         """
@@ -156,6 +238,45 @@ class CursesWindow:
         """
         return self._window.getmaxyx()[1]
 
+    def chgat(self, *args):
+        """
+        Change the attributes of characters and mark the window dirty.
+
+        """
+        self._window.chgat(*args)
+        self._mark_dirty()
+
+    def clear(self):
+        """
+        Clear the window and mark the window dirty.
+
+        """
+        self._window.clear()
+        self._mark_dirty()
+
+    def erase(self):
+        """
+        Erase the window and mark the window dirty.
+
+        """
+        self._window.erase()
+        self._mark_dirty()
+
+    def getstr(self, *args):
+        """
+        Read a string from the user and mark the window dirty.
+
+        Input is echoed into the window.
+
+        Returns:
+            bytes: The string entered.
+
+        """
+        input_bytes = self._window.getstr(*args)
+        self._mark_dirty()
+
+        return input_bytes
+
     @property
     def hidden(self):
         """
@@ -188,6 +309,38 @@ class CursesWindow:
         """
         return self._window.getmaxyx()[0]
 
+    def mvwin(self, y, x):
+        """
+        Move the window and mark the window dirty.
+
+        The area the window covered before the move is damaged.
+
+        Args:
+            y (int): The new screen line of the window origin.
+            x (int): The new screen column of the window origin.
+
+        """
+        damaged_box = self.box
+        self._window.mvwin(y, x)
+        self._window.touchwin()
+        self._mark_dirty(damaged_box=damaged_box)
+
+    def resize(self, lines, cols):
+        """
+        Resize the window and mark the window dirty.
+
+        The area the window covered before resizing is damaged.
+
+        Args:
+            lines (int): The new number of lines.
+            cols (int): The new number of columns.
+
+        """
+        damaged_box = self.box
+        self._window.resize(lines, cols)
+        self._window.touchwin()
+        self._mark_dirty(damaged_box=damaged_box)
+
     @property
     def render_layer(self):
         """
@@ -199,6 +352,44 @@ class CursesWindow:
         """
         return self._render_layer_current
 
+    def is_box_touched(self):
+        """
+        Determine whether any line displayed within the window's box is touched.
+
+        Returns:
+            bool: True if a refresh would copy changes to the virtual screen.
+
+        """
+        return self._window.is_wintouched()
+
+    def is_screen_line_touched(self, screen_y):
+        """
+        Determine whether the window line displayed on a screen line is touched.
+
+        Args:
+            screen_y (int): A screen line within the window's box.
+
+        Returns:
+            bool: True if the line has changed since it was last refreshed.
+
+        """
+        return self._window.is_linetouched(self._get_window_line(screen_y))
+
+    def scroll(self, lines=1):
+        """
+        Scroll the window's scrolling region and mark the window dirty.
+
+        Scrolling must be enabled with scrollok(). With idlok() enabled, curses
+        may use the terminal's own line scrolling to update the screen.
+
+        Args:
+            lines (int): The number of lines by which to scroll up. Negative to
+                scroll down.
+
+        """
+        self._window.scroll(lines)
+        self._mark_dirty()
+
     def show(self):
         """
         Set window's render layer to its default.
@@ -208,6 +399,44 @@ class CursesWindow:
         """
         self._change_render_layer(self.render_layer_default)
 
+    def touchline(self, start, count, changed=True):
+        """
+        Mark a range of window lines and, if changed, mark the window dirty.
+
+        """
+        self._window.touchline(start, count, changed)
+        if changed:
+            self._mark_dirty()
+
+    def touch_screen_lines(self, screen_y, count, changed=True):
+        """
+        Mark the window lines displayed on a range of screen lines.
+
+        Screen lines outside of the window's box are ignored. If the lines are
+        marked changed, the window is marked dirty.
+
+        Args:
+            screen_y (int): The first screen line.
+            count (int): The number of screen lines.
+            changed (bool): If False, the lines are marked unchanged instead,
+                so that they are not copied by the next refresh.
+
+        """
+        box = self.box
+        start_y = max(screen_y, box.origin[0])
+        end_y = min(screen_y + count, box.origin[0] + box.lines)
+        if start_y < end_y:
+            self.touchline(
+                self._get_window_line(start_y), end_y - start_y, changed)
+
+    def touchwin(self):
+        """
+        Mark the entire window changed and mark the window dirty.
+
+        """
+        self._window.touchwin()
+        self._mark_dirty()
+
 
 class CursesPad(CursesWindow):
     """
@@ -216,8 +445,13 @@ class CursesPad(CursesWindow):
     This class is designed to isolate the screen rendering classes from the
     peculiar interface of pads' refresh() and noutrefresh() methods.
 
+    Unlike a window, a pad's refresh copies every line of its clipping box,
+    so untouching the lines of a pad does not keep them from being copied.
+
     """
 
+    COPIES_UNTOUCHED_LINES = True
+
     def __init__(self, pad, screen, signal_layer_change,
         visible_origin, clipping_box, render_layer=None):
         """
@@ -248,6 +482,53 @@ class CursesPad(CursesWindow):
         self._visible_origin = visible_origin
         self._clipping_box = clipping_box
 
+    def _get_window_line(self, screen_y):
+        """
+        Override parent.
+
+        Pads have no screen position of their own. Their visible origin is
+        displayed at the clipping box origin.
+
+        """
+        return screen_y - self._clipping_box.origin[0] + self._visible_origin[0]
+
+    @property
+    def box(self):
+        """
+        Override parent.
+
+        Returns:
+            BoxCoords: The pad's clipping box.
+
+        """
+        return self._clipping_box
+
+    def is_box_touched(self):
+        """
+        Override parent.
+
+        Touched pad lines outside of the clipping box are not displayed.
+
+        """
+        top = self._clipping_box.origin[0]
+        return any(
+            self.is_screen_line_touched(screen_y)
+            for screen_y in range(top, top + self._clipping_box.lines))
+
+    @property
+    def _clipping_box_max(self):
+        """
+        Get the lower-right cell of the clipping box.
+
+        The pad refresh methods expect inclusive maximum coordinates.
+
+        Returns:
+            tuple: Tuple of ints (y, x)
+
+        """
+        bottom_right = self._clipping_box.bottom_right
+        return (bottom_right[0] - 1, bottom_right[1] - 1)
+
     def refresh(self):
         """
         Refresh the pad.
@@ -259,7 +540,7 @@ class CursesPad(CursesWindow):
         self._window.refresh(
             *self._visible_origin,
             *self._clipping_box.origin,
-            *self._clipping_box.bottom_right)
+            *self._clipping_box_max)
 
     def noutrefresh(self):
         """
@@ -272,7 +553,50 @@ class CursesPad(CursesWindow):
         self._window.noutrefresh(
             *self._visible_origin,
             *self._clipping_box.origin,
-            *self._clipping_box.bottom_right)
+            *self._clipping_box_max)
+
+    def resize(self, lines, cols):
+        """
+        Override parent.
+
+        Resizing a pad does not change its clipping box, so no area of the
+        screen is damaged.
+
+        Args:
+            lines (int): The new number of lines.
+            cols (int): The new number of columns.
+
+        """
+        self._window.resize(lines, cols)
+        self._mark_dirty()
+
+    @property
+    def visible_origin(self):
+        """
+        Get the pad coordinate displayed at the clipping box origin.
+
+        Returns:
+            tuple: Tuple of ints (y, x)
+
+        """
+        return self._visible_origin
+
+    @visible_origin.setter
+    def visible_origin(self, visible_origin):
+        """
+        Scroll the pad by changing the coordinate displayed at the clipping box
+        origin.
+
+        Nothing is written to the pad. The lines displayed from the new origin
+        are touched so that the next render copies them.
+
+        Args:
+            visible_origin (tuple): A tuple of int coords (y, x).
+
+        """
+        self._visible_origin = visible_origin
+        self.touch_screen_lines(
+            self._clipping_box.origin[0], self._clipping_box.lines)
 
 
 class CursesWindowFactory:
@@ -543,6 +867,20 @@ class CursesString:
             self._coord_y = y
             self._coord_x = x
 
+    def scroll(self, lines):
+        """
+        Update the string's coords after the window's contents were scrolled.
+
+        Nothing is written. The string moves up by the number of lines, as its
+        characters did when the window was scrolled.
+
+        Args:
+            lines (int): The number of lines by which the window was scrolled
+                up. Negative if it was scrolled down.
+
+        """
+        self._coord_y -= lines
+
     def style_bold(self):
         """
         Set the string curses attribute to bold style.
@@ -0,0 +1,469 @@
+"""
+Defines classes that allow the main loop to sleep until there is work to do.
+
+Rather than spinning on non-blocking input, the main loop blocks on the
+terminal's file descriptor and on a wake-up channel. Other threads, such as the
+network I/O thread, use the wake-up channel to signal that a result is ready.
+
+An asyncio-based waiter is also provided for the optional asyncio runtime. It
+imports asyncio itself since the import noticeably delays startup.
+
+Completed futures are funnelled through a completion dispatcher so that their
+results are delivered on the main thread without per-frame polling. Likewise,
+timed tasks are kept by a single timer scheduler, which tells the main loop
+exactly how long it may sleep.
+
+"""
+
+import collections
+import functools
+import heapq
+import itertools
+import os
+import selectors
+import time
+
+class CompletionDispatcher:
+    """
+    Delivers completed futures to interested callbacks on the main thread.
+
+    Callbacks are registered against a future. When the future completes, on
+    whatever thread, it is appended to a queue and the main loop is woken. The
+    main loop then calls dispatch(), which invokes each callback exactly once,
+    in completion order. Callbacks registered against the same future are
+    invoked in registration order.
+
+    The queue is a collections.deque, whose append() and popleft() methods are
+    thread-safe.
+
+    Attributes:
+        _completed (collections.deque): Tuples (callback, future) awaiting
+            dispatch.
+        _wake_callback (callable): Called with no arguments whenever a future
+            completes.
+
+    """
+
+    def __init__(self, wake_callback):
+        """
+        Constructor.
+
+        Args:
+            wake_callback (callable): Wakes a sleeping main loop. Must be safe
+                to call from any thread.
+
+        """
+        self._completed = collections.deque()
+        self._wake_callback = wake_callback
+
+    def __len__(self):
+        """
+        Implement the length interface.
+
+        Returns:
+            int: The number of completed futures awaiting dispatch.
+
+        """
+        return len(self._completed)
+
+    def _enqueue(self, callback, future):
+        """
+        Queue a completed future for dispatch and wake the main loop.
+
+        Designed to be bound with functools.partial and added to a future as a
+        done callback. May therefore run on any thread.
+
+        """
+        self._completed.append((callback, future))
+        self._wake_callback()
+
+    def dispatch(self):
+        """
+        Invoke the callbacks of all futures that have completed so far.
+
+        Futures that complete while dispatching, including those registered by
+        the callbacks themselves, are left for the next call.
+
+        """
+        for i in range(len(self._completed)):
+            callback, future = self._completed.popleft()
+            callback(future)
+
+    def register(self, future, callback):
+        """
+        Register interest in the completion of a future.
+
+        If the future is already done, it is queued immediately, so that it
+        is delivered by the next call to dispatch(). An asyncio future would
+        otherwise only call its done callbacks once the event loop next runs.
+
+        Args:
+            future: A concurrent.futures.Future or asyncio.Future.
+            callback (callable): Called on the main thread with the future as
+                its only argument.
+
+        """
+        if future.done():
+            self._enqueue(callback, future)
+        else:
+            future.add_done_callback(
+                functools.partial(self._enqueue, callback))
+
+
+class EventWaiter:
+    """
+    Blocks the main thread until input is available or a wake-up is signalled.
+
+    The wake-up channel is a self-pipe. Writing a byte to the pipe from any
+    thread makes the read end readable, which in turn makes a pending or
+    subsequent call to wait() return. Multiple wake-ups that occur before the
+    main thread wakes are collapsed into a single one.
+
+    Attributes:
+        _input_fd (int): The file descriptor from which the terminal input is
+            read. May be None if there is no terminal to watch.
+        _selector (selectors.BaseSelector): Multiplexes the file descriptors.
+        _wake_fd_read (int): Read end of the wake-up pipe.
+        _wake_fd_write (int): Write end of the wake-up pipe.
+
+    """
+
+    def __init__(self, selector, input_fd=None):
+        """
+        Constructor.
+
+        Args:
+            selector (selectors.BaseSelector): A selector instance. Usually
+                selectors.DefaultSelector().
+            input_fd (int): The terminal input file descriptor. Usually
+                sys.stdin.fileno().
+
+        """
+        self._input_fd = input_fd
+        self._selector = selector
+        self._wake_fd_read, self._wake_fd_write = os.pipe()
+
+        self._configure()
+
+    def _configure(self):
+        """
+        Make the wake-up pipe non-blocking and register all descriptors.
+
+        """
+        os.set_blocking(self._wake_fd_read, False)
+        os.set_blocking(self._wake_fd_write, False)
+        self._selector.register(self._wake_fd_read, selectors.EVENT_READ)
+        if self._input_fd is not None:
+            self._selector.register(self._input_fd, selectors.EVENT_READ)
+
+    def _drain_wake_pipe(self):
+        """
+        Consume all pending wake-up bytes so that the pipe is no longer ready.
+
+        """
+        try:
+            while os.read(self._wake_fd_read, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        """
+        Release the selector and the wake-up pipe.
+
+        """
+        self._selector.close()
+        os.close(self._wake_fd_read)
+        os.close(self._wake_fd_write)
+
+    def wait(self, timeout=None):
+        """
+        Block until input is available, a wake-up occurs, or timeout elapses.
+
+        Args:
+            timeout (float): Maximum number of seconds to block. None blocks
+                indefinitely. Zero polls without blocking.
+
+        Returns:
+            bool: True if any descriptor became ready, False on timeout.
+
+        """
+        events = self._selector.select(timeout)
+        for key, mask in events:
+            if key.fd == self._wake_fd_read:
+                self._drain_wake_pipe()
+
+        return bool(events)
+
+    def wake(self):
+        """
+        Wake the main thread. Safe to call from any thread.
+
+        If the pipe is full, a wake-up is already pending and the write is
+        safely discarded.
+
+        """
+        try:
+            os.write(self._wake_fd_write, b'\0')
+        except BlockingIOError:
+            pass
+
+
+class AsyncEventWaiter:
+    """
+    An asyncio counterpart of EventWaiter.
+
+    Rather than blocking in a selector, the main loop coroutine awaits an
+    asyncio.Event. The event is set by an event loop reader callback on the
+    terminal input descriptor or by a thread-safe wake-up.
+
+    Attributes:
+        _asyncio (module): The asyncio module.
+        _event (asyncio.Event): Set when the main loop should run again.
+        _event_loop (asyncio.AbstractEventLoop): The loop running the main
+            loop coroutine.
+        _input_fd (int): The file descriptor from which the terminal input is
+            read. May be None if there is no terminal to watch.
+
+    """
+
+    def __init__(self, event_loop, input_fd=None):
+        """
+        Constructor.
+
+        Args:
+            event_loop (asyncio.AbstractEventLoop): The loop on which the main
+                loop coroutine will run.
+            input_fd (int): The terminal input file descriptor. Usually
+                sys.stdin.fileno().
+
+        """
+        import asyncio
+        self._asyncio = asyncio
+        self._event = asyncio.Event()
+        self._event_loop = event_loop
+        self._input_fd = input_fd
+
+        self._configure()
+
+    def _configure(self):
+        """
+        Register the reader callback for the terminal input descriptor.
+
+        """
+        if self._input_fd is not None:
+            self._event_loop.add_reader(self._input_fd, self._event.set)
+
+    def close(self):
+        """
+        Unregister the reader callback.
+
+        """
+        if self._input_fd is not None:
+            self._event_loop.remove_reader(self._input_fd)
+
+    async def wait(self, timeout=None):
+        """
+        Wait until input is available, a wake-up occurs, or timeout elapses.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait. None waits
+                indefinitely.
+
+        Returns:
+            bool: True if woken by input or a wake-up, False on timeout.
+
+        """
+        try:
+            await self._asyncio.wait_for(self._event.wait(), timeout)
+        except self._asyncio.TimeoutError:
+            woken = False
+        else:
+            woken = True
+        self._event.clear()
+
+        return woken
+
+    def wake(self):
+        """
+        Wake the main loop coroutine. Safe to call from any thread.
+
+        """
+        self._event_loop.call_soon_threadsafe(self._event.set)
+
+
+class Timer:
+    """
+    A handle to a callback scheduled with a TimerScheduler.
+
+    Attributes:
+        callback (callable): Called with no arguments when the timer fires.
+        cancelled (bool): True if the timer will never fire again.
+        deadline (float): Scheduler clock time at which the timer next fires.
+        interval (float): Seconds between firings of a repeating timer. None
+            if the timer fires only once.
+
+    """
+
+    def __init__(self, deadline, callback, interval=None):
+        """
+        Constructor.
+
+        """
+        self.callback = callback
+        self.cancelled = False
+        self.deadline = deadline
+        self.interval = interval
+
+    def cancel(self):
+        """
+        Prevent the timer from firing. Safe to call more than once.
+
+        """
+        self.cancelled = True
+
+
+class TimerScheduler:
+    """
+    Runs one-shot and repeating callbacks on the main thread at deadlines.
+
+    Timers are kept in a binary heap ordered by deadline, so the nearest
+    deadline is always available in constant time. Cancelled timers are left
+    in the heap and discarded when they reach the top.
+
+    The main loop calls run_due() once per iteration and sleeps no longer than
+    time_until_next() between iterations.
+
+    Attributes:
+        _clock (callable): Returns a monotonic time in seconds.
+        _heap (list): Heap of tuples (deadline, sequence, timer). The sequence
+            number keeps timers with equal deadlines in scheduling order.
+        _sequence (itertools.count): Source of sequence numbers.
+
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Constructor.
+
+        Args:
+            clock (callable): Returns a monotonic time in seconds.
+
+        """
+        self._clock = clock
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        """
+        Implement the length interface.
+
+        Returns:
+            int: The number of timers that have not been cancelled.
+
+        """
+        return sum(1 for entry in self._heap if not entry[2].cancelled)
+
+    def _discard_cancelled(self):
+        """
+        Pop cancelled timers from the top of the heap.
+
+        """
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+
+    def _push(self, timer):
+        """
+        Push a timer onto the heap at its current deadline.
+
+        """
+        heapq.heappush(
+            self._heap, (timer.deadline, next(self._sequence), timer))
+
+    def call_later(self, delay, callback):
+        """
+        Schedule a callback to be called once after a delay.
+
+        Args:
+            delay (float): Number of seconds from now.
+            callback (callable): Called with no arguments.
+
+        Returns:
+            Timer: A handle that can be used to cancel the callback.
+
+        """
+        timer = Timer(self._clock() + delay, callback)
+        self._push(timer)
+
+        return timer
+
+    def call_repeating(self, interval, callback):
+        """
+        Schedule a callback to be called repeatedly at an interval.
+
+        The first call occurs one interval from now. If the main loop falls
+        behind, missed calls are skipped rather than run in a burst.
+
+        Args:
+            interval (float): Number of seconds between calls. Must be positive.
+            callback (callable): Called with no arguments.
+
+        Returns:
+            Timer: A handle that can be used to cancel the callback.
+
+        Raises:
+            ValueError: If interval is not positive.
+
+        """
+        if interval <= 0:
+            raise ValueError('Repeating timer interval must be positive.')
+
+        timer = Timer(self._clock() + interval, callback, interval=interval)
+        self._push(timer)
+
+        return timer
+
+    def run_due(self):
+        """
+        Call the callbacks of all timers whose deadlines have passed.
+
+        Timers scheduled by the callbacks themselves are not run until the next
+        call, even if already due.
+
+        """
+        now = self._clock()
+        due_timers = []
+        self._discard_cancelled()
+        while self._heap and self._heap[0][0] <= now:
+            deadline, sequence, timer = heapq.heappop(self._heap)
+            if not timer.cancelled:
+                due_timers.append(timer)
+            self._discard_cancelled()
+
+        for timer in due_timers:
+            if timer.cancelled:
+                continue
+            if timer.interval:
+                timer.deadline += timer.interval
+                if timer.deadline <= now:
+                    timer.deadline = now + timer.interval
+                self._push(timer)
+            else:
+                timer.cancel()
+            timer.callback()
+
+    def time_until_next(self):
+        """
+        Get the time remaining until the nearest deadline.
+
+        Returns:
+            float: Number of seconds, never negative. None if no timers are
+                scheduled.
+
+        """
+        self._discard_cancelled()
+        timeout = None
+        if self._heap:
+            timeout = max(0, self._heap[0][0] - self._clock())
+
+        return timeout
@@ -0,0 +1,214 @@
+"""
+Defines an executor that runs network I/O in priority lanes.
+
+Requests the user is waiting on must not queue behind background work such as
+prefetching. Work is therefore submitted to one of several lanes, each with
+its own workers. Workers take work from their own lane and from any lane of
+higher priority, so idle background workers help with bursts of interactive
+work, but interactive workers never run background work.
+
+"""
+
+import collections
+import concurrent.futures
+import threading
+
+class LaneExecutor(concurrent.futures.Executor):
+    """
+    An executor whose work is divided into lanes of decreasing priority.
+
+    Lanes are numbered from zero, the highest priority. A worker of lane n runs
+    the oldest work of the highest priority lane from zero to n that has any.
+    Work submitted with submit() goes to lane zero.
+
+    Worker threads are daemon threads, so that a request left running at exit
+    does not delay the exit. Call shutdown() to wait for them.
+
+    Attributes:
+        LANE_INTERACTIVE (int): The lane for work the user is waiting on.
+        LANE_BACKGROUND (int): The lane for work done ahead of need.
+        _condition (threading.Condition): Guards the queues and the shutdown
+            flag. Notified when work is queued or on shutdown.
+        _queues (list): A collections.deque per lane of tuples
+            (future, fn, args, kwargs).
+        _shutdown (bool): True once shutdown() has been called.
+        _threads (list): The worker threads.
+
+    """
+
+    LANE_INTERACTIVE = 0
+    LANE_BACKGROUND = 1
+
+    def __init__(self, lane_workers, thread_name_prefix='lane'):
+        """
+        Constructor.
+
+        Args:
+            lane_workers (list): The number of workers of each lane, in order
+                of decreasing priority.
+            thread_name_prefix (str): Prefix of the worker thread names.
+
+        Raises:
+            ValueError: If there are no lanes or a lane has no workers.
+
+        """
+        if not lane_workers or min(lane_workers) < 1:
+            raise ValueError('Every lane must have at least one worker.')
+
+        self._condition = threading.Condition()
+        self._queues = [collections.deque() for count in lane_workers]
+        self._shutdown = False
+        self._threads = []
+
+        for lane, worker_count in enumerate(lane_workers):
+            for worker_number in range(worker_count):
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    args=(lane,),
+                    name='{}-{}-{}'.format(
+                        thread_name_prefix, lane, worker_number),
+                    daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _pop_work(self, lane):
+        """
+        Remove the next work item that a worker of a lane may run.
+
+        Must be called with the condition held.
+
+        Returns:
+            tuple: (future, fn, args, kwargs), or None if there is none.
+
+        """
+        for queue in self._queues[0:lane + 1]:
+            if queue:
+                return queue.popleft()
+
+        return None
+
+    def _run_worker(self, lane):
+        """
+        Run work until shut down and out of work. Runs on a worker thread.
+
+        """
+        while True:
+            with self._condition:
+                work = self._pop_work(lane)
+                while work is None and not self._shutdown:
+                    self._condition.wait()
+                    work = self._pop_work(lane)
+            if work is None:
+                return
+
+            future, fn, args, kwargs = work
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exception:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+    def lane(self, lane):
+        """
+        Get an executor that submits work to a single lane.
+
+        Args:
+            lane (int): The lane number.
+
+        Returns:
+            concurrent.futures.Executor: Its shutdown() shuts down this
+                executor.
+
+        Raises:
+            ValueError: If the lane does not exist.
+
+        """
+        if lane not in range(len(self._queues)):
+            raise ValueError('Lane "' + str(lane) + '" does not exist.')
+
+        return _Lane(self, lane)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """
+        Override parent.
+
+        Work already queued is still run unless cancel_futures is true.
+
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues:
+                    while queue:
+                        queue.popleft()[0].cancel()
+            self._condition.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def submit(self, fn, /, *args, **kwargs):
+        """
+        Override parent.
+
+        Submits to the interactive lane.
+
+        """
+        return self.submit_to_lane(self.LANE_INTERACTIVE, fn, *args, **kwargs)
+
+    def submit_to_lane(self, lane, fn, /, *args, **kwargs):
+        """
+        Schedule a callable to be run by a worker of a lane or a lower lane.
+
+        Args:
+            lane (int): The lane number.
+            fn (callable): Called with args and kwargs.
+
+        Returns:
+            concurrent.futures.Future
+
+        Raises:
+            RuntimeError: If the executor has been shut down.
+
+        """
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot schedule work after shutdown.')
+            self._queues[lane].append((future, fn, args, kwargs))
+            self._condition.notify_all()
+
+        return future
+
+
+class _Lane(concurrent.futures.Executor):
+    """
+    An executor that submits work to one lane of a LaneExecutor.
+
+    """
+
+    def __init__(self, lane_executor, lane):
+        """
+        Constructor.
+
+        """
+        self._lane = lane
+        self._lane_executor = lane_executor
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """
+        Override parent.
+
+        """
+        self._lane_executor.shutdown(wait, cancel_futures=cancel_futures)
+
+    def submit(self, fn, /, *args, **kwargs):
+        """
+        Override parent.
+
+        """
+        return self._lane_executor.submit_to_lane(
+            self._lane, fn, *args, **kwargs)
@@ -1,11 +1,15 @@
 """
 Defines the application model components.
 
+The asyncio module is imported only by AsyncModel since the asyncio runtime is
+optional and the import noticeably delays startup.
+
 """
 
 import collections
 import concurrent.futures
 import functools
+import threading
 
 class Model:
     """
@@ -27,13 +31,28 @@ class Model:
     every which way are also leaked abstraction so I have chosen the option
     with the least impact on code maintainability and testability.
 
+    Rather than polling a future's done() method on every main loop iteration,
+    interested code registers a single callback with add_done_callback(). All
+    such callbacks are funnelled through one completion dispatcher and run on
+    the main thread, so the callback sprawl stays contained.
+
+    Optionally, all subresources of a user are prefetched in the background
+    once the user is resolved, so that they are already cached when the user
+    navigates to them. At most prefetch_limit prefetch requests are in flight
+    at once, leaving background workers and connections for other work.
+
     Attributes:
+        PREFETCH_LIMIT (int): The default maximum number of prefetch requests
+            in flight.
         USER_SUBRESRC_* (str): The subresources of a SoundCloud user
             that are available for the user to choose.
         _current_subresource (soundcloud.Resource): Data currently displayed
             by the view in the content region.
         _current_user (soundcloud.Resource): User data displayed by the view
             in the status region.
+        _prefetch_futures (set): The futures of prefetch requests in flight.
+        _prefetch_queue (collections.deque): Tuples (user_id, subresource)
+            waiting to be prefetched.
         _soundcloud_client (SoundcloudWrapper): Data access layer.
         signal_current_subresource (signalslot.Signal): Indicates that current
             SoundCloud user subresource displayed in the content region has
@@ -43,23 +62,33 @@ class Model:
 
     """
 
+    PREFETCH_LIMIT = 2
     USER_SUBRESRC_01_TRACKS = 'tracks'
     USER_SUBRESRC_02_PLAYLISTS = 'playlists'
     USER_SUBRESRC_03_FAVORITES = 'favorites'
     USER_SUBRESRC_04_FOLLOWINGS = 'followings'
     USER_SUBRESRC_05_FOLLOWERS = 'followers'
 
-    def __init__(self, soundcloud_client, signal_current_user):
+    def __init__(self, soundcloud_client, signal_current_user, prefetch=False,
+        prefetch_limit=PREFETCH_LIMIT):
         """
         Constructor.
 
         Args:
             soundcloud_client (SoundcloudWrapper):
+            prefetch (bool): If true, prefetch_user_subresources() fetches the
+                subresources of the current user. Otherwise, it does nothing.
+            prefetch_limit (int): The maximum number of prefetch requests in
+                flight.
 
         """
         self._current_user_subresource_data = None
         self._current_user_subresource_name = None
         self._current_user = None
+        self._prefetch = prefetch
+        self._prefetch_futures = set()
+        self._prefetch_limit = prefetch_limit
+        self._prefetch_queue = collections.deque()
         self._soundcloud_client = soundcloud_client
 
         self.avail_user_subresources = []
@@ -75,6 +104,32 @@ class Model:
         """
         return self._soundcloud_client.HTTP_ERROR
 
+    def _end_prefetch(self, future):
+        """
+        Start the next queued prefetch once one has completed.
+
+        Registered with the completion dispatcher. Failed prefetches are
+        ignored; the data is requested again when it is needed.
+
+        """
+        self._prefetch_futures.discard(future)
+        self._prefetch_next()
+
+    def _prefetch_next(self):
+        """
+        Start queued prefetches until the limit of requests in flight is met.
+
+        """
+        while self._prefetch_queue \
+            and len(self._prefetch_futures) < self._prefetch_limit:
+            user_id, subresource = self._prefetch_queue.popleft()
+            future = self._soundcloud_client.get_user_subresource(
+                user_id, subresource, background=True)
+            if not future.done():
+                self._prefetch_futures.add(future)
+                self._soundcloud_client.add_done_callback(
+                    future, self._end_prefetch)
+
     def _init_avail_user_subresources(self):
         """
         Initialize the available user subresources' strings.
@@ -103,6 +158,20 @@ class Model:
         self._current_user = user
         self.signal_change_current_user.emit()
 
+    def add_done_callback(self, future, callback):
+        """
+        Register a callback to be run on the main thread once future is done.
+
+        Callbacks are run during run_interval_tasks() in completion order. This
+        avoids polling futures for completion on every main loop iteration.
+
+        Args:
+            future: A future returned by one of this model's methods.
+            callback (callable): Called with the future as its only argument.
+
+        """
+        self._soundcloud_client.add_done_callback(future, callback)
+
     def get_user(self, user_id=None, username=None):
         """
         Get the user data object for a given user identifier.
@@ -148,6 +217,25 @@ class Model:
         return self._soundcloud_client.get_user_subresource(
             user_id, subresource)
 
+    def prefetch_user_subresources(self):
+        """
+        Fetch all subresources of the current user in the background.
+
+        Subresources are requested in nav order. Those already cached or
+        requested are not requested again. Prefetches still queued for a
+        previous user are discarded. NOOP if prefetching is disabled.
+
+        """
+        if not self._prefetch:
+            return
+
+        user_id = str(self._current_user.id)
+        self._prefetch_queue.clear()
+        self._prefetch_queue.extend(
+            (user_id, subresource)
+            for subresource in self.avail_user_subresources)
+        self._prefetch_next()
+
     def run_interval_tasks(self):
         """
         Run tasks once per main loop iteration. Called in main loop.
@@ -165,6 +253,90 @@ class Model:
         self._current_user_subresource_data = data
         self._current_user_subresource_name = name
 
+    def warm_up_connection(self):
+        """
+        Open a connection to the API host in the background.
+
+        Designed to be called while the user is busy, for instance typing a
+        username, so that the next request does not wait for the DNS lookup and
+        the TCP and TLS handshakes.
+
+        """
+        self._soundcloud_client.warm_up_connection()
+
+
+class AsyncModel(Model):
+    """
+    A model whose data access methods return asyncio awaitables.
+
+    The network I/O itself still takes place on the wrapper's executor since
+    the soundcloud library is blocking. The returned asyncio futures expose the
+    same done(), exception(), and result() interface as those of the parent
+    class and can additionally be awaited by coroutines on the event loop.
+
+    Futures that are already done, such as those of cache hits, are copied
+    into asyncio futures that are done on return. A wrapped future would only
+    be marked done once the event loop next runs.
+
+    """
+
+    def __init__(self, soundcloud_client, signal_current_user, event_loop,
+        **kwargs):
+        """
+        Constructor.
+
+        Args:
+            event_loop (asyncio.AbstractEventLoop): The loop to which returned
+                futures are bound.
+            kwargs: Passed to the parent constructor.
+
+        """
+        super().__init__(soundcloud_client, signal_current_user, **kwargs)
+
+        self._event_loop = event_loop
+
+    def _wrap_future(self, future):
+        """
+        Wrap a concurrent.futures.Future in an asyncio future.
+
+        Returns:
+            asyncio.Future: Done on return if future is done.
+
+        """
+        import asyncio
+        if not future.done() or future.cancelled():
+            return asyncio.wrap_future(future, loop=self._event_loop)
+
+        async_future = self._event_loop.create_future()
+        if future.exception():
+            async_future.set_exception(future.exception())
+        else:
+            async_future.set_result(future.result())
+
+        return async_future
+
+    def get_user(self, user_id=None, username=None):
+        """
+        Override parent.
+
+        Returns:
+            asyncio.Future
+
+        """
+        return self._wrap_future(
+            super().get_user(user_id=user_id, username=username))
+
+    def get_user_subresource(self, user_id, subresource):
+        """
+        Override parent.
+
+        Returns:
+            asyncio.Future
+
+        """
+        return self._wrap_future(
+            super().get_user_subresource(user_id, subresource))
+
 
 class SoundcloudWrapper:
     """
@@ -176,74 +348,261 @@ class SoundcloudWrapper:
     Currently, caching is done in memory but this separate layer of abstraction
     will allow for persistent storage in the future.
 
+    The soundcloud client is not passed in directly. Instead, a factory is
+    called on first use, normally on the executor's thread, so that the
+    network stack is imported and initialized off the main thread while the UI
+    is already displayed. Calling start() begins this immediately.
+
+    The wrapper owns the HTTP session through which the client makes all of
+    its requests. The session keeps connections alive in a pool, so API calls
+    after the first skip the DNS lookup and the TCP and TLS handshakes. The
+    pool opens at most pool_maxsize connections to each of up to
+    pool_connections hosts. Requests made while all connections to a host are
+    busy wait for one to be returned to the pool.
+
+    Requests are run on one of two executors. Requests the user is waiting on
+    are submitted to thread_executor. Requests made ahead of need may be
+    submitted to background_executor instead, so that they never delay the
+    former. Normally, both are lanes of one executors.LaneExecutor.
+
+    Identical requests are coalesced. Data is cached only once its request
+    completes, so a request repeated in the meantime, for instance by cycling
+    the nav items, would otherwise be sent again. Instead, the caller receives
+    the future of the request already in flight. If that request was made in
+    the background and has not yet started, it is moved to thread_executor.
+    The in-flight table is only accessed on the main thread.
+
     Attributes:
+        POOL_CONNECTIONS (int): Default number of hosts whose connections are
+            pooled.
+        POOL_MAXSIZE (int): Default maximum number of connections per host.
+        WARM_UP_TIMEOUT (float): Seconds to wait for a connection warm-up.
+        dedupe_hit_count (int): The number of requests that were coalesced
+            with a request already in flight.
         _cached_usernames (dict): A mapping of usernames to user IDs.
         _cached_users (dict): Map of user IDs to the respective user data. Data
             is contained primarily in soundcloud.Resource objects.
+        _client_factory (callable): Returns a soundcloud.Client.
+        _client_lock (threading.Lock): Guards the creation of the client.
+        _http_error (Exception): The client's HTTP_ERROR, once the client is
+            created.
+        _http_session (requests.Session): The session, once created.
+        _requests_in_flight (dict): Maps tuples (fn, args), identifying the
+            endpoint and parameters of a request, to tuples (future,
+            work_future, background). The future is the one returned to
+            callers. The work future is that of the submitted work.
+        _soundcloud_client (soundcloud.Client): The client, once created.
+        _warm_up_future (concurrent.futures.Future): The future of the last
+            connection warm-up, if any.
 
     """
 
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 4
+    WARM_UP_TIMEOUT = 5.0
     _SC_DOMAIN_NAME = 'soundcloud.com'
 
-    def __init__(self, soundcloud_client, thread_executor):
+    def __init__(self, client_factory, thread_executor,
+        completion_dispatcher, pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE, background_executor=None):
         """
         Constructor.
 
+        Args:
+            client_factory (callable): Called with a requests.Session, returns
+                a soundcloud.Client with an added HTTP_ERROR attribute. The
+                client must make its requests through the session.
+            completion_dispatcher (CompletionDispatcher): From local events
+                module. Delivers completed futures to the caching methods and
+                to any other interested callers on the main thread.
+            pool_connections (int): The number of hosts whose connections are
+                pooled.
+            pool_maxsize (int): The maximum number of connections per host.
+            background_executor (concurrent.futures.Executor): Runs background
+                requests. If None, they are run by thread_executor.
+
+        Raises:
+            ValueError: If a pool size is less than one.
+
         """
-        self._cache_queue = collections.deque()
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError('Connection pool sizes must be at least one.')
+
+        self._background_executor = background_executor or thread_executor
         self._cached_usernames = {}
         self._cached_users = {}
-        self._soundcloud_client = soundcloud_client
+        self._client_factory = client_factory
+        self._client_lock = threading.Lock()
+        self._completion_dispatcher = completion_dispatcher
+        self._http_error = ()
+        self._http_session = None
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._requests_in_flight = {}
+        self._soundcloud_client = None
         self._thread_executor = thread_executor
+        self._warm_up_future = None
+
+        self.dedupe_hit_count = 0
 
     @property
     def HTTP_ERROR(self):
         """
         Get the wrapper's constant HTTP exception property.
 
+        Read on the main thread, so the client is not created here. Until it
+        is, no request can have raised an HTTP error and an empty tuple, which
+        no exception is an instance of, is returned instead.
+
         """
-        return self._soundcloud_client.HTTP_ERROR
+        return self._http_error
 
     def _cache_user(self, future):
         """
         Cache user data object returned by SoundCloud API.
 
-        Designed to be called as part of the main loop (interval tasks). Will
-        only cache data if future is done and no exceptions were raised.
+        Designed to be registered with the completion dispatcher and therefore
+        called on the main thread once the future is done. Will only cache data
+        if no exceptions were raised.
+
+        """
+        if not future.exception():
+            user = future.result()
+            self._cached_usernames[user.username] = str(user.id)
+            self._cached_users[str(user.id)] = user
+
+    def _cache_user_subresource(self, user_id, subresource, future):
+        """
+        Cache user subresource data object returned by SoundCloud API.
+
+        Designed to be bound with functools.partial and registered with the
+        completion dispatcher. Will only cache data if no exceptions were
+        raised.
+
+        """
+        if not future.exception():
+            data = future.result()
+            setattr(self._cached_users[user_id], subresource, data)
+
+    @staticmethod
+    def _create_completed_future(result):
+        """
+        Create a future that is already done, for data served from the cache.
+
+        The concurrent.futures documentation reserves the creation of futures
+        for executors and tests. A cache hit is nevertheless better served by a
+        completed future than by a round trip through the executor, which could
+        queue the hit behind a slow request and delays its delivery by at least
+        one main loop iteration.
 
         Returns:
-            bool: True if cached, false otherwise.
+            concurrent.futures.Future
 
         """
-        cache_completed = False
-        if future.done():
-            cache_completed = True
-            if not future.exception():
-                user = future.result()
-                self._cached_usernames[user.username] = user.id
-                self._cached_users[str(user.id)] = user
+        future = concurrent.futures.Future()
+        future.set_result(result)
 
-        return cache_completed
+        return future
 
-    def _cache_user_subresource(self, future, user_id, subresource):
+    def _create_http_session(self):
         """
-        Cache user subresource data object returned by SoundCloud API.
+        Create the pooled HTTP session. Runs on the executor's thread.
+
+        Returns:
+            requests.Session
 
-        Designed to be called as part of the main loop (interval tasks). Will
-        only cache data if future is done and no exceptions were raised.
+        """
+        import requests
+        import requests.adapters
+
+        http_session = requests.Session()
+        for prefix in ('http://', 'https://'):
+            http_session.mount(prefix, requests.adapters.HTTPAdapter(
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+                pool_block=True))
+
+        return http_session
+
+    def _end_request(self, key, future):
+        """
+        Remove a completed request from the in-flight table.
+
+        Designed to be bound with functools.partial and registered with the
+        completion dispatcher after the caching callback, so that a request
+        repeated at any time finds either the request or its cached data.
+
+        """
+        del self._requests_in_flight[key]
+
+    def _fetch(self, path, **params):
+        """
+        Make a GET request to the API. Runs on the executor's thread.
+
+        Returns:
+            soundcloud.Resource: The response data.
+
+        """
+        return self._get_client().get(path, **params)
+
+    def _get_client(self):
+        """
+        Get the soundcloud client, creating it on first use.
+
+        Returns:
+            soundcloud.Client
+
+        """
+        with self._client_lock:
+            if self._soundcloud_client is None:
+                self._http_session = self._create_http_session()
+                self._soundcloud_client = self._client_factory(
+                    self._http_session)
+                self._http_error = self._soundcloud_client.HTTP_ERROR
+
+        return self._soundcloud_client
+
+    def _resolve_username(self, username):
+        """
+        Resolve a username to a user. Runs on the executor's thread.
 
         Returns:
-            bool: True if cached, false otherwise.
+            soundcloud.Resource: The user data.
 
         """
-        cache_completed = False
-        if future.done():
-            cache_completed = True
-            if not future.exception():
-                data = future.result()
-                setattr(self._cached_users[user_id], subresource, data)
+        return self._fetch(
+            '/resolve', url=self._construct_permalink_url('/' + username))
 
-        return cache_completed
+    @staticmethod
+    def _run_after_warm_up(warm_up_future, fn, *args):
+        """
+        Wait for a connection warm-up, then call fn. Runs on the executor's
+        thread.
+
+        The warm-up was submitted first, so another worker has started or is
+        about to start it.
+
+        """
+        concurrent.futures.wait([warm_up_future])
+
+        return fn(*args)
+
+    def _warm_up(self):
+        """
+        Open a pooled connection to the API host. Runs on the executor's thread.
+
+        A HEAD request is made to the API root. Its response is irrelevant; the
+        connection it leaves in the session's pool is what is wanted. As this
+        is merely an optimization, all errors are ignored.
+
+        """
+        client = self._get_client()
+        try:
+            self._http_session.head(
+                client.scheme + client.host + '/',
+                timeout=self.WARM_UP_TIMEOUT)
+        except Exception:
+            pass
 
     def _construct_permalink_url(self, path):
         """ Given a soundcloud.com URL path, returns a string containing
@@ -254,24 +613,115 @@ class SoundcloudWrapper:
         "https://soundcloud.com/monotonee".
 
         """
-        return self._soundcloud_client.scheme \
+        return self._get_client().scheme \
             + self._SC_DOMAIN_NAME \
             + path
 
-    def _execute_cache_stack(self):
+    @staticmethod
+    def _settle_future(future, work_future):
         """
-        Execute the required caching functions in the queue.
+        Copy the outcome of submitted work to the future returned to callers.
 
-        If a caching function returns true, remove it from the queue and execute
-        next function in queue. Break as soon as a function returns false.
+        Designed to be bound with functools.partial and added to the work
+        future as a done callback. Work cancelled because it was resubmitted is
+        ignored.
 
         """
-        while self._cache_queue:
-            cache_completed = self._cache_queue[0]()
-            if cache_completed:
-                self._cache_queue.popleft()
-            else:
-                break
+        if work_future.cancelled():
+            return
+
+        if work_future.exception():
+            future.set_exception(work_future.exception())
+        else:
+            future.set_result(work_future.result())
+
+    def _start_work(self, future, fn, args, background):
+        """
+        Submit request work whose outcome is copied to future.
+
+        Returns:
+            concurrent.futures.Future: The work future.
+
+        """
+        work_future = self._submit(fn, *args, background=background)
+        work_future.add_done_callback(
+            functools.partial(self._settle_future, future))
+
+        return work_future
+
+    def _submit(self, fn, *args, background=False):
+        """
+        Submit a callable to the executor.
+
+        While a connection warm-up is in flight, the callable waits for it
+        before running so that it reuses the warmed connection. Otherwise, with
+        several workers, it would run alongside the warm-up and open a
+        connection of its own.
+
+        Args:
+            background (bool): If true, submit to the background executor.
+
+        Returns:
+            concurrent.futures.Future
+
+        """
+        warm_up_future = self._warm_up_future
+        if warm_up_future is not None and not warm_up_future.done():
+            args = (warm_up_future, fn) + args
+            fn = self._run_after_warm_up
+
+        if background:
+            return self._background_executor.submit(fn, *args)
+
+        return self._thread_executor.submit(fn, *args)
+
+    def _submit_request(self, cache_callback, fn, *args, background=False):
+        """
+        Submit a request unless an identical request is already in flight.
+
+        Args:
+            cache_callback (callable): Registered with the completion
+                dispatcher to cache the data of a new request.
+            fn (callable): Makes the request. Called with args.
+            background (bool): If true, a new request is made on the
+                background executor.
+
+        Returns:
+            concurrent.futures.Future
+
+        """
+        key = (fn, args)
+        if key in self._requests_in_flight:
+            self.dedupe_hit_count += 1
+            future, work_future, in_background = self._requests_in_flight[key]
+            if in_background and not background and work_future.cancel():
+                self._requests_in_flight[key] = (
+                    future, self._start_work(future, fn, args, False), False)
+            return future
+
+        future = concurrent.futures.Future()
+        self._requests_in_flight[key] = (
+            future, self._start_work(future, fn, args, background), background)
+        self.add_done_callback(future, cache_callback)
+        self.add_done_callback(
+            future, functools.partial(self._end_request, key))
+
+        return future
+
+    def add_done_callback(self, future, callback):
+        """
+        Register a callback to be run on the main thread once future is done.
+
+        Callbacks are run by run_interval_tasks() in completion order. Callbacks
+        registered by this wrapper's own caching are always run before those
+        registered afterward by calling code.
+
+        Args:
+            future: A future returned by one of this wrapper's methods.
+            callback (callable): Called with the future as its only argument.
+
+        """
+        self._completion_dispatcher.register(future, callback)
 
     def get_user(self, user_id=None, username=None):
         """
@@ -290,8 +740,8 @@ class SoundcloudWrapper:
         underlying HTTP library, "request", leak through the abstraction by
         allowing its HTTPException to propagate.
 
-        If available, cached data will be returned instead of making a new
-        network request to the remote API.
+        If available, cached data will be returned in an already completed
+        future instead of making a new network request to the remote API.
 
         See:
             https://developers.soundcloud.com/docs/api/reference#resolve
@@ -312,72 +762,63 @@ class SoundcloudWrapper:
         if (user_id and username) or (not user_id and not username):
             raise RuntimeError('Must pass only a single user identifier.')
 
-        # Check cache first. The concurrent.futures.Future documentaion states
-        # that futures should not be created directly so, to produce a future,
-        # even cache fetches are submitted to executor for now. This smells.
+        # Check cache first.
         cached_data_used = False
         if username and username in self._cached_usernames:
             user_id = self._cached_usernames[username]
         if user_id and user_id in self._cached_users:
-            bound_callable = functools.partial(
-                lambda user: user, self._cached_users[user_id])
-            future = self._thread_executor.submit(bound_callable)
+            future = self._create_completed_future(self._cached_users[user_id])
             cached_data_used = True
 
         # If neccesary, choose API call and execute.
         if not cached_data_used:
             if username:
-                future = self._thread_executor.submit(
-                    self._soundcloud_client.get,
-                    '/resolve',
-                    url=self._construct_permalink_url('/' + str(username)))
+                future = self._submit_request(
+                    self._cache_user, self._resolve_username, str(username))
             else:
-                future = self._thread_executor.submit(
-                    self._soundcloud_client.get,
-                    '/users/' + user_id)
-            self._cache_queue.append(
-                    functools.partial(self._cache_user, future))
+                future = self._submit_request(
+                    self._cache_user, self._fetch, '/users/' + user_id)
 
         return future
 
-    def get_user_subresource(self, user_id, subresource):
+    def get_user_subresource(self, user_id, subresource, background=False):
         """
         Retrieve user subresource data.
 
         User subresource data examples include a user's favorites, playlists,
         tracks, etc.
 
+        If available, cached data will be returned in an already completed
+        future.
+
         See: https://developers.soundcloud.com/docs/api/reference#users
 
         Args:
             user_id (str): A SoundCloud user ID.
             subresource (str): One of the available subresource strings.
+            background (bool): If true, any request is made on the background
+                executor.
 
         Returns:
             concurrent.futures.Future
 
         """
-        # Check cache first. The concurrent.futures.Future documentaion states
-        # that futures should not be created directly so, to produce a future,
-        # even cache fetches are submitted to executor for now. This smells.
+        # Check cache first.
         cached_data_used = False
         if user_id in self._cached_users:
             cached_subresource = getattr(
                 self._cached_users[user_id], subresource, None)
-            if cached_subresource:
-                bound_callable = functools.partial(
-                    lambda subresrc: subresrc, cached_subresource)
-                future = self._thread_executor.submit(bound_callable)
+            if cached_subresource is not None:
+                future = self._create_completed_future(cached_subresource)
                 cached_data_used = True
 
         # If neccesary, choose API call and execute.
         if not cached_data_used:
-            future = self._thread_executor.submit(
-                self._soundcloud_client.get,
-                '/users/' + user_id + '/' + subresource)
-            self._cache_queue.append(
+            future = self._submit_request(
                 functools.partial(
-                    self._cache_user_subresource, future, user_id, subresource))
+                    self._cache_user_subresource, user_id, subresource),
+                self._fetch, '/users/' + user_id + '/' + subresource,
+                background=background)
 
         return future
 
@@ -385,8 +826,37 @@ class SoundcloudWrapper:
         """
         Run tasks once per main loop iteration.
 
+        Delivers all futures that have completed since the last iteration.
+
         """
-        self._execute_cache_stack()
+        self._completion_dispatcher.dispatch()
+
+    def start(self):
+        """
+        Begin creating the soundcloud client on the executor's thread.
+
+        Requests submitted afterward are queued behind the client creation.
+
+        Returns:
+            concurrent.futures.Future
+
+        """
+        return self._submit(self._get_client)
+
+    def warm_up_connection(self):
+        """
+        Open a connection to the API host on the executor's thread.
+
+        Requests submitted while the warm-up is in flight wait for it and then
+        reuse the connection.
+
+        Returns:
+            concurrent.futures.Future
+
+        """
+        self._warm_up_future = self._submit(self._warm_up)
+
+        return self._warm_up_future
 
 
 
@@ -0,0 +1,250 @@
+"""
+Defines classes that measure where the main loop spends its time.
+
+Each main loop iteration is divided into phases. A profiler times each phase
+and keeps a rolling latency histogram per phase, from which percentiles are
+reported. Profiling is opt-in; when disabled, a null profiler with the same
+interface is used so that the main loop need not check.
+
+"""
+
+import collections
+import json
+import math
+import time
+
+class LatencyHistogram:
+    """
+    A rolling window of latency samples from which percentiles are computed.
+
+    Only the most recent samples are kept so that the reported percentiles
+    reflect recent behavior rather than the whole session.
+
+    Attributes:
+        _samples (collections.deque): The most recent samples, in seconds.
+        count (int): The total number of samples ever added.
+        maximum (float): The largest sample ever added, in seconds.
+
+    """
+
+    def __init__(self, window_size):
+        """
+        Constructor.
+
+        Args:
+            window_size (int): The maximum number of samples kept.
+
+        """
+        self._samples = collections.deque(maxlen=window_size)
+        self.count = 0
+        self.maximum = 0.0
+
+    def __len__(self):
+        """
+        Implement the length interface.
+
+        Returns:
+            int: The number of samples in the window.
+
+        """
+        return len(self._samples)
+
+    def add(self, sample):
+        """
+        Add a sample to the window, evicting the oldest if full.
+
+        Args:
+            sample (float): A duration in seconds.
+
+        """
+        self._samples.append(sample)
+        self.count += 1
+        if sample > self.maximum:
+            self.maximum = sample
+
+    def percentile(self, percent):
+        """
+        Compute a percentile of the samples in the window.
+
+        Uses the nearest-rank method, so the result is always an actual sample.
+
+        Args:
+            percent (float): A percentage between 0 and 100.
+
+        Returns:
+            float: The percentile in seconds, or None if there are no samples.
+
+        """
+        if not self._samples:
+            return None
+
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+
+        return ordered[rank - 1]
+
+    def summarize(self):
+        """
+        Summarize the histogram.
+
+        Returns:
+            dict: The sample counts and the p50, p95, p99, and maximum
+                latencies in milliseconds.
+
+        """
+        summary = {'count': self.count, 'window': len(self._samples)}
+        for percent in (50, 95, 99):
+            value = self.percentile(percent)
+            summary['p{}_ms'.format(percent)] = \
+                None if value is None else value * 1000
+        summary['max_ms'] = self.maximum * 1000
+
+        return summary
+
+
+class LoopProfiler:
+    """
+    Times the phases of main loop iterations.
+
+    The main loop calls begin_iteration() at the start of an iteration,
+    mark() at the end of each phase, and end_iteration() when done. The
+    duration of each phase is the time since the previous mark. The whole
+    iteration, excluding time spent waiting for events, is recorded under
+    ITERATION_PHASE.
+
+    Histograms are exported as JSON to a file when export() is called. An
+    export may also be requested asynchronously, for example from a signal
+    handler, with request_export(). The export then occurs at the end of the
+    current or next iteration.
+
+    Attributes:
+        DEFAULT_WINDOW_SIZE (int): Default number of samples kept per phase.
+        ITERATION_PHASE (str): The phase name under which whole iterations
+            are recorded.
+        _clock (callable): Returns a monotonic time in seconds.
+        _export_path (str): The path of the file to which to export.
+        _export_requested (bool): True if an export is due at iteration end.
+        _histograms (dict): Maps phase names to LatencyHistogram instances, in
+            order of first measurement.
+        _iteration_start (float): Clock time at which the iteration began.
+        _last_mark (float): Clock time of the most recent mark.
+        _window_size (int): Number of samples kept per phase.
+
+    """
+
+    DEFAULT_WINDOW_SIZE = 1024
+    ITERATION_PHASE = 'iteration'
+
+    def __init__(self, export_path, window_size=DEFAULT_WINDOW_SIZE,
+        clock=time.perf_counter):
+        """
+        Constructor.
+
+        Args:
+            export_path (str): The path of the file to which to export.
+            window_size (int): Number of samples kept per phase.
+            clock (callable): Returns a monotonic time in seconds.
+
+        """
+        self._clock = clock
+        self._export_path = export_path
+        self._export_requested = False
+        self._histograms = {}
+        self._iteration_start = None
+        self._last_mark = None
+        self._window_size = window_size
+
+    def _record(self, phase, duration):
+        """
+        Add a sample to the histogram of a phase, creating it if necessary.
+
+        """
+        try:
+            histogram = self._histograms[phase]
+        except KeyError:
+            histogram = LatencyHistogram(self._window_size)
+            self._histograms[phase] = histogram
+        histogram.add(duration)
+
+    def begin_iteration(self):
+        """
+        Mark the start of a main loop iteration.
+
+        """
+        self._iteration_start = self._last_mark = self._clock()
+
+    def end_iteration(self):
+        """
+        Mark the end of a main loop iteration.
+
+        Performs a pending export request, if any.
+
+        """
+        self._record(
+            self.ITERATION_PHASE, self._clock() - self._iteration_start)
+        if self._export_requested:
+            self.export()
+
+    def export(self):
+        """
+        Write the summaries of all histograms to the export file as JSON.
+
+        """
+        self._export_requested = False
+        with open(self._export_path, 'w') as export_file:
+            json.dump(self.summarize(), export_file, indent=4)
+            export_file.write('\n')
+
+    def mark(self, phase):
+        """
+        Mark the end of a phase and record its duration.
+
+        Args:
+            phase (str): The name of the phase that has just ended.
+
+        """
+        now = self._clock()
+        self._record(phase, now - self._last_mark)
+        self._last_mark = now
+
+    def request_export(self):
+        """
+        Request an export at the end of the current or next iteration.
+
+        Only sets a flag and is therefore safe to call from a signal handler.
+
+        """
+        self._export_requested = True
+
+    def summarize(self):
+        """
+        Summarize all histograms.
+
+        Returns:
+            dict: Maps phase names to histogram summaries.
+
+        """
+        return {phase: histogram.summarize()
+            for phase, histogram in self._histograms.items()}
+
+
+class NullLoopProfiler:
+    """
+    A profiler that does nothing. Used when profiling is disabled.
+
+    """
+
+    def begin_iteration(self):
+        pass
+
+    def end_iteration(self):
+        pass
+
+    def export(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def request_export(self):
+        pass
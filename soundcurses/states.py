@@ -20,7 +20,6 @@ probably be implemented instead.
 
 import abc
 import datetime
-import time
 
 class BaseState(metaclass=abc.ABCMeta):
     """
@@ -51,26 +50,26 @@ class BaseState(metaclass=abc.ABCMeta):
         """
         Display a message window in the view for a few seconds.
 
-        Manual rendering must be performed since this function will be
-        blocking this thread's main loop that contains the interval
-        render call.
+        The message is displayed as a toast that dismisses itself. This method
+        does not block and the main loop continues to run while the message is
+        displayed.
 
         Args:
             message (str): The message to display in the window.
 
         """
-        self._view.show_message(message)
-        self._view.render()
-        time.sleep(2)
-        self._view.hide_message()
+        self._view.show_toast(message)
 
     @abc.abstractmethod
-    def handle_action(self, action):
+    def handle_action(self, action, count=1):
         """
         Perform tasks in response to user input.
 
         Args:
             action: A constant value from the local user input module.
+            count (int): The number of consecutive times the action was
+                received. Only repeatable actions are ever folded into a count
+                greater than one.
 
         """
         pass
@@ -128,12 +127,14 @@ class HelpState(BaseState):
 
         self._view = view
 
-    def handle_action(self, action):
+    def handle_action(self, action, count=1):
         """
         Perform tasks in response to user input.
 
         Args:
             action: A constant value from the local user input module.
+            count (int): The number of consecutive times the action was
+                received.
 
         """
         if action == self._input_mapper.ACTION_CLOSE:
@@ -192,24 +193,39 @@ class NoUsernameState(BaseState):
         """
         Attempt to get a username from the user.
 
+        The prompt blocks until the user presses Enter, so a connection to the
+        API host is warmed up in the background meanwhile.
+
         """
+        self._model.warm_up_connection()
         username = self._view.prompt_username()
         self._view.show_loading_indicator()
         self._future_resolve_username = self._model.get_user(username=username)
+        self._model.add_done_callback(
+            self._future_resolve_username, self._verify_username)
 
-    def _verify_username(self):
+    def _verify_username(self, future):
         """
         Verify the results of a username resolution call.
 
+        Registered with the model as the future's done callback. Results of
+        futures that have been superseded by another prompt, or that complete
+        after this state was unloaded, are ignored.
+
         If the username was invalid, briefly display a message to the user
         indicating such. Does not automatically re-prompt the user.
 
         If the attempt to get user data failed in some other way, re-raises
         the exception and allows it to propagate.
 
+        Args:
+            future: The future returned by the model's get_user method.
+
         """
+        if future is not self._future_resolve_username:
+            return
+
         # Reset future attribute since the future has been consumed.
-        future = self._future_resolve_username
         self._future_resolve_username = None
 
         # The self._model.HTTP_ERROR indicates that username could not be
@@ -218,9 +234,6 @@ class NoUsernameState(BaseState):
             username_not_resolved = isinstance(
                 future.exception(), self._model.HTTP_ERROR)
             if username_not_resolved:
-                # Manual rendering must be performed since this function will be
-                # blocking this thread's main loop that contains the interval
-                # render call.
                 self._view.hide_loading_indicator()
                 self._display_temp_message(
                     'Username not found. Please try again.')
@@ -235,8 +248,9 @@ class NoUsernameState(BaseState):
                     self._view.selected_nav_item,
                     self._controller,
                     previous_state=self))
+            self._model.prefetch_user_subresources()
 
-    def handle_action(self, action):
+    def handle_action(self, action, count=1):
         """
         Override parent.
 
@@ -252,21 +266,21 @@ class NoUsernameState(BaseState):
                 self._state_factory.create_help(
                     self._controller, previous_state=self))
 
-    def run_interval_tasks(self):
+    def start(self):
         """
         Override parent.
 
         """
-        if self._future_resolve_username \
-            and self._future_resolve_username.done():
-            self._verify_username()
+        self._prompt_username()
 
-    def start(self):
+    def stop(self):
         """
         Override parent.
 
+        Any pending username resolution is abandoned.
+
         """
-        self._prompt_username()
+        self._future_resolve_username = None
 
 
 class SubresourceState(BaseState):
@@ -299,43 +313,40 @@ class SubresourceState(BaseState):
     SUBRESOURCE_LOADING_DELAY = 1.0
 
     def __init__(self, input_mapper, controller, state_factory, view, model,
-        previous_state=None):
+        scheduler, previous_state=None):
         """
         Constructor.
 
+        Args:
+            scheduler (TimerScheduler): From local events module. Used to
+                debounce nav item cycling.
+
         """
         super().__init__(input_mapper, controller, state_factory, view,
             previous_state=previous_state)
 
         self._model = model
-        self._nav_item_cycle_timestamp = None
-        self._nav_item_cycled = False
+        self._nav_item_cycle_timer = None
+        self._scheduler = scheduler
         self._view = view
 
-    def _check_nav_item_cycle_timer(self):
+    def _cycle_nav_item(self):
         """
-        Execute subresource loading if the nav item delay has elapsed.
+        Select the next nav item and restart subresource loading timer.
 
         When cycling through nav items (each corresponding to a user
         subresource), the subresource will not be immediately loaded into the
-        content region. Once a given nav item remains selected for a certain
-        amount of time, only then will the corresponding subresource be loaded.
-
-        """
-        if self._nav_item_cycled:
-            time_elapsed = time.time() - self._nav_item_cycle_timestamp
-            if time_elapsed >= self.SUBRESOURCE_LOADING_DELAY:
-                self._nav_item_cycle_timestamp = None
-                self._nav_item_cycled = False
-
-    def _cycle_nav_item(self):
-        """
-        Select the next nav item and start subresource loading timer.
+        content region. Each cycle cancels the pending timer so that only once a
+        given nav item remains selected for a certain amount of time will the
+        corresponding subresource be loaded.
 
         """
         self._view.select_next_nav_item()
-        self._nav_item_cycle_timestamp = time.time()
-        self._nav_item_cycled = True
+        if self._nav_item_cycle_timer:
+            self._nav_item_cycle_timer.cancel()
+        self._nav_item_cycle_timer = self._scheduler.call_later(
+            self.SUBRESOURCE_LOADING_DELAY,
+            self._handle_nav_item_cycle_timer)
 
     def _format_track_line_list(self, tracks_list):
         """
@@ -367,6 +378,15 @@ class SubresourceState(BaseState):
 
         return lines_list
 
+    def _handle_nav_item_cycle_timer(self):
+        """
+        Execute subresource loading once the nav item delay has elapsed.
+
+        Designed to be called by the scheduler.
+
+        """
+        self._nav_item_cycle_timer = None
+
     def _load_user_subresource(self, subresource):
         """
         Fetch subresource data from model and set to current subresource.
@@ -383,12 +403,14 @@ class SubresourceState(BaseState):
         return self._model.get_user_subresource(
             str(self._model.current_user.id), subresource)
 
-    def handle_action(self, action):
+    def handle_action(self, action, count=1):
         """
         Perform tasks in response to user input.
 
         Args:
             action: A constant value from the local user input module.
+            count (int): The number of consecutive times the action was
+                received.
 
         """
         if action == self._input_mapper.ACTION_QUIT:
@@ -404,14 +426,6 @@ class SubresourceState(BaseState):
                 self._state_factory.create_help(
                     self._controller, previous_state=self))
 
-    def run_interval_tasks(self):
-        """
-        Override parent.
-
-        """
-        self._check_nav_item_cycle_timer()
-        # self._check_user_subresrc_future()
-
     def start(self):
         """
         Perform main tasks immediately after state is loaded.
@@ -425,7 +439,9 @@ class SubresourceState(BaseState):
         Perform tasks immediately before state is unloaded.
 
         """
-        pass
+        if self._nav_item_cycle_timer:
+            self._nav_item_cycle_timer.cancel()
+            self._nav_item_cycle_timer = None
 
 
 class TracksLoadedState(SubresourceState):
@@ -435,38 +451,36 @@ class TracksLoadedState(SubresourceState):
     """
 
     def __init__(self, input_mapper, controller, state_factory, view, model,
-        previous_state=None):
+        scheduler, previous_state=None):
         """
         Constructor
 
         """
         super().__init__(input_mapper, controller, state_factory, view, model,
-        previous_state=previous_state)
+        scheduler, previous_state=previous_state)
 
         self._tracks_future = None
         self._tracks_loaded = False
 
-    @property
-    def _tracks_future_ready(self):
-        """
-        Get the status of the internal tracks future object.
-
-        Returns:
-            bool: True if future is present and done, false otherwise.
-
-        """
-        return self._tracks_future and self._tracks_future.done()
-
-    def _process_tracks_future_results(self):
+    def _process_tracks_future_results(self, future):
         """
         Performs operations on the tracks data for display.
 
+        Registered with the model as the tracks future's done callback. Results
+        that arrive after this state was unloaded are ignored.
+
         If an exception was raised in the data retrieval, display a message to
         the user.
 
+        Args:
+            future: The future returned by the model's get_user_subresource
+                method.
+
         """
+        if future is not self._tracks_future:
+            return
+
         self._view.hide_loading_indicator()
-        future = self._tracks_future
         if future.exception():
             tracks_loading_failed = isinstance(
                 future.exception(), self._model.HTTP_ERROR)
@@ -485,31 +499,30 @@ class TracksLoadedState(SubresourceState):
         self._tracks_future = None
         self._tracks_loaded = True
 
-    def handle_action(self, action):
+    def handle_action(self, action, count=1):
         """
         Override parent.
 
         """
         if self._tracks_loaded:
             if action == self._input_mapper.ACTION_CONTENT_LINE_NEXT:
-                self._view.content_line_next()
+                self._view.content_line_next(count)
             elif action == self._input_mapper.ACTION_CONTENT_LINE_PREV:
-                self._view.content_line_previous()
+                self._view.content_line_previous(count)
             elif action == self._input_mapper.ACTION_CONTENT_PAGE_NEXT:
-                self._view.content_page_next()
+                self._view.content_page_next(count)
             elif action == self._input_mapper.ACTION_CONTENT_PAGE_PREV:
-                self._view.content_page_previous()
+                self._view.content_page_previous(count)
+            elif action == self._input_mapper.ACTION_CONTENT_LINE_FIRST:
+                self._view.content_line_first()
+            elif action == self._input_mapper.ACTION_CONTENT_LINE_LAST:
+                self._view.content_line_last()
+            elif action == self._input_mapper.ACTION_CONTENT_LINE_GO_TO:
+                self._view.content_line_go_to(count)
+            elif action == self._input_mapper.ACTION_CONTENT_LINE_PERCENT:
+                self._view.content_line_percent(count)
             else:
-                super().handle_action(action)
-
-    def run_interval_tasks(self):
-        """
-        Override parent.
-
-        """
-        super().run_interval_tasks()
-        if self._tracks_future_ready:
-            self._process_tracks_future_results()
+                super().handle_action(action, count)
 
     def start(self):
         """
@@ -520,6 +533,18 @@ class TracksLoadedState(SubresourceState):
         self._view.show_loading_indicator()
         self._tracks_future = self._load_user_subresource(
             self._model.USER_SUBRESRC_01_TRACKS)
+        self._model.add_done_callback(
+            self._tracks_future, self._process_tracks_future_results)
+
+    def stop(self):
+        """
+        Override parent.
+
+        Any pending tracks request is abandoned.
+
+        """
+        super().stop()
+        self._tracks_future = None
 
 
 class StateFactory:
@@ -528,7 +553,7 @@ class StateFactory:
 
     """
 
-    def __init__(self, input_mapper, view, model):
+    def __init__(self, input_mapper, view, model, scheduler):
         """
         Constructor.
 
@@ -536,10 +561,12 @@ class StateFactory:
             input_mapper (UserInputMapper)
             model (SoundcloudWrapper): From local models module.
             view (MainView): From local views module.
+            scheduler (TimerScheduler): From local events module.
 
         """
         self._input_mapper = input_mapper
         self._model = model
+        self._scheduler = scheduler
         self._view = view
 
     def create_help(self, context, previous_state=None):
@@ -599,4 +626,5 @@ class StateFactory:
             self,
             self._view,
             self._model,
+            self._scheduler,
             previous_state=previous_state)
@@ -0,0 +1,51 @@
+"""
+A module in which tests for the AsyncEventWaiter are defined.
+
+"""
+
+import asyncio
+import os
+import threading
+import unittest
+
+from soundcurses import events
+
+TIMEOUT = 5
+
+class AsyncEventWaiterTestCase(unittest.TestCase):
+    def setUp(self):
+        self._event_loop = asyncio.new_event_loop()
+        self._input_fd_read, self._input_fd_write = os.pipe()
+        self._event_waiter = events.AsyncEventWaiter(
+            self._event_loop, self._input_fd_read)
+
+    def tearDown(self):
+        self._event_waiter.close()
+        self._event_loop.close()
+        os.close(self._input_fd_read)
+        os.close(self._input_fd_write)
+
+    def _wait(self, timeout):
+        return self._event_loop.run_until_complete(
+            self._event_waiter.wait(timeout))
+
+    def test_timeout(self):
+        self.assertFalse(self._wait(0.01))
+
+    def test_input_readable(self):
+        os.write(self._input_fd_write, b'q')
+        self.assertTrue(self._wait(TIMEOUT))
+
+    def test_wake_from_thread(self):
+        threading.Timer(0.01, self._event_waiter.wake).start()
+        self.assertTrue(self._wait(TIMEOUT))
+
+    def test_wake_cleared(self):
+        self._event_waiter.wake()
+        self.assertTrue(self._wait(TIMEOUT))
+        self.assertFalse(self._wait(0.01))
+
+    def test_close_stops_watching_input(self):
+        self._event_waiter.close()
+        os.write(self._input_fd_write, b'q')
+        self.assertFalse(self._wait(0.01))
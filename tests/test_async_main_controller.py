@@ -0,0 +1,63 @@
+"""
+A module in which tests for the AsyncMainController are defined.
+
+"""
+
+import asyncio
+import unittest
+import unittest.mock
+
+from soundcurses import controllers, events
+
+class AsyncMainControllerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._event_loop = asyncio.new_event_loop()
+        self._event_waiter = events.AsyncEventWaiter(self._event_loop)
+        self._input_mapper = unittest.mock.Mock()
+        self._input_mapper.resolve_input_sequence.side_effect = \
+            lambda input_strings: [('quit', 1) for string in input_strings]
+        self._state = unittest.mock.Mock()
+        self._state.handle_action.side_effect = \
+            lambda action, count: self._controller.stop_application()
+        self._state_factory = unittest.mock.Mock()
+        self._state_factory.create_no_username.return_value = self._state
+        self._view = unittest.mock.Mock()
+        self._controller = controllers.AsyncMainController(
+            self._input_mapper,
+            self._state_factory,
+            self._view,
+            unittest.mock.Mock(),
+            self._event_waiter,
+            events.TimerScheduler(),
+            self._event_loop)
+
+    def tearDown(self):
+        self._event_loop.close()
+
+    def test_quit(self):
+        self._view.drain_input.return_value = ['q']
+        self._controller.start_application()
+        self._state.handle_action.assert_called_once_with('quit', 1)
+        self._view.destroy.assert_called_once_with()
+
+    def test_waits_for_wake_up(self):
+        self._view.drain_input.side_effect = [[], ['q']]
+        self._event_loop.call_later(0.01, self._event_waiter.wake)
+        self._controller.start_application()
+        self.assertEqual(self._view.drain_input.call_count, 2)
+        self._view.destroy.assert_called_once_with()
+
+    def test_other_coroutines_run(self):
+        """
+        Test that the event loop runs other tasks while the main loop waits.
+
+        """
+        ran = []
+        async def other():
+            ran.append(True)
+            self._event_waiter.wake()
+        self._view.drain_input.side_effect = [[], ['q']]
+        self._event_loop.call_soon(
+            lambda: self._event_loop.create_task(other()))
+        self._controller.start_application()
+        self.assertListEqual(ran, [True])
@@ -0,0 +1,78 @@
+"""
+A module in which tests for the CompletionDispatcher are defined.
+
+"""
+
+import asyncio
+import concurrent.futures
+import unittest
+import unittest.mock
+
+from soundcurses import events
+
+class CompletionDispatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self._wake_callback = unittest.mock.Mock()
+        self._dispatcher = events.CompletionDispatcher(self._wake_callback)
+
+    def test_completion_order(self):
+        future_slow = concurrent.futures.Future()
+        future_fast = concurrent.futures.Future()
+        delivered = []
+        self._dispatcher.register(future_slow, delivered.append)
+        self._dispatcher.register(future_fast, delivered.append)
+        future_fast.set_result('fast')
+        future_slow.set_result('slow')
+        self._dispatcher.dispatch()
+        self.assertListEqual(delivered, [future_fast, future_slow])
+
+    def test_delivered_once(self):
+        future = concurrent.futures.Future()
+        callback = unittest.mock.Mock()
+        self._dispatcher.register(future, callback)
+        future.set_result(None)
+        self._dispatcher.dispatch()
+        self._dispatcher.dispatch()
+        callback.assert_called_once_with(future)
+        self.assertEqual(len(self._dispatcher), 0)
+
+    def test_not_delivered_before_dispatch(self):
+        future = concurrent.futures.Future()
+        callback = unittest.mock.Mock()
+        self._dispatcher.register(future, callback)
+        future.set_result(None)
+        callback.assert_not_called()
+        self.assertEqual(len(self._dispatcher), 1)
+
+    def test_pending_not_delivered(self):
+        future = concurrent.futures.Future()
+        callback = unittest.mock.Mock()
+        self._dispatcher.register(future, callback)
+        self._dispatcher.dispatch()
+        callback.assert_not_called()
+        self._wake_callback.assert_not_called()
+
+    def test_registration_order_same_future(self):
+        future = concurrent.futures.Future()
+        delivered = []
+        self._dispatcher.register(future, lambda f: delivered.append('first'))
+        self._dispatcher.register(future, lambda f: delivered.append('second'))
+        future.set_result(None)
+        self._dispatcher.dispatch()
+        self.assertListEqual(delivered, ['first', 'second'])
+
+    def test_wake_on_completion(self):
+        future = concurrent.futures.Future()
+        self._dispatcher.register(future, unittest.mock.Mock())
+        future.set_result(None)
+        self._wake_callback.assert_called_once_with()
+
+    def test_done_asyncio_future_queued(self):
+        event_loop = asyncio.new_event_loop()
+        self.addCleanup(event_loop.close)
+        future = event_loop.create_future()
+        future.set_result(None)
+        callback = unittest.mock.Mock()
+        self._dispatcher.register(future, callback)
+        self._dispatcher.dispatch()
+        callback.assert_called_once_with(future)
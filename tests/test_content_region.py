@@ -4,7 +4,9 @@ import math
 import unittest
 import unittest.mock
 
-from soundcurses.curses import (regions, windows)
+import signalslot
+
+from soundcurses.curses import (headless, regions, screen, windows)
 
 class ContentRegionTestCase(unittest.TestCase):
     def setUp(self):
@@ -388,3 +390,490 @@ class ContentRegionTestCase(unittest.TestCase):
             self.assertTrue(line.is_written)
         for line in pages[1]:
             self.assertFalse(line.is_written)
+
+    def test_line_selection_multi_step(self):
+        """
+        Test moving several lines at once with a single page change.
+
+        """
+        content_region = regions.ContentRegion(
+            self._window_mock, self._curses_mock, self._string_factory)
+
+        page_count = 4
+        lines_count = math.floor(
+            content_region._avail_lines * (page_count - 0.5))
+        content_region.content_lines = [str(i) for i in range(0, lines_count)]
+
+        # Move past the end of the first page in a single call.
+        content_region.erase = unittest.mock.Mock(
+            side_effect=content_region.erase)
+        target_line = content_region._avail_lines + 3
+        content_region.line_next(target_line)
+        self.assertEqual(content_region.current_line_number, target_line)
+        self.assertEqual(content_region.current_page_number, 1)
+        self.assertEqual(content_region.erase.call_count, 1)
+
+        # Overshooting clamps to the last line.
+        content_region.line_next(lines_count * 2)
+        self.assertEqual(content_region.current_line_number, lines_count - 1)
+        self.assertEqual(
+            content_region.current_page_number, page_count - 1)
+
+        # Move backward across pages.
+        content_region.line_previous(lines_count - 1 - target_line)
+        self.assertEqual(content_region.current_line_number, target_line)
+        self.assertIn(
+            target_line,
+            content_region._pages[content_region.current_page_number])
+        content_region.line_previous(lines_count * 2)
+        self.assertEqual(content_region.current_line_number, 0)
+        self.assertEqual(content_region.current_page_number, 0)
+
+    def test_paging_multi_step(self):
+        """
+        Test moving several pages at once.
+
+        """
+        content_region = regions.ContentRegion(
+            self._window_mock, self._curses_mock, self._string_factory)
+
+        page_count = 4
+        lines_count = math.floor(
+            content_region._avail_lines * (page_count - 0.5))
+        content_region.content_lines = [str(i) for i in range(0, lines_count)]
+
+        content_region.page_next(2)
+        self.assertEqual(content_region.current_page_number, 2)
+        content_region.page_next(page_count)
+        self.assertEqual(content_region.current_page_number, page_count - 1)
+        content_region.page_previous(page_count)
+        self.assertEqual(content_region.current_page_number, 0)
+        self.assertEqual(content_region.current_line_number, 0)
+
+
+    def test_line_selection_reaches_every_line(self):
+        """
+        Test that no line falls between the last two pages.
+
+        """
+        self._window_mock.lines = 29
+        content_region = regions.ContentRegion(
+            self._window_mock, self._curses_mock, self._string_factory)
+        lines_count = 2 * content_region._avail_lines + 1
+        content_region.content_lines = [str(i) for i in range(lines_count)]
+
+        for i in range(1, lines_count):
+            content_region.line_next()
+            self.assertEqual(content_region.current_line_number, i)
+        for i in reversed(range(0, lines_count - 1)):
+            content_region.line_previous()
+            self.assertEqual(content_region.current_line_number, i)
+
+class ContentRegionVirtualTestCase(unittest.TestCase):
+    def setUp(self):
+        self._curses_mock = unittest.mock.NonCallableMock()
+        self._window_mock = unittest.mock.NonCallableMock()
+        self._window_mock.lines = 34
+        self._window_mock.cols = 100
+        self._string_factory = unittest.mock.NonCallableMock(
+            wraps=windows.CursesStringFactory(self._curses_mock))
+
+    def test_set_content_creates_one_page(self):
+        """
+        Test that only the displayed page's strings are created.
+
+        """
+        content_region = regions.ContentRegionVirtual(
+            self._window_mock, self._curses_mock, self._string_factory)
+        self._string_factory.create_string.reset_mock()
+
+        content_region.content_lines = [str(i) for i in range(50000)]
+        self.assertEqual(
+            self._string_factory.create_string.call_count,
+            content_region._avail_lines)
+
+        self._string_factory.create_string.reset_mock()
+        content_region.page_next(100)
+        self.assertEqual(
+            self._string_factory.create_string.call_count,
+            content_region._avail_lines)
+        self.assertTrue(all(
+            line.is_written
+            for line in content_region._current_page.values()))
+
+    def test_navigation_matches_paged(self):
+        """
+        Test that navigation selects the same lines and pages as ContentRegion.
+
+        """
+        lines_list = [str(i) for i in range(1000)]
+        content_regions = [
+            region_class(
+                self._window_mock,
+                self._curses_mock,
+                windows.CursesStringFactory(self._curses_mock))
+            for region_class in (
+                regions.ContentRegion, regions.ContentRegionVirtual)]
+        operations = [
+            ('line_next', 1), ('line_next', 45), ('page_next', 3),
+            ('line_previous', 7), ('page_previous', 1), ('line_next', 999),
+            ('line_previous', 30), ('page_previous', 100)]
+        for content_region in content_regions:
+            content_region.content_lines = lines_list
+        for method, count in operations:
+            positions = []
+            for content_region in content_regions:
+                getattr(content_region, method)(count)
+                positions.append((
+                    content_region.current_page_number,
+                    content_region.current_line_number))
+            self.assertEqual(positions[0], positions[1])
+
+
+class PageIndexTestCase(unittest.TestCase):
+    @staticmethod
+    def _paginate(lines_count, page_lines, overlap_lines):
+        """
+        Divide lines into pages by stepping through them.
+
+        """
+        pages = []
+        start_index = 0
+        end_index = page_lines
+        while True:
+            pages.append(range(start_index, min(end_index, lines_count)))
+            if end_index >= lines_count:
+                return pages
+            if lines_count - end_index + overlap_lines <= page_lines:
+                start_index = lines_count - page_lines
+                end_index = lines_count
+            else:
+                start_index = end_index - overlap_lines
+                end_index += page_lines - overlap_lines
+
+    def test_pages(self):
+        """
+        Test page boundaries and line lookups against a stepped pagination.
+
+        """
+        for page_lines in (2, 3, 10, 25, 30):
+            overlap_lines = math.floor(page_lines * 0.08)
+            for lines_count in range(1, 5 * page_lines):
+                page_index = regions.PageIndex(
+                    lines_count, page_lines, overlap_lines)
+                pages = self._paginate(lines_count, page_lines, overlap_lines)
+                self.assertEqual(list(page_index), pages)
+                for line_number in range(lines_count):
+                    containing = [
+                        page_number for page_number, page in enumerate(pages)
+                        if line_number in page]
+                    self.assertEqual(
+                        page_index.first_page_with_line(line_number),
+                        containing[0])
+                    self.assertEqual(
+                        page_index.last_page_with_line(line_number),
+                        containing[-1])
+
+
+class ContentRegionPadTestCase(unittest.TestCase):
+    def setUp(self):
+        self._curses = headless.HeadlessCurses(lines=30, cols=40)
+        self._screen = screen.CursesScreen(
+            self._curses, screen.RenderQueue(), signalslot.Signal())
+        self._window_factory = windows.CursesWindowFactory(
+            self._curses, self._screen, signalslot)
+        self._window = self._window_factory.create_window(
+            24, 40, 6, 0, render_layer=self._screen.RENDER_LAYER_REGIONS)
+        self._screen.add_window(self._window)
+        self._content_region = regions.ContentRegionPad(
+            self._window,
+            self._curses,
+            windows.CursesStringFactory(self._curses),
+            self._screen,
+            self._window_factory)
+
+    def tearDown(self):
+        self._curses.close()
+
+    def _displayed_lines(self):
+        """
+        Get the stripped screen lines of the writable area.
+
+        """
+        avail_y = 6 + self._content_region._avail_origin[0]
+        return [line.strip() for line in self._curses.screen_lines()[
+            avail_y:avail_y + self._content_region._avail_lines]]
+
+    def test_paging(self):
+        """
+        Test that page changes scroll the pad without writing lines.
+
+        """
+        lines_list = ['line {}'.format(i) for i in range(100)]
+        self._content_region.content_lines = lines_list
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), lines_list[0:20])
+
+        self._content_region._pad.addstr = unittest.mock.Mock(
+            side_effect=self._content_region._pad.addstr)
+        self._content_region.page_next()
+        self._screen.render()
+        page_range = self._content_region._create_page_index(100)[1]
+        self.assertEqual(
+            self._displayed_lines(), lines_list[page_range.start:page_range.stop])
+        self._content_region.page_next(10)
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), lines_list[80:100])
+        self.assertEqual(self._content_region._pad.addstr.call_count, 0)
+
+    def test_replace_content(self):
+        """
+        Test that shorter content replaces longer content.
+
+        """
+        self._content_region.content_lines = [str(i) for i in range(100)]
+        self._content_region.line_next(50)
+        self._content_region.content_lines = ['a', 'b']
+        self._screen.render()
+        self.assertEqual(self._content_region.current_line_number, 0)
+        self.assertEqual(self._displayed_lines(), ['a', 'b'] + [''] * 18)
+
+    def test_pad_line_limit(self):
+        """
+        Test that content longer than a pad may be is windowed into the pad.
+
+        """
+        lines_count = regions.ContentRegionPad.PAD_MAX_LINES + 1000
+        lines_list = ['line {}'.format(i) for i in range(lines_count)]
+        self._content_region.content_lines = lines_list
+        self.assertEqual(
+            self._content_region._pad.lines,
+            regions.ContentRegionPad.PAD_MAX_LINES)
+        self._content_region.line_last()
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), lines_list[-20:])
+        self._content_region.line_first()
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), lines_list[0:20])
+
+    def test_append_past_line_limit(self):
+        """
+        Test that appending past the pad line limit windows the pad.
+
+        """
+        lines_list = ['line {}'.format(i) for i in range(500)]
+        with unittest.mock.patch.object(
+            regions.ContentRegionPad, 'PAD_MAX_LINES', 100):
+            self._content_region.content_lines = lines_list[0:30]
+            for start in range(30, 500, 17):
+                self._content_region.append_lines(lines_list[start:start + 17])
+                self.assertLessEqual(self._content_region._pad.lines, 100)
+            for line_number in range(1, 500):
+                self._content_region.line_next()
+                self._screen.render()
+                self.assertIn(
+                    lines_list[line_number], self._displayed_lines())
+            self.assertEqual(self._displayed_lines(), lines_list[480:500])
+            self._content_region.line_go_to(250)
+            self._screen.render()
+            self.assertIn(lines_list[250], self._displayed_lines())
+
+
+class HeadlessContentRegionTestCase(unittest.TestCase):
+    REGION_CLASSES = (
+        regions.ContentRegion,
+        regions.ContentRegionPad,
+        regions.ContentRegionScroll,
+        regions.ContentRegionVirtual)
+
+    def _create_region(self, region_class):
+        """
+        Create a content region on a new headless screen.
+
+        """
+        self._curses = headless.HeadlessCurses(lines=30, cols=40)
+        self.addCleanup(self._curses.close)
+        self._screen = screen.CursesScreen(
+            self._curses, screen.RenderQueue(), signalslot.Signal())
+        window_factory = windows.CursesWindowFactory(
+            self._curses, self._screen, signalslot)
+        window = window_factory.create_window(
+            24, 40, 6, 0, render_layer=self._screen.RENDER_LAYER_REGIONS)
+        self._screen.add_window(window)
+        string_factory = windows.CursesStringFactory(self._curses)
+        if region_class is regions.ContentRegionPad:
+            return region_class(
+                window, self._curses, string_factory, self._screen,
+                window_factory)
+
+        return region_class(window, self._curses, string_factory)
+
+    def _displayed_lines(self):
+        """
+        Get the stripped screen lines of the writable area.
+
+        """
+        return [line.strip() for line in self._curses.screen_lines()[8:28]]
+
+
+class ContentRegionAppendTestCase(HeadlessContentRegionTestCase):
+    def test_append_matches_set(self):
+        """
+        Test that appending in chunks produces the pages of setting at once.
+
+        """
+        lines_list = ['line {}'.format(i) for i in range(500)]
+        for region_class in self.REGION_CLASSES:
+            content_region = self._create_region(region_class)
+            content_region.content_lines = lines_list[0:30]
+            for start in range(30, 500, 17):
+                content_region.append_lines(lines_list[start:start + 17])
+            self.assertEqual(content_region.content_lines, lines_list)
+            self.assertEqual(
+                list(content_region._page_index),
+                list(content_region._create_page_index(500)))
+            content_region.line_next(499)
+            self._screen.render()
+            self.assertEqual(content_region.current_line_number, 499)
+            self.assertEqual(self._displayed_lines(), lines_list[480:500])
+
+    def test_append_off_page(self):
+        """
+        Test that appending while an earlier page is displayed repaints nothing.
+
+        """
+        for region_class in self.REGION_CLASSES:
+            content_region = self._create_region(region_class)
+            content_region.content_lines = [str(i) for i in range(200)]
+            content_region.line_next(3)
+            self._screen.render()
+            screen_lines = self._curses.screen_lines()
+            content_region.append_lines([str(i) for i in range(200, 300)])
+            self.assertFalse(content_region._window.is_wintouched())
+            self._screen.render()
+            self.assertEqual(self._curses.screen_lines(), screen_lines)
+            self.assertEqual(content_region.current_page_number, 0)
+            self.assertEqual(content_region.current_line_number, 3)
+
+    def test_append_on_page(self):
+        """
+        Test that lines appended to the displayed page are shown.
+
+        """
+        for region_class in self.REGION_CLASSES:
+            content_region = self._create_region(region_class)
+            content_region.content_lines = [str(i) for i in range(10)]
+            content_region.line_next(9)
+            content_region.append_lines([str(i) for i in range(10, 15)])
+            self._screen.render()
+            self.assertEqual(
+                self._displayed_lines(),
+                [str(i) for i in range(15)] + [''] * 5)
+            self.assertEqual(content_region.current_line_number, 9)
+            content_region.line_next()
+            self.assertEqual(content_region.current_line_number, 10)
+
+
+class ContentRegionJumpTestCase(HeadlessContentRegionTestCase):
+    def test_jumps(self):
+        """
+        Test that each jump displays the selected line with one repaint.
+
+        """
+        lines_list = [str(i) for i in range(5000)]
+        jumps = [
+            ('line_last', (), 4999), ('line_go_to', (2500,), 2500),
+            ('line_percent', (50,), 2499), ('line_go_to', (-5,), 0),
+            ('line_percent', (150,), 4999), ('line_first', (), 0)]
+        for region_class in self.REGION_CLASSES:
+            content_region = self._create_region(region_class)
+            content_region.content_lines = lines_list
+            content_region._write_page_lines = unittest.mock.Mock(
+                side_effect=content_region._write_page_lines)
+            for method, args, line_number in jumps:
+                content_region._write_page_lines.reset_mock()
+                getattr(content_region, method)(*args)
+                self._screen.render()
+                self.assertEqual(
+                    content_region.current_line_number, line_number)
+                self.assertIn(str(line_number), self._displayed_lines())
+                self.assertLessEqual(
+                    content_region._write_page_lines.call_count, 1)
+            content_region.line_last()
+            self._screen.render()
+            self.assertEqual(self._displayed_lines()[-1], '4999')
+
+
+class ContentRegionScrollTestCase(unittest.TestCase):
+    def setUp(self):
+        self._curses = headless.HeadlessCurses(lines=30, cols=40)
+        self._screen = screen.CursesScreen(
+            self._curses, screen.RenderQueue(), signalslot.Signal())
+        window_factory = windows.CursesWindowFactory(
+            self._curses, self._screen, signalslot)
+        window = window_factory.create_window(
+            24, 40, 6, 0, render_layer=self._screen.RENDER_LAYER_REGIONS)
+        self._screen.add_window(window)
+        self._string_factory = unittest.mock.NonCallableMock(
+            wraps=windows.CursesStringFactory(self._curses))
+        self._content_region = regions.ContentRegionScroll(
+            window, self._curses, self._string_factory)
+        self._lines_list = ['line {}'.format(i) for i in range(200)]
+        self._content_region.content_lines = self._lines_list
+
+    def tearDown(self):
+        self._curses.close()
+
+    def _displayed_lines(self):
+        """
+        Get the stripped screen lines of the writable area.
+
+        """
+        return [line.strip() for line in self._curses.screen_lines()[8:28]]
+
+    def test_line_scrolling(self):
+        """
+        Test that moving past an edge scrolls and writes only the new line.
+
+        """
+        self._content_region.line_next(19)
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), self._lines_list[0:20])
+
+        self._string_factory.create_string.reset_mock()
+        self._content_region.line_next()
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), self._lines_list[1:21])
+        self.assertEqual(self._string_factory.create_string.call_count, 1)
+
+        self._content_region.line_previous(19)
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), self._lines_list[1:21])
+        self._content_region.line_previous()
+        self._screen.render()
+        self.assertEqual(self._displayed_lines(), self._lines_list[0:20])
+        self.assertEqual(self._string_factory.create_string.call_count, 2)
+
+    def test_selection_stays_displayed(self):
+        """
+        Test that the selected line is displayed after every movement.
+
+        """
+        operations = [
+            ('line_next', 25), ('page_next', 1), ('line_previous', 3),
+            ('page_previous', 1), ('page_next', 100), ('line_previous', 150),
+            ('line_next', 7), ('page_previous', 2)]
+        for method, count in operations:
+            getattr(self._content_region, method)(count)
+            self._screen.render()
+            top_line_number = self._content_region._top_line_number
+            self.assertEqual(
+                self._displayed_lines(),
+                self._lines_list[top_line_number:top_line_number + 20])
+            self.assertIn(
+                self._content_region.current_line_number,
+                range(top_line_number, top_line_number + 20))
+            self.assertEqual(
+                self._content_region.current_page_number,
+                self._content_region._page_index.last_page_with_line(
+                    top_line_number))
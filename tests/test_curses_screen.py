@@ -0,0 +1,166 @@
+"""
+A module in which tests for the CursesScreen are defined.
+
+"""
+
+import unittest
+
+import signalslot
+
+from soundcurses.curses import (headless, screen, windows)
+
+class CursesScreenTestCase(unittest.TestCase):
+    def setUp(self):
+        self._curses = headless.HeadlessCurses(lines=4, cols=10)
+        self._screen = screen.CursesScreen(
+            self._curses, screen.RenderQueue(), signalslot.Signal())
+        self._window_factory = windows.CursesWindowFactory(
+            self._curses, self._screen, signalslot)
+
+    def tearDown(self):
+        self._curses.close()
+
+    def _create_window(self, lines, cols, y, x, render_layer):
+        window = self._window_factory.create_window(
+            lines, cols, y, x, render_layer=render_layer)
+        self._screen.add_window(window)
+        return window
+
+    def test_fully_occluded(self):
+        lower = self._create_window(
+            2, 10, 0, 0, self._screen.RENDER_LAYER_REGIONS)
+        upper = self._create_window(
+            2, 10, 0, 0, self._screen.RENDER_LAYER_MODALS)
+        lower.addstr(0, 0, 'lower')
+        upper.addstr(0, 0, 'upper')
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'upper     ')
+        cells_updated = self._curses.cells_updated
+        lower.addstr(0, 0, 'LOWER')
+        self._screen.render()
+        self.assertFalse(lower.is_wintouched())
+        self.assertEqual(self._curses.cells_updated, cells_updated)
+
+    def test_partly_occluded(self):
+        lower = self._create_window(
+            2, 10, 0, 0, self._screen.RENDER_LAYER_REGIONS)
+        upper = self._create_window(
+            1, 4, 0, 3, self._screen.RENDER_LAYER_MODALS)
+        lower.addstr(0, 0, 'a' * 10)
+        upper.addstr(0, 0, 'UUUU')
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'aaaUUUUaaa')
+        lower.addstr(0, 0, 'b' * 10)
+        lower.addstr(1, 0, 'c' * 10)
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'bbbUUUUbbb')
+        self.assertEqual(self._curses.screen_lines()[1], 'c' * 10)
+
+    def test_pad_under_modal(self):
+        pad = self._window_factory.create_pad(
+            10, 10, (0, 0),
+            self._window_factory.create_box_coords(4, 10, (0, 0)),
+            render_layer=self._screen.RENDER_LAYER_REGION_PADS)
+        self._screen.add_window(pad)
+        modal = self._create_window(
+            2, 4, 1, 3, self._screen.RENDER_LAYER_MODALS)
+        for y in range(10):
+            pad.addstr(y, 0, str(y) * 10)
+        modal.addstr(0, 0, 'MMMM')
+        modal.addstr(1, 0, 'MMMM')
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[1], '111MMMM111')
+        pad.visible_origin = (4, 0)
+        self._screen.render()
+        self.assertListEqual(
+            self._curses.screen_lines(),
+            ['4' * 10, '555MMMM555', '666MMMM666', '7' * 10])
+        pad.addstr(0, 0, 'x' * 10)
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[2], '666MMMM666')
+
+    def test_pad_fully_occluded_not_copied(self):
+        pad = self._window_factory.create_pad(
+            10, 10, (0, 0),
+            self._window_factory.create_box_coords(4, 10, (0, 0)),
+            render_layer=self._screen.RENDER_LAYER_REGION_PADS)
+        self._screen.add_window(pad)
+        modal = self._create_window(
+            1, 10, 1, 0, self._screen.RENDER_LAYER_MODALS)
+        modal.addstr(0, 0, 'M' * 10)
+        self._screen.render()
+        cells_updated = self._curses.cells_updated
+        pad.addstr(1, 0, 'p' * 10)
+        self._screen.render()
+        self.assertFalse(pad.is_box_touched())
+        self.assertEqual(self._curses.cells_updated, cells_updated)
+        self.assertEqual(self._curses.screen_lines()[1], 'M' * 10)
+
+    def test_hidden_not_copied(self):
+        window = self._create_window(
+            1, 10, 0, 0, self._screen.RENDER_LAYER_MODALS)
+        window.hide()
+        window.addstr(0, 0, 'hidden')
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], ' ' * 10)
+        self.assertFalse(window.is_wintouched())
+
+    def test_layer_change_touches_damaged_area(self):
+        top = self._create_window(
+            2, 10, 0, 0, self._screen.RENDER_LAYER_REGIONS)
+        bottom = self._create_window(
+            2, 10, 2, 0, self._screen.RENDER_LAYER_REGIONS)
+        modal = self._create_window(
+            1, 4, 0, 3, self._screen.RENDER_LAYER_MODALS)
+        top.addstr(0, 0, 'a' * 10)
+        modal.addstr(0, 0, 'MMMM')
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'aaaMMMMaaa')
+        modal.hide()
+        self.assertTrue(top.is_linetouched(0))
+        self.assertFalse(top.is_linetouched(1))
+        self.assertFalse(bottom.is_wintouched())
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'a' * 10)
+        modal.show()
+        self.assertTrue(modal.is_wintouched())
+        self.assertFalse(bottom.is_wintouched())
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'aaaMMMMaaa')
+
+    def test_clean_frame_skipped(self):
+        window = self._create_window(
+            1, 10, 0, 0, self._screen.RENDER_LAYER_REGIONS)
+        window.addstr(0, 0, 'text')
+        self._screen.render()
+        update_count = self._curses.update_count
+        self._screen.render()
+        self.assertEqual(self._curses.update_count, update_count)
+        self.assertEqual(self._screen.rendered_frame_count, 1)
+        self.assertEqual(self._screen.skipped_frame_count, 1)
+        window.chgat(0, 0, 4, self._curses.A_BOLD)
+        self._screen.render()
+        self.assertEqual(self._curses.update_count, update_count + 1)
+        self.assertEqual(self._screen.rendered_frame_count, 2)
+
+    def test_move_repaints_old_area(self):
+        lower = self._create_window(
+            2, 10, 0, 0, self._screen.RENDER_LAYER_REGIONS)
+        upper = self._create_window(
+            1, 4, 0, 0, self._screen.RENDER_LAYER_MODALS)
+        lower.addstr(0, 0, 'a' * 10)
+        upper.addstr(0, 0, 'UUUU')
+        self._screen.render()
+        upper.mvwin(1, 6)
+        self._screen.render()
+        self.assertEqual(self._curses.screen_lines()[0], 'a' * 10)
+        self.assertEqual(self._curses.screen_lines()[1], '      UUUU')
+
+
+class BoxCoordsTestCase(unittest.TestCase):
+    def test_intersects(self):
+        box = windows.BoxCoords((2, 2), 2, 2)
+        self.assertTrue(box.intersects(windows.BoxCoords((3, 3), 5, 5)))
+        self.assertTrue(box.intersects(windows.BoxCoords((0, 0), 9, 9)))
+        self.assertFalse(box.intersects(windows.BoxCoords((4, 2), 1, 1)))
+        self.assertFalse(box.intersects(windows.BoxCoords((2, 0), 2, 2)))
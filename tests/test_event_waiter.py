@@ -0,0 +1,52 @@
+"""
+A module in which tests for the EventWaiter are defined.
+
+"""
+
+import os
+import selectors
+import threading
+import time
+import unittest
+
+from soundcurses import events
+
+TIMEOUT = 5
+
+class EventWaiterTestCase(unittest.TestCase):
+    def setUp(self):
+        self._input_fd_read, self._input_fd_write = os.pipe()
+        self._event_waiter = events.EventWaiter(
+            selectors.DefaultSelector(), self._input_fd_read)
+
+    def tearDown(self):
+        self._event_waiter.close()
+        os.close(self._input_fd_read)
+        os.close(self._input_fd_write)
+
+    def test_timeout(self):
+        time_start = time.monotonic()
+        self.assertFalse(self._event_waiter.wait(0.05))
+        self.assertGreaterEqual(time.monotonic() - time_start, 0.04)
+
+    def test_input_readable(self):
+        os.write(self._input_fd_write, b'q')
+        self.assertTrue(self._event_waiter.wait(TIMEOUT))
+
+    def test_wake(self):
+        self._event_waiter.wake()
+        self.assertTrue(self._event_waiter.wait(TIMEOUT))
+
+    def test_wake_from_thread(self):
+        threading.Timer(0.01, self._event_waiter.wake).start()
+        self.assertTrue(self._event_waiter.wait(TIMEOUT))
+
+    def test_wake_pipe_drained(self):
+        """
+        Test that repeated wake-ups are consumed by a single wait.
+
+        """
+        for i in range(3):
+            self._event_waiter.wake()
+        self.assertTrue(self._event_waiter.wait(TIMEOUT))
+        self.assertFalse(self._event_waiter.wait(0.01))
@@ -0,0 +1,80 @@
+"""
+A module in which tests for the headless curses backend are defined.
+
+"""
+
+import unittest
+
+from soundcurses.curses import headless
+
+class HeadlessCursesTestCase(unittest.TestCase):
+    def setUp(self):
+        self._curses = headless.HeadlessCurses(lines=4, cols=10)
+
+    def tearDown(self):
+        self._curses.close()
+
+    def test_render(self):
+        window = self._curses.newwin(2, 5, 1, 2)
+        window.addstr(0, 0, 'abc')
+        window.noutrefresh()
+        self.assertEqual(self._curses.screen_lines()[1], ' ' * 10)
+        self._curses.doupdate()
+        self.assertEqual(self._curses.screen_lines()[1], '  abc     ')
+        self.assertEqual(self._curses.cells_updated, 3)
+
+    def test_touch(self):
+        window = self._curses.newwin(2, 5, 0, 0)
+        self.assertTrue(window.is_wintouched())
+        window.noutrefresh()
+        self.assertFalse(window.is_wintouched())
+        window.chgat(1, 0, 2, self._curses.A_BOLD)
+        self.assertFalse(window.is_linetouched(0))
+        self.assertTrue(window.is_linetouched(1))
+
+    def test_untouched_lines_not_copied(self):
+        lower = self._curses.newwin(1, 10, 0, 0)
+        upper = self._curses.newwin(1, 10, 0, 0)
+        lower.addstr(0, 0, 'lower')
+        upper.addstr(0, 0, 'upper')
+        lower.noutrefresh()
+        upper.noutrefresh()
+        lower.noutrefresh()
+        self._curses.doupdate()
+        self.assertEqual(self._curses.screen_lines()[0].rstrip(), 'upper')
+
+    def test_bounds(self):
+        with self.assertRaises(self._curses.error):
+            self._curses.newwin(5, 10, 0, 0)
+        window = self._curses.newwin(1, 3, 0, 0)
+        with self.assertRaises(self._curses.error):
+            window.addstr(0, 0, 'abcd')
+        with self.assertRaises(self._curses.error):
+            window.mvwin(0, 8)
+
+    def test_pad(self):
+        pad = self._curses.newpad(10, 10)
+        pad.addstr(5, 0, 'pad')
+        pad.noutrefresh(5, 0, 2, 0, 2, 9)
+        self._curses.doupdate()
+        self.assertEqual(self._curses.screen_lines()[2].rstrip(), 'pad')
+
+    def test_pad_dimension_limit(self):
+        with self.assertRaises(self._curses.error):
+            self._curses.newpad(self._curses.MAX_DIMENSION + 1, 10)
+        pad = self._curses.newpad(self._curses.MAX_DIMENSION, 10)
+        with self.assertRaises(self._curses.error):
+            pad.resize(self._curses.MAX_DIMENSION + 1, 10)
+
+
+class HeadlessInputTestCase(unittest.TestCase):
+    def test_script(self):
+        curses = headless.HeadlessCurses(['a', None, 'name'])
+        window = curses.initscr()
+        self.assertEqual(window.getkey(), 'a')
+        with self.assertRaises(curses.error):
+            window.getkey()
+        self.assertEqual(window.getstr(0, 0), b'name')
+        with self.assertRaises(curses.error):
+            window.getkey()
+        curses.close()
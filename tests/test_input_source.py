@@ -0,0 +1,46 @@
+"""
+A module in which tests for the InputSource are defined.
+
+"""
+
+import time
+import unittest
+
+from soundcurses import config
+from soundcurses.curses import headless, user_input
+
+class InputSourceTestCase(unittest.TestCase):
+    def _create_input_source(self, script):
+        self._curses = headless.HeadlessCurses(script)
+        self.addCleanup(self._curses.close)
+
+        return user_input.InputSource(self._curses, self._curses.initscr())
+
+    def test_empty_buffer(self):
+        input_source = self._create_input_source([])
+        time_start = time.monotonic()
+        self.assertListEqual(input_source.drain_input(), [])
+        self.assertLess(time.monotonic() - time_start, 0.1)
+
+    def test_max_drain_count(self):
+        key_count = user_input.InputSource.MAX_DRAIN_COUNT + 10
+        input_source = self._create_input_source(['KEY_DOWN'] * key_count)
+        self.assertListEqual(
+            input_source.drain_input(),
+            ['KEY_DOWN'] * user_input.InputSource.MAX_DRAIN_COUNT)
+        self.assertListEqual(input_source.drain_input(), ['KEY_DOWN'] * 10)
+
+    def test_stops_after_unfoldable_key(self):
+        """
+        Test that keys typed after a key opening the prompt stay buffered.
+
+        """
+        input_source = self._create_input_source(
+            ['KEY_DOWN', 'KEY_DOWN', 'u', 'a', 'b', 'KEY_DOWN'])
+        is_foldable = config.UserInputMapper().is_repeatable_input
+        self.assertListEqual(
+            input_source.drain_input(is_foldable),
+            ['KEY_DOWN', 'KEY_DOWN', 'u'])
+        self.assertListEqual(
+            input_source.drain_input(is_foldable), ['a'])
+        self.assertListEqual(input_source.drain_input(), ['b', 'KEY_DOWN'])
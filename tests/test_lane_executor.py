@@ -0,0 +1,90 @@
+"""
+A module in which tests for the LaneExecutor are defined.
+
+"""
+
+import threading
+import unittest
+
+from soundcurses import executors
+
+TIMEOUT = 5
+
+class LaneExecutorTestCase(unittest.TestCase):
+    def setUp(self):
+        self._executor = executors.LaneExecutor([1, 1])
+        self._background = self._executor.lane(
+            self._executor.LANE_BACKGROUND)
+        self._release = threading.Event()
+
+    def tearDown(self):
+        self._release.set()
+        self._executor.shutdown()
+
+    def _block(self, lane_executor, release=None):
+        """
+        Occupy a worker until the test releases it.
+
+        Args:
+            release (threading.Event): Set to release the worker. Defaults to
+                the event set on tear down.
+
+        Returns:
+            concurrent.futures.Future
+
+        """
+        release = release or self._release
+        started = threading.Event()
+        def blocker():
+            started.set()
+            release.wait(TIMEOUT)
+        future = lane_executor.submit(blocker)
+        self.assertTrue(started.wait(TIMEOUT))
+        return future
+
+    def test_interactive_not_behind_background(self):
+        self._block(self._background)
+        self._background.submit(lambda: None)
+        future = self._executor.submit(lambda: 'interactive')
+        self.assertEqual(future.result(TIMEOUT), 'interactive')
+
+    def test_background_workers_help_interactive(self):
+        barrier = threading.Barrier(2, timeout=TIMEOUT)
+        futures = [self._executor.submit(barrier.wait) for i in range(2)]
+        for future in futures:
+            future.result(TIMEOUT)
+
+    def test_interactive_runs_first(self):
+        release_background = threading.Event()
+        self._block(self._background, release_background)
+        self._block(self._executor)
+        order = []
+        background = self._background.submit(order.append, 'background')
+        interactive = self._executor.submit(order.append, 'interactive')
+        release_background.set()
+        background.result(TIMEOUT)
+        interactive.result(TIMEOUT)
+        self.assertListEqual(order, ['interactive', 'background'])
+
+    def test_exception_propagated(self):
+        future = self._background.submit(int, 'x')
+        with self.assertRaises(ValueError):
+            future.result(TIMEOUT)
+
+    def test_submit_after_shutdown(self):
+        self._executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            self._executor.submit(lambda: None)
+
+    def test_shutdown_cancels_queued(self):
+        self._block(self._background)
+        self._block(self._executor)
+        future = self._background.submit(lambda: None)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.assertTrue(future.cancelled())
+
+    def test_invalid_lanes(self):
+        with self.assertRaises(ValueError):
+            executors.LaneExecutor([1, 0])
+        with self.assertRaises(ValueError):
+            self._executor.lane(2)
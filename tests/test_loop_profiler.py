@@ -0,0 +1,70 @@
+"""
+A module in which tests for the LoopProfiler are defined.
+
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from soundcurses import profiling
+
+class LatencyHistogramTestCase(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = profiling.LatencyHistogram(100)
+        for sample in range(1, 101):
+            histogram.add(sample)
+        self.assertEqual(histogram.percentile(50), 50)
+        self.assertEqual(histogram.percentile(95), 95)
+        self.assertEqual(histogram.percentile(99), 99)
+        self.assertEqual(histogram.percentile(100), 100)
+
+    def test_rolling_window(self):
+        histogram = profiling.LatencyHistogram(2)
+        for sample in (10, 1, 2):
+            histogram.add(sample)
+        self.assertEqual(len(histogram), 2)
+        self.assertEqual(histogram.count, 3)
+        self.assertEqual(histogram.percentile(99), 2)
+        self.assertEqual(histogram.maximum, 10)
+
+    def test_empty(self):
+        histogram = profiling.LatencyHistogram(2)
+        self.assertIsNone(histogram.percentile(50))
+
+
+class LoopProfilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._now = 0.0
+        file_descriptor, self._export_path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        self._profiler = profiling.LoopProfiler(
+            self._export_path, clock=lambda: self._now)
+
+    def tearDown(self):
+        os.remove(self._export_path)
+
+    def _run_iteration(self, input_duration, render_duration):
+        self._profiler.begin_iteration()
+        self._now += input_duration
+        self._profiler.mark('sample_input')
+        self._now += render_duration
+        self._profiler.mark('render')
+        self._profiler.end_iteration()
+
+    def test_phases(self):
+        self._run_iteration(0.001, 0.010)
+        summary = self._profiler.summarize()
+        self.assertEqual(
+            list(summary), ['sample_input', 'render', 'iteration'])
+        self.assertAlmostEqual(summary['sample_input']['p50_ms'], 1)
+        self.assertAlmostEqual(summary['render']['p99_ms'], 10)
+        self.assertAlmostEqual(summary['iteration']['max_ms'], 11)
+
+    def test_requested_export(self):
+        self._profiler.request_export()
+        self._run_iteration(0.001, 0.002)
+        with open(self._export_path) as export_file:
+            exported = json.load(export_file)
+        self.assertEqual(exported['render']['count'], 1)
@@ -0,0 +1,65 @@
+"""
+A module in which tests for the MainController are defined.
+
+"""
+
+import selectors
+import unittest
+import unittest.mock
+
+from soundcurses import controllers, events
+
+class MainControllerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._event_waiter = events.EventWaiter(selectors.DefaultSelector())
+        self.addCleanup(self._event_waiter.close)
+        self._event_waiter.wait = unittest.mock.Mock(
+            side_effect=self._event_waiter.wait)
+        self._input_mapper = unittest.mock.Mock()
+        self._input_mapper.resolve_input_sequence.side_effect = \
+            lambda input_strings: [
+                ('quit' if string == 'q' else 'other', 1)
+                for string in input_strings]
+        self._state = unittest.mock.Mock()
+        self._state.handle_action.side_effect = \
+            lambda action, count: \
+                action == 'quit' and self._controller.stop_application()
+        self._state_factory = unittest.mock.Mock()
+        self._state_factory.create_no_username.return_value = self._state
+        self._view = unittest.mock.Mock()
+        self._controller = controllers.MainController(
+            self._input_mapper,
+            self._state_factory,
+            self._view,
+            unittest.mock.Mock(),
+            self._event_waiter,
+            events.TimerScheduler())
+
+    def test_quit(self):
+        self._view.drain_input.return_value = ['q']
+        self._controller.start_application()
+        self._state.handle_action.assert_called_once_with('quit', 1)
+        self._view.destroy.assert_called_once_with()
+        self._event_waiter.wait.assert_not_called()
+
+    def test_waits_only_without_input(self):
+        """
+        Test that the loop blocks only after an iteration without input.
+
+        """
+        drain_counts = []
+        self._event_waiter.wait.side_effect = \
+            lambda timeout: drain_counts.append(
+                self._view.drain_input.call_count) or True
+        self._view.drain_input.side_effect = [['\t'], ['\t'], [], ['\t'], ['q']]
+        self._controller.start_application()
+        self.assertEqual(self._view.drain_input.call_count, 5)
+        self.assertListEqual(drain_counts, [3])
+
+    def test_waits_for_wake_up(self):
+        self._view.drain_input.side_effect = [[], ['q']]
+        self._event_waiter.wake()
+        self._controller.start_application()
+        self.assertEqual(self._view.drain_input.call_count, 2)
+        self._event_waiter.wait.assert_called_once_with(None)
+        self._view.destroy.assert_called_once_with()
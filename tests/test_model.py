@@ -0,0 +1,139 @@
+"""
+A module in which tests for the Model are defined.
+
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import unittest
+import unittest.mock
+
+import signalslot
+import soundcloud
+
+from soundcurses import events, models
+
+class ModelPrefetchTestCase(unittest.TestCase):
+    def setUp(self):
+        self._dispatcher = events.CompletionDispatcher(lambda: None)
+        self._requests = {}
+        self._soundcloud_client = unittest.mock.Mock()
+        self._soundcloud_client.add_done_callback.side_effect = \
+            self._dispatcher.register
+        self._soundcloud_client.get_user_subresource.side_effect = \
+            self._get_user_subresource
+        self._model = models.Model(
+            self._soundcloud_client, signalslot.Signal(), prefetch=True)
+
+    def _get_user_subresource(self, user_id, subresource, background=False):
+        """
+        Record a request and return its pending future.
+
+        """
+        future = concurrent.futures.Future()
+        self._requests[(user_id, subresource)] = future
+        return future
+
+    def _complete(self, user_id, subresource):
+        self._requests[(user_id, subresource)].set_result(
+            soundcloud.resource.ResourceList([]))
+        self._dispatcher.dispatch()
+
+    def _set_user(self, user_id):
+        self._model.current_user = soundcloud.resource.Resource(
+            {'id': user_id, 'username': 'user' + str(user_id)})
+
+    def test_disabled(self):
+        model = models.Model(self._soundcloud_client, signalslot.Signal())
+        model.current_user = soundcloud.resource.Resource({'id': 1})
+        model.prefetch_user_subresources()
+        self._soundcloud_client.get_user_subresource.assert_not_called()
+
+    def test_limit_in_flight(self):
+        self._set_user(1)
+        self._model.prefetch_user_subresources()
+        self.assertListEqual(
+            list(self._requests), [('1', 'tracks'), ('1', 'playlists')])
+        self._complete('1', 'playlists')
+        self.assertEqual(len(self._requests), 3)
+        self._complete('1', 'tracks')
+        self._complete('1', 'favorites')
+        self._complete('1', 'followings')
+        self.assertListEqual(
+            [request[1] for request in self._requests],
+            self._model.avail_user_subresources)
+        for call in self._soundcloud_client.get_user_subresource.call_args_list:
+            self.assertTrue(call.kwargs['background'])
+
+    def test_cached_not_counted(self):
+        done_future = concurrent.futures.Future()
+        done_future.set_result(soundcloud.resource.ResourceList([]))
+        self._soundcloud_client.get_user_subresource.side_effect = None
+        self._soundcloud_client.get_user_subresource.return_value = done_future
+        self._set_user(1)
+        self._model.prefetch_user_subresources()
+        self.assertEqual(
+            self._soundcloud_client.get_user_subresource.call_count,
+            len(self._model.avail_user_subresources))
+
+    def test_queue_discarded_for_new_user(self):
+        self._set_user(1)
+        self._model.prefetch_user_subresources()
+        self._set_user(2)
+        self._model.prefetch_user_subresources()
+        self.assertEqual(len(self._requests), 2)
+        self._complete('1', 'tracks')
+        self._complete('1', 'playlists')
+        self.assertListEqual(
+            list(self._requests)[2:], [('2', 'tracks'), ('2', 'playlists')])
+
+
+class AsyncModelTestCase(unittest.TestCase):
+    def setUp(self):
+        self._event_loop = asyncio.new_event_loop()
+        self._soundcloud_client = unittest.mock.Mock()
+        self._model = models.AsyncModel(
+            self._soundcloud_client, signalslot.Signal(), self._event_loop)
+
+    def tearDown(self):
+        self._event_loop.close()
+
+    def test_result_propagated(self):
+        future = concurrent.futures.Future()
+        self._soundcloud_client.get_user.return_value = future
+        async_future = self._model.get_user(username='someone')
+        self.assertIsInstance(async_future, asyncio.Future)
+        self.assertFalse(async_future.done())
+        threading.Timer(0.01, future.set_result, ('user',)).start()
+        self.assertEqual(
+            self._event_loop.run_until_complete(async_future), 'user')
+
+    def test_exception_propagated(self):
+        future = concurrent.futures.Future()
+        self._soundcloud_client.get_user_subresource.return_value = future
+        async_future = self._model.get_user_subresource('1', 'tracks')
+        threading.Timer(
+            0.01, future.set_exception, (ValueError('failed'),)).start()
+        with self.assertRaises(ValueError):
+            self._event_loop.run_until_complete(async_future)
+
+    def test_done_future_copied(self):
+        """
+        Test that a cache hit is done on return, before the loop runs.
+
+        """
+        future = concurrent.futures.Future()
+        future.set_result('cached')
+        self._soundcloud_client.get_user_subresource.return_value = future
+        async_future = self._model.get_user_subresource('1', 'tracks')
+        self.assertTrue(async_future.done())
+        self.assertEqual(async_future.result(), 'cached')
+
+    def test_done_exception_copied(self):
+        future = concurrent.futures.Future()
+        future.set_exception(ValueError('failed'))
+        self._soundcloud_client.get_user.return_value = future
+        async_future = self._model.get_user(user_id='1')
+        self.assertTrue(async_future.done())
+        self.assertIsInstance(async_future.exception(), ValueError)
@@ -79,3 +79,28 @@ class RenderQueueTestCase(unittest.TestCase):
         self.assertEqual(len(render_queue), 1)
         self.assertIs(list(render_queue)[0], self._window_middle)
 
+
+    def test_remove_absent(self):
+        render_queue = screen.RenderQueue()
+        render_queue.remove(self._window_bottom)
+        self.assertEqual(len(render_queue), 0)
+
+    def test_layer_change(self):
+        render_queue = screen.RenderQueue()
+        render_queue.add(self._window_bottom)
+        render_queue.add(self._window_middle)
+        self._window_bottom.render_layer = 3
+        render_queue.add(self._window_bottom)
+        self.assertEqual(len(render_queue), 2)
+        self.assertSequenceEqual(
+            list(render_queue), [self._window_middle, self._window_bottom])
+
+    def test_order_within_layer(self):
+        render_queue = screen.RenderQueue()
+        self._window_top.render_layer = 2
+        render_queue.add(self._window_top)
+        render_queue.add(self._window_bottom)
+        render_queue.add(self._window_middle)
+        self.assertSequenceEqual(
+            list(render_queue),
+            [self._window_bottom, self._window_top, self._window_middle])
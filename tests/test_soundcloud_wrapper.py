@@ -0,0 +1,291 @@
+"""
+A module in which tests for the SoundcloudWrapper are defined.
+
+"""
+
+import concurrent.futures
+import http.server
+import json
+import os
+import ssl
+import threading
+import time
+import unittest
+import unittest.mock
+
+import requests
+import soundcloud
+import soundcloud.request
+
+from soundcurses import (clients, events, executors, models)
+
+CERT_PATH = os.path.join(os.path.dirname(__file__), 'data', 'localhost.pem')
+
+class StubApiHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        if 'missing' in self.path:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = json.dumps({'id': 1, 'username': 'someone'}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubHttpsServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubApiHandler)
+        self.connection_count = 0
+        self.latency = 0
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(CERT_PATH)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+
+    def get_request(self):
+        request = super().get_request()
+        self.connection_count += 1
+        return request
+
+class SoundcloudWrapperTestCase(unittest.TestCase):
+    def setUp(self):
+        self._client = unittest.mock.NonCallableMock()
+        self._client_factory = unittest.mock.Mock(return_value=self._client)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._dispatcher = events.CompletionDispatcher(lambda: None)
+        self._wrapper = models.SoundcloudWrapper(
+            self._client_factory, self._executor, self._dispatcher)
+
+    def tearDown(self):
+        self._executor.shutdown()
+
+    def test_client_created_lazily(self):
+        self._client_factory.assert_not_called()
+        self._wrapper.get_user_subresource('1', 'tracks').result()
+        self._wrapper.get_user_subresource('2', 'tracks').result()
+        self._client_factory.assert_called_once()
+        self._client.get.assert_called_with('/users/2/tracks')
+
+    def test_client_created_on_executor_thread(self):
+        threads = []
+        self._client_factory.side_effect = \
+            lambda http_session: \
+                threads.append(threading.current_thread()) or self._client
+        self._wrapper.start().result()
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_client_uses_pooled_session(self):
+        wrapper = models.SoundcloudWrapper(
+            self._client_factory, self._executor, self._dispatcher,
+            pool_connections=2, pool_maxsize=3)
+        wrapper.start().result()
+        http_session = self._client_factory.call_args[0][0]
+        self.assertIsInstance(http_session, requests.Session)
+        for url in ('http://example.com/', 'https://example.com/'):
+            adapter = http_session.get_adapter(url)
+            self.assertEqual(adapter._pool_connections, 2)
+            self.assertEqual(adapter._pool_maxsize, 3)
+            self.assertTrue(adapter._pool_block)
+
+    def test_http_error_read_without_client(self):
+        self._client.HTTP_ERROR = ValueError
+        self._client_factory.side_effect = ImportError
+        future = self._wrapper.get_user_subresource('1', 'tracks')
+        self.assertIsInstance(future.exception(5), ImportError)
+        self.assertNotIsInstance(future.exception(), self._wrapper.HTTP_ERROR)
+        self._client_factory.assert_called_once()
+
+        self._client_factory.side_effect = None
+        self._wrapper.start().result()
+        self.assertIs(self._wrapper.HTTP_ERROR, ValueError)
+        self.assertEqual(self._client_factory.call_count, 2)
+
+    def test_background_executor(self):
+        background_executor = unittest.mock.NonCallableMock(
+            wraps=self._executor)
+        wrapper = models.SoundcloudWrapper(
+            self._client_factory, self._executor, self._dispatcher,
+            background_executor=background_executor)
+        wrapper.get_user_subresource('1', 'tracks', background=True).result()
+        background_executor.submit.assert_called_once()
+        wrapper.get_user_subresource('1', 'playlists').result()
+        background_executor.submit.assert_called_once()
+
+    def test_cache_hits_completed(self):
+        self._client.scheme = 'https://'
+        self._client.get.return_value = unittest.mock.NonCallableMock(
+            id=1, username='someone')
+        self._wrapper.get_user(username='someone').result()
+        self._wrapper.get_user_subresource('1', 'tracks').result()
+        self._dispatcher.dispatch()
+        self._executor.submit = unittest.mock.Mock()
+        futures = [
+            self._wrapper.get_user(username='someone'),
+            self._wrapper.get_user(user_id='1'),
+            self._wrapper.get_user_subresource('1', 'tracks')]
+        self._executor.submit.assert_not_called()
+        for future in futures:
+            self.assertTrue(future.done())
+        self.assertIs(futures[2].result(), self._client.get.return_value)
+
+    def test_duplicate_requests_coalesced(self):
+        release = threading.Event()
+        user = unittest.mock.NonCallableMock(id=1, username='someone')
+        self._client.get.side_effect = lambda path: release.wait(5) and user
+        futures = [self._wrapper.get_user(user_id='1') for i in range(3)]
+        self.assertIs(futures[1], futures[0])
+        self.assertIs(futures[2], futures[0])
+        self.assertEqual(self._wrapper.dedupe_hit_count, 2)
+        release.set()
+        self.assertIs(futures[0].result(5), user)
+        self._client.get.assert_called_once_with('/users/1')
+
+        # Failed requests leave the table, so that they can be retried.
+        self._client.get.side_effect = ValueError
+        future = self._wrapper.get_user(user_id='2')
+        self.assertIsInstance(future.exception(5), ValueError)
+        self._dispatcher.dispatch()
+        self.assertIsNot(self._wrapper.get_user(user_id='2'), future)
+        self.assertEqual(self._wrapper.dedupe_hit_count, 2)
+
+    def test_queued_background_request_promoted(self):
+        background_executor = unittest.mock.NonCallableMock()
+        background_executor.submit.return_value = concurrent.futures.Future()
+        self._client.get.return_value = 'tracks'
+        wrapper = models.SoundcloudWrapper(
+            self._client_factory, self._executor, self._dispatcher,
+            background_executor=background_executor)
+        future = wrapper.get_user_subresource('1', 'tracks', background=True)
+        self.assertIs(wrapper.get_user_subresource('1', 'tracks'), future)
+        self.assertTrue(background_executor.submit.return_value.cancelled())
+        self.assertEqual(future.result(5), 'tracks')
+
+    def test_invalid_pool_size(self):
+        with self.assertRaises(ValueError):
+            models.SoundcloudWrapper(
+                self._client_factory, self._executor, self._dispatcher,
+                pool_maxsize=0)
+
+
+class ConnectionWarmUpTestCase(unittest.TestCase):
+    def setUp(self):
+        self._server = StubHttpsServer()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._wrapper = models.SoundcloudWrapper(
+            self._create_client,
+            self._executor,
+            events.CompletionDispatcher(lambda: None))
+
+    def tearDown(self):
+        self._executor.shutdown()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _create_client(self, http_session):
+        http_session.trust_env = False
+        http_session.verify = CERT_PATH
+        return clients.create_soundcloud_client(
+            'https://127.0.0.1:{}'.format(self._server.server_port),
+            http_session)
+
+    def test_resolve_reuses_warm_connection(self):
+        self._wrapper.warm_up_connection().result()
+        self.assertEqual(self._server.connection_count, 1)
+        user = self._wrapper.get_user(username='someone').result()
+        self.assertEqual(user.username, 'someone')
+        self.assertEqual(self._server.connection_count, 1)
+
+    def test_resolve_waits_for_warm_up(self):
+        lane_executor = executors.LaneExecutor([2, 2])
+        self.addCleanup(lane_executor.shutdown)
+        wrapper = models.SoundcloudWrapper(
+            self._create_client,
+            lane_executor,
+            events.CompletionDispatcher(lambda: None),
+            background_executor=lane_executor.lane(
+                lane_executor.LANE_BACKGROUND))
+        wrapper.start()
+        warm_up_future = wrapper.warm_up_connection()
+        user = wrapper.get_user(username='someone').result()
+        self.assertTrue(warm_up_future.done())
+        self.assertEqual(user.username, 'someone')
+        self.assertEqual(self._server.connection_count, 1)
+
+    def test_requests_share_connection(self):
+        for user_id in ('1', '2', '3'):
+            self._wrapper.get_user_subresource(user_id, 'tracks').result()
+        self.assertEqual(self._server.connection_count, 1)
+
+    def test_connections_limited_to_pool_size(self):
+        self._server.latency = 0.1
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=6)
+        self.addCleanup(executor.shutdown)
+        wrapper = models.SoundcloudWrapper(
+            self._create_client,
+            executor,
+            events.CompletionDispatcher(lambda: None),
+            pool_maxsize=2)
+        wrapper.start().result()
+        futures = [
+            wrapper.get_user_subresource(str(user_id), 'tracks')
+            for user_id in range(6)]
+        for future in futures:
+            future.result(5)
+        self.assertEqual(self._server.connection_count, 2)
+
+    def test_http_error(self):
+        future = self._wrapper.get_user(username='missing')
+        with self.assertRaises(self._wrapper.HTTP_ERROR):
+            future.result()
+
+    def test_library_not_patched(self):
+        self._wrapper.start().result()
+        self.assertIs(soundcloud.request.requests, requests)
+
+    def test_warm_up_errors_ignored(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._wrapper.warm_up_connection().result()
+
+
+class SessionClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self._server = StubHttpsServer()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self._http_session = requests.Session()
+        self._http_session.trust_env = False
+        self._http_session.verify = CERT_PATH
+        self._client = clients.create_soundcloud_client(
+            'https://127.0.0.1:{}'.format(self._server.server_port),
+            self._http_session)
+
+    def tearDown(self):
+        self._http_session.close()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def test_request_through_session(self):
+        user = self._client.get('/resolve', url='someone')
+        self.assertEqual(user.username, 'someone')
+        self.assertEqual(self._server.connection_count, 1)
+
+    def test_http_error(self):
+        with self.assertRaises(clients.HTTP_ERROR):
+            self._client.get('/users/missing')
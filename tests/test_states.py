@@ -0,0 +1,69 @@
+"""
+A module in which tests for the state classes are defined.
+
+"""
+
+import concurrent.futures
+import unittest
+import unittest.mock
+
+import signalslot
+
+from soundcurses import config, events, states
+from soundcurses.curses import headless, regions, screen, windows
+
+class TracksLoadedStateTestCase(unittest.TestCase):
+    def setUp(self):
+        self._curses = headless.HeadlessCurses(lines=30, cols=60)
+        self.addCleanup(self._curses.close)
+        curses_screen = screen.CursesScreen(
+            self._curses, screen.RenderQueue(), signalslot.Signal())
+        window_factory = windows.CursesWindowFactory(
+            self._curses, curses_screen, signalslot)
+        window = window_factory.create_window(
+            24, 60, 6, 0, render_layer=curses_screen.RENDER_LAYER_REGIONS)
+        curses_screen.add_window(window)
+        self._content_region = regions.ContentRegion(
+            window, self._curses, windows.CursesStringFactory(self._curses))
+
+        self._input_mapper = config.UserInputMapper()
+        self._view = unittest.mock.NonCallableMock()
+        self._view.content_line_go_to.side_effect = \
+            self._content_region.line_go_to
+        self._state = states.TracksLoadedState(
+            self._input_mapper,
+            unittest.mock.NonCallableMock(),
+            unittest.mock.NonCallableMock(),
+            self._view,
+            unittest.mock.NonCallableMock(),
+            events.TimerScheduler())
+
+    def _load_tracks(self, track_count):
+        """
+        Complete a tracks request and display the formatted listing.
+
+        """
+        tracks = [
+            unittest.mock.NonCallableMock(
+                title='track ' + str(i), duration=180000)
+            for i in range(track_count)]
+        future = concurrent.futures.Future()
+        future.set_result(tracks)
+        self._state._tracks_future = future
+        self._state._process_tracks_future_results(future)
+        self._content_region.content_lines = self._view.content_lines
+
+    def _selected_line(self):
+        return self._content_region.content_lines[
+            self._content_region.current_line_number]
+
+    def test_go_to_typed_line_number(self):
+        self._load_tracks(1000)
+        for keys, label in (
+            (['3', '0', '0', 'G'], '300.'),
+            (['0', 'G'], '000.'),
+            (['9', '9', '9', 'G'], '999.')):
+            for action, count in \
+                self._input_mapper.resolve_input_sequence(keys):
+                self._state.handle_action(action, count)
+            self.assertTrue(self._selected_line().startswith(label))
@@ -0,0 +1,84 @@
+"""
+A module in which tests for the TimerScheduler are defined.
+
+"""
+
+import unittest
+import unittest.mock
+
+from soundcurses import events
+
+class TimerSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._now = 0.0
+        self._scheduler = events.TimerScheduler(clock=lambda: self._now)
+
+    def test_empty(self):
+        self.assertIsNone(self._scheduler.time_until_next())
+        self._scheduler.run_due()
+
+    def test_call_later(self):
+        callback = unittest.mock.Mock()
+        self._scheduler.call_later(1.0, callback)
+        self.assertEqual(self._scheduler.time_until_next(), 1.0)
+        self._now = 0.5
+        self._scheduler.run_due()
+        callback.assert_not_called()
+        self._now = 1.0
+        self._scheduler.run_due()
+        callback.assert_called_once_with()
+        self._now = 2.0
+        self._scheduler.run_due()
+        callback.assert_called_once_with()
+        self.assertEqual(len(self._scheduler), 0)
+
+    def test_order(self):
+        calls = []
+        self._scheduler.call_later(2.0, lambda: calls.append('c'))
+        self._scheduler.call_later(1.0, lambda: calls.append('a'))
+        self._scheduler.call_later(1.0, lambda: calls.append('b'))
+        self._now = 2.0
+        self._scheduler.run_due()
+        self.assertEqual(calls, ['a', 'b', 'c'])
+
+    def test_cancel(self):
+        callback = unittest.mock.Mock()
+        timer = self._scheduler.call_later(1.0, callback)
+        self._scheduler.call_later(3.0, unittest.mock.Mock())
+        timer.cancel()
+        self.assertEqual(len(self._scheduler), 1)
+        self.assertEqual(self._scheduler.time_until_next(), 3.0)
+        self._now = 1.0
+        self._scheduler.run_due()
+        callback.assert_not_called()
+
+    def test_repeating(self):
+        callback = unittest.mock.Mock()
+        timer = self._scheduler.call_repeating(0.1, callback)
+        for i in range(1, 4):
+            self._now = i * 0.1
+            self._scheduler.run_due()
+        self.assertEqual(callback.call_count, 3)
+
+        # A late main loop skips missed calls rather than bursting.
+        self._now = 1.0
+        self._scheduler.run_due()
+        self.assertEqual(callback.call_count, 4)
+        self.assertAlmostEqual(self._scheduler.time_until_next(), 0.1)
+
+        timer.cancel()
+        self.assertIsNone(self._scheduler.time_until_next())
+
+    def test_repeating_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            self._scheduler.call_repeating(0, unittest.mock.Mock())
+
+    def test_scheduled_during_run(self):
+        callback = unittest.mock.Mock()
+        self._scheduler.call_later(
+            1.0, lambda: self._scheduler.call_later(0, callback))
+        self._now = 1.0
+        self._scheduler.run_due()
+        callback.assert_not_called()
+        self._scheduler.run_due()
+        callback.assert_called_once_with()
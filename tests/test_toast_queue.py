@@ -0,0 +1,56 @@
+"""
+A module in which tests for the ToastQueue are defined.
+
+"""
+
+import unittest
+import unittest.mock
+
+from soundcurses import events
+from soundcurses.curses import (regions, views)
+
+class ToastQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self._now = 0.0
+        self._modal_factory = unittest.mock.NonCallableMock(
+            spec=regions.ModalRegionFactory)
+        self._modal_factory.create_message.side_effect = \
+            lambda message: unittest.mock.NonCallableMock(
+                spec=regions.ModalRegionMessage)
+        self._scheduler = events.TimerScheduler(clock=lambda: self._now)
+        self._toast_queue = views.ToastQueue(
+            self._modal_factory, self._scheduler)
+
+    def test_expiry(self):
+        self._toast_queue.push('message', duration=2.0)
+        modal = self._toast_queue._current_modal
+        self.assertEqual(self._scheduler.time_until_next(), 2.0)
+        self._now = 1.5
+        self._scheduler.run_due()
+        modal.destroy.assert_not_called()
+        self.assertEqual(self._scheduler.time_until_next(), 0.5)
+        self._now = 2.0
+        self._scheduler.run_due()
+        modal.destroy.assert_called_once_with()
+        self.assertEqual(len(self._toast_queue), 0)
+        self.assertIsNone(self._scheduler.time_until_next())
+
+    def test_queued(self):
+        self._toast_queue.push('first', duration=1.0)
+        self._toast_queue.push('second', duration=1.0)
+        self.assertEqual(len(self._toast_queue), 2)
+        self._modal_factory.create_message.assert_called_once_with('first')
+        self._now = 1.0
+        self._scheduler.run_due()
+        self._modal_factory.create_message.assert_called_with('second')
+        self.assertEqual(len(self._toast_queue), 1)
+        self.assertEqual(self._scheduler.time_until_next(), 1.0)
+
+    def test_clear(self):
+        self._toast_queue.push('first')
+        self._toast_queue.push('second')
+        modal = self._toast_queue._current_modal
+        self._toast_queue.clear()
+        modal.destroy.assert_called_once_with()
+        self.assertEqual(len(self._toast_queue), 0)
+        self.assertEqual(len(self._scheduler), 0)
@@ -0,0 +1,51 @@
+"""
+A module in which tests for the UserInputMapper are defined.
+
+"""
+
+import unittest
+
+from soundcurses import config
+
+class UserInputMapperTestCase(unittest.TestCase):
+    def setUp(self):
+        self._input_mapper = config.UserInputMapper()
+
+    def test_empty_sequence(self):
+        self.assertListEqual(self._input_mapper.resolve_input_sequence([]), [])
+
+    def test_fold_repeatable(self):
+        actions = self._input_mapper.resolve_input_sequence(
+            ['KEY_DOWN'] * 37 + ['KEY_UP'] * 2 + ['KEY_DOWN'])
+        self.assertListEqual(
+            actions,
+            [(self._input_mapper.ACTION_CONTENT_LINE_NEXT, 37),
+                (self._input_mapper.ACTION_CONTENT_LINE_PREV, 2),
+                (self._input_mapper.ACTION_CONTENT_LINE_NEXT, 1)])
+
+    def test_no_fold_non_repeatable(self):
+        actions = self._input_mapper.resolve_input_sequence(['\t', '\t', 'q'])
+        self.assertListEqual(
+            actions,
+            [(self._input_mapper.ACTION_CYCLE_NAV, 1),
+                (self._input_mapper.ACTION_CYCLE_NAV, 1),
+                (self._input_mapper.ACTION_QUIT, 1)])
+
+    def test_count_prefix(self):
+        actions = self._input_mapper.resolve_input_sequence(
+            ['1', '2', '0', 'G', 'G', '5', '0', '%', '%', '3', 'KEY_DOWN',
+                'KEY_DOWN', '7', '\t'])
+        self.assertListEqual(
+            actions,
+            [(self._input_mapper.ACTION_CONTENT_LINE_GO_TO, 120),
+                (self._input_mapper.ACTION_CONTENT_LINE_LAST, 1),
+                (self._input_mapper.ACTION_CONTENT_LINE_PERCENT, 50),
+                (self._input_mapper.ACTION_CONTENT_LINE_NEXT, 4),
+                (self._input_mapper.ACTION_CYCLE_NAV, 1)])
+
+    def test_count_prefix_across_sequences(self):
+        self.assertListEqual(
+            self._input_mapper.resolve_input_sequence(['4']), [])
+        self.assertListEqual(
+            self._input_mapper.resolve_input_sequence(['2', 'G']),
+            [(self._input_mapper.ACTION_CONTENT_LINE_GO_TO, 42)])